@@ -1,22 +1,60 @@
-from flask import Flask, render_template, request
+from flask import Flask, render_template, request, jsonify, g, Response
 import os 
+import time
 import numpy as np
 import pandas as pd
 from Red_Wine_Prediction.pipeline.prediction import PredictionPipeline
+from Red_Wine_Prediction.pipeline.model_registry import get_model_registry
+from Red_Wine_Prediction.pipeline.micro_batcher import get_micro_batcher
+from Red_Wine_Prediction.pipeline.drift_monitor import get_drift_monitor
+from Red_Wine_Prediction.pipeline.training_jobs import get_training_job_runner, TrainingJobConflict
+from Red_Wine_Prediction.pipeline.request_parsing import parse_records, parse_payload
+from Red_Wine_Prediction.pipeline.serving_metrics import get_serving_metrics, phase_timer
 
 app = Flask(__name__) # initializing a flask app
 
 
+
+@app.before_request  # start the request latency timer
+def start_request_timer():
+    g.request_start = time.perf_counter()
+
+
+
+@app.after_request  # per-endpoint request count and latency (params.yaml -> metrics)
+def record_request_metrics(response):
+    metrics = get_serving_metrics()
+    if metrics is not None and 'request_start' in g:
+        endpoint = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        metrics.requests.labels(endpoint=endpoint, method=request.method, status=response.status_code).inc()
+        metrics.request_latency.labels(endpoint=endpoint).observe(time.perf_counter() - g.request_start)
+    return response
+
+
 @app.route('/',methods=['GET'])  # route to display the home page
 def homePage():
     return render_template("index.html")
 
 
 
-@app.route('/train',methods=['GET'])  # route to train the pipeline
+@app.route('/train',methods=['GET','POST'])  # route to start training in the background
 def training():
-    os.system("python main.py")
-    return "Training Successful!" 
+    try:
+        force = request.args.get('force', '').lower() in ('1', 'true', 'yes')
+        job_id = get_training_job_runner().submit(force=force)
+    except TrainingJobConflict as e:
+        return jsonify({"error": str(e)}), 409
+
+    return jsonify({"job_id": job_id, "status_url": f"/train/status/{job_id}"}), 202
+
+
+
+@app.route('/train/status/<job_id>',methods=['GET'])  # per-stage progress and timings of a training job
+def training_status(job_id):
+    job = get_training_job_runner().status(job_id)
+    if job is None:
+        return jsonify({"error": f"Unknown training job {job_id}"}), 404
+    return jsonify(job)
 
 
 
@@ -25,26 +63,28 @@ def index():
     if request.method == 'POST':
         try:
             #  reading the inputs given by the user
-            fixed_acidity =float(request.form['fixed_acidity'])
-            volatile_acidity =float(request.form['volatile_acidity'])
-            citric_acid =float(request.form['citric_acid'])
-            residual_sugar =float(request.form['residual_sugar'])
-            chlorides =float(request.form['chlorides'])
-            free_sulfur_dioxide =float(request.form['free_sulfur_dioxide'])
-            total_sulfur_dioxide =float(request.form['total_sulfur_dioxide'])
-            density =float(request.form['density'])
-            pH =float(request.form['pH'])
-            sulphates =float(request.form['sulphates'])
-            alcohol =float(request.form['alcohol'])
-       
-         
-            data = [fixed_acidity,volatile_acidity,citric_acid,residual_sugar,chlorides,free_sulfur_dioxide,total_sulfur_dioxide,density,pH,sulphates,alcohol]
-            data = np.array(data).reshape(1, 11)
+            with phase_timer('parse'):
+                fixed_acidity =float(request.form['fixed_acidity'])
+                volatile_acidity =float(request.form['volatile_acidity'])
+                citric_acid =float(request.form['citric_acid'])
+                residual_sugar =float(request.form['residual_sugar'])
+                chlorides =float(request.form['chlorides'])
+                free_sulfur_dioxide =float(request.form['free_sulfur_dioxide'])
+                total_sulfur_dioxide =float(request.form['total_sulfur_dioxide'])
+                density =float(request.form['density'])
+                pH =float(request.form['pH'])
+                sulphates =float(request.form['sulphates'])
+                alcohol =float(request.form['alcohol'])
+
+                data = [fixed_acidity,volatile_acidity,citric_acid,residual_sugar,chlorides,free_sulfur_dioxide,total_sulfur_dioxide,density,pH,sulphates,alcohol]
+                data = np.array(data).reshape(1, 11)
             
             obj = PredictionPipeline()
             predict = obj.predict(data)
 
-            return render_template('results.html', prediction = str(predict))
+            with phase_timer('render'):
+                page = render_template('results.html', prediction = str(predict))
+            return page
 
         except Exception as e:
             print('The Exception message is: ',e)
@@ -56,5 +96,76 @@ def index():
 
 
 
+@app.route('/predict/batch',methods=['POST'])  # JSON array of records -> JSON predictions
+def batch_predict():
+    payload = request.get_json(silent=True)
+    if isinstance(payload, dict):
+        payload = payload.get('records')
+
+    try:
+        with phase_timer('parse'):
+            data = parse_records(payload)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    obj = PredictionPipeline()
+    predict = obj.predict(data)
+
+    with phase_timer('render'):
+        response = jsonify({"predictions": predict.tolist()})
+    return response
+
+
+
+
+@app.route('/api/v1/predict',methods=['POST'])  # JSON / columnar JSON / NDJSON -> JSON predictions
+def api_predict():
+    try:
+        with phase_timer('parse'):
+            data = parse_payload(request.get_data(), request.content_type)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    obj = PredictionPipeline()
+    predict = obj.predict(data)
+
+    with phase_timer('render'):
+        response = jsonify({"predictions": predict.tolist()})
+    return response
+
+
+
+
+@app.route('/model/stats',methods=['GET'])  # model registry load time and hit/miss counters
+def model_stats():
+    stats = get_model_registry().stats()
+    batcher = get_micro_batcher()
+    if batcher is not None:
+        stats["micro_batching"] = batcher.stats()
+    return jsonify(stats)
+
+
+
+
+@app.route('/monitoring/drift',methods=['GET'])  # served-input statistics and PSI / KS drift scores
+def drift_scores():
+    monitor = get_drift_monitor()
+    if monitor is None:
+        return jsonify({"error": "Drift monitoring is disabled (params.yaml drift_monitoring.enabled)"}), 404
+    return jsonify(monitor.scores())
+
+
+
+
+@app.route('/metrics',methods=['GET'])  # Prometheus text exposition of serving metrics
+def prometheus_metrics():
+    metrics = get_serving_metrics()
+    if metrics is None:
+        return jsonify({"error": "Metrics are disabled (params.yaml metrics.enabled)"}), 404
+    return Response(metrics.render(), content_type=metrics.registry.CONTENT_TYPE)
+
+
+
+
 if __name__ == "__main__":
 	app.run(host="0.0.0.0", port = 8080, debug=True)
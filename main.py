@@ -1,67 +1,26 @@
-from Red_Wine_Prediction import logger
-
-from Red_Wine_Prediction.pipeline.stage_01_data_ingestion import DataIngestionTrainingPipeline
-from Red_Wine_Prediction.pipeline.stage_02_data_validation import DataValidationTrainingPipeline
-from Red_Wine_Prediction.pipeline.stage_03_data_transformation import DataTransformationTrainingPipeline
-from Red_Wine_Prediction.pipeline.stage_04_model_trainer import ModelTrainingPipeline
-from Red_Wine_Prediction.pipeline.stage_05_model_evaluation import ModelEvaluationPipeline
-
-STAGE_NAME = "Data Ingestion Stage"
-try:
-    logger.info(f">>>>>> Stage {STAGE_NAME} started <<<<<<")
-    data_ingestion = DataIngestionTrainingPipeline()
-    data_ingestion.main()
-    logger.info(f">>>>>> Stage {STAGE_NAME} completed <<<<<<\n\nx")
-except Exception as e:
-    logger.exception(f"Error occurred in stage {STAGE_NAME}.\n{e}")
-    raise e
-
-
-STAGE_NAME = "Data Validation Stage"
-try:
-    logger.info(f">>>>>> Stage {STAGE_NAME} started <<<<<<")
-    data_validation = DataValidationTrainingPipeline()
-    data_validation.main()
-    logger.info(f">>>>>> Stage {STAGE_NAME} completed <<<<<<\n\nx")
-except Exception as e:
-    logger.exception(f"Error occurred in stage {STAGE_NAME}.\n{e}")
-    raise e
-
-
-
-STAGE_NAME = "Data Transformation stage"
-
-
-try:
-    logger.info(f">>>>>> Stage {STAGE_NAME} started <<<<<<")
-    data_transformation= DataTransformationTrainingPipeline()
-    data_transformation.main()
-    logger.info(f">>>>>> Stage {STAGE_NAME} completed <<<<<<\n\nx")
-except Exception as e:
-    logger.exception(f"Error occurred in stage {STAGE_NAME}.\n{e}")
-    raise e
-
-
-
-STAGE_NAME="Model  Trainer stage"
-
-try:
-    logger.info(f">>>>>> Stage {STAGE_NAME} started <<<<<<")
-    model_training = ModelTrainingPipeline()
-    model_training.main()
-    logger.info(f">>>>>> Stage {STAGE_NAME} completed <<<<<<\n\nx")
-except Exception as e:
-    logger.exception(f"Error occurred in stage {STAGE_NAME}.\n{e}")
-    raise e
-
-
-STAGE_NAME="Model  Evaluation stage"
-
-try:
-    logger.info(f">>>>>> Stage {STAGE_NAME} started <<<<<<")
-    model_evaluation = ModelEvaluationPipeline()
-    model_evaluation.main()
-    logger.info(f">>>>>> Stage {STAGE_NAME} completed <<<<<<\n\nx")
-except Exception as e:
-    logger.exception(f"Error occurred in stage {STAGE_NAME}.\n{e}")
-    raise e
\ No newline at end of file
+import argparse
+
+from Red_Wine_Prediction.pipeline.training_pipeline import run_training_pipeline
+from Red_Wine_Prediction.pipeline.stage_08_incremental_training import IncrementalTrainingPipeline
+from Red_Wine_Prediction.utils.common import FileLockHeld
+
+
+# Stage list and per-stage logging live in pipeline/training_pipeline.py so
+# the Flask app can run the exact same pipeline in-process.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the training pipeline")
+    parser.add_argument("--force", action="store_true",
+                        help="Run every stage even if its inputs are unchanged")
+    parser.add_argument("--from-stage", default=None,
+                        help="Run this stage (key or 1-based number) and every stage depending on it even if unchanged")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Update the online model from rows appended to the ingested CSV since the last run")
+    args = parser.parse_args()
+
+    try:
+        if args.incremental:
+            IncrementalTrainingPipeline().main()
+        else:
+            run_training_pipeline(force=args.force, from_stage=args.from_stage)
+    except FileLockHeld as e:
+        parser.exit(1, f"Another training run is in progress ({e})\n")
@@ -0,0 +1,124 @@
+'''CompiledLinearModel folds the fitted StandardScaler into the linear
+model coefficients, so serving is one feature pass plus one dot product:
+
+    ((F - mean) / scale) @ coef + intercept  ==  F @ weights + bias
+
+with weights = coef / scale and bias = intercept - sum(coef * mean / scale),
+where F is the engineered (N, R + E) feature matrix.
+
+The compiled model is stored as a plain weights array (.npy) and a JSON
+sidecar (bias, columns, clip range, the feature spec it was trained with,
+and the weights again for non-NumPy consumers). Loading it needs only
+NumPy and json: no sklearn import and no unpickling.'''
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from Red_Wine_Prediction.components.feature_engineering import DEFAULT_FEATURE_SPEC, as_feature_spec
+
+
+class CompiledLinearModel:
+    """
+    Linear scorer over the engineered features with scaling folded in.
+    """
+
+    def __init__(self, weights, bias, clip_range=(3, 8), feature_spec=None):
+        self.feature_spec = as_feature_spec(feature_spec)
+        self.weights = np.ascontiguousarray(weights, dtype=np.float64)
+        self.bias = float(bias)
+        self.clip_range = tuple(clip_range) if clip_range is not None else None
+        self.raw_columns = list(self.feature_spec.raw_columns)
+        self.feature_columns = list(self.feature_spec.feature_columns)
+
+        if self.weights.shape != (len(self.feature_columns),):
+            raise ValueError(
+                f"Expected {len(self.feature_columns)} weights, got shape {self.weights.shape}"
+            )
+
+    @classmethod
+    def from_inference_pipeline(cls, pipeline) -> "CompiledLinearModel":
+        """
+        Folds an InferencePipeline's scaler statistics into its coefficients.
+        """
+        weights = pipeline.coef / pipeline.scale
+        bias = pipeline.intercept - float(np.dot(weights, pipeline.mean))
+        return cls(
+            weights=weights,
+            bias=bias,
+            clip_range=pipeline.clip_range,
+            feature_spec=pipeline.feature_spec,
+        )
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """Raw (N, R) -> engineered (N, R + E); scaling is folded into weights."""
+        return self.feature_spec.transform(X)
+
+    def score(self, features: np.ndarray) -> np.ndarray:
+        """Engineered (N, R + E) -> clipped quality predictions (N,)."""
+        prediction = features @ self.weights
+        prediction += self.bias
+        if self.clip_range is not None:
+            np.clip(prediction, *self.clip_range, out=prediction)
+        return prediction
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Raw (N, R) -> clipped quality predictions (N,)."""
+        return self.score(self.transform(X))
+
+    # -----------------------------
+    # Persistence (.npy + JSON sidecar)
+    # -----------------------------
+    @staticmethod
+    def sidecar_paths(path: Path):
+        """linear_model.json -> (linear_model.json, linear_model.npy)"""
+        path = Path(path)
+        return path.with_suffix(".json"), path.with_suffix(".npy")
+
+    def save(self, path: Path) -> None:
+        json_path, npy_path = self.sidecar_paths(path)
+        os.makedirs(json_path.parent, exist_ok=True)
+
+        np.save(npy_path, self.weights)
+        with open(json_path, "w") as f:
+            json.dump(
+                {
+                    "bias": self.bias,
+                    "weights": self.weights.tolist(),
+                    "feature_columns": self.feature_columns,
+                    "raw_columns": self.raw_columns,
+                    "feature_spec": self.feature_spec.to_list(),
+                    "clip_range": list(self.clip_range) if self.clip_range else None,
+                    "weights_file": npy_path.name,
+                },
+                f,
+                indent=4,
+            )
+
+    @classmethod
+    def load(cls, path: Path) -> "CompiledLinearModel":
+        json_path, npy_path = cls.sidecar_paths(path)
+        with open(json_path) as f:
+            meta = json.load(f)
+
+        # Models compiled before the feature spec was recorded used the defaults
+        feature_spec = as_feature_spec(meta.get("feature_spec", DEFAULT_FEATURE_SPEC))
+        if meta["feature_columns"] != feature_spec.feature_columns:
+            raise ValueError(
+                f"{json_path} feature columns {meta['feature_columns']} do not match "
+                f"its feature spec {feature_spec.feature_columns}"
+            )
+
+        if os.path.exists(npy_path):
+            weights = np.load(npy_path)
+        else:
+            weights = np.asarray(meta["weights"], dtype=np.float64)
+
+        return cls(
+            weights=weights,
+            bias=meta["bias"],
+            clip_range=meta["clip_range"],
+            feature_spec=feature_spec,
+        )
@@ -0,0 +1,204 @@
+'''Repeated k-fold cross-validation and bootstrap confidence intervals for
+the evaluation stage.
+
+Cross-validation runs over every row of the train and test splits. Fold
+jobs run on a process pool; each worker opens both splits once (the npy
+feature store is memory-mapped, so all workers share one copy in the page
+cache) and gathers its fold rows by index. The estimator is an unfitted
+clone of the trained model, so tuned or zoo params carry over.
+
+The stored splits are standardized with the scaler fitted on the whole
+train split, so each fold refits a StandardScaler on its own training
+rows in front of the estimator: validation rows never inform the
+preprocessing. Standardization is affine, so refitting on the stored
+(already scaled) rows equals fitting on the raw rows; the feature
+engineering before it is row-wise and cannot leak.
+
+Repeated k-fold scores are correlated (folds share training rows within
+and across repeats), so treating them as independent understates the
+variance of their mean. Intervals of the mean CV score use the
+Nadeau-Bengio corrected resampled t-test variance instead.
+
+Holdout bootstrap intervals are computed with vectorized resampling: a
+(resamples, n) index matrix drawn in one call and reduced along axis 1,
+in chunks so memory stays bounded on large inputs.'''
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy import stats
+from sklearn.model_selection import RepeatedKFold
+
+from Red_Wine_Prediction.utils.artifact_io import open_matrix_source
+from Red_Wine_Prediction.utils.common import process_pool_context
+
+
+# Largest resamples x rows index block materialized at once
+_BOOTSTRAP_BLOCK = 4_000_000
+
+
+# -----------------------------
+# Metrics
+# -----------------------------
+def regression_metrics(actual: np.ndarray, predicted: np.ndarray) -> dict:
+    """RMSE / MAE / R² along the last axis (works on (n,) and (B, n))."""
+    residuals = predicted - actual
+    ss_res = np.sum(residuals * residuals, axis=-1)
+    centered = actual - actual.mean(axis=-1, keepdims=True)
+    ss_tot = np.sum(centered * centered, axis=-1)
+    n = actual.shape[-1]
+    return {
+        "rmse": np.sqrt(ss_res / n),
+        "mae": np.mean(np.abs(residuals), axis=-1),
+        "r2": 1.0 - ss_res / ss_tot,
+    }
+
+
+def _interval(samples: np.ndarray, confidence: float) -> tuple:
+    tail = (1.0 - confidence) / 2.0 * 100.0
+    low, high = np.percentile(samples, [tail, 100.0 - tail])
+    return float(low), float(high)
+
+
+def bootstrap_metrics(
+    actual: np.ndarray,
+    predicted: np.ndarray,
+    n_resamples: int = 1000,
+    confidence: float = 0.95,
+    random_state: int = 42,
+) -> dict:
+    """
+    Percentile bootstrap CIs of RMSE / MAE / R² over rows.
+
+    Returns:
+        dict: metric -> {"value", "ci_low", "ci_high"}
+    """
+    actual = np.asarray(actual, dtype=np.float64)
+    predicted = np.asarray(predicted, dtype=np.float64)
+    n = actual.shape[0]
+    rng = np.random.default_rng(random_state)
+
+    samples = {"rmse": [], "mae": [], "r2": []}
+    block = max(1, _BOOTSTRAP_BLOCK // n)
+    for start in range(0, n_resamples, block):
+        idx = rng.integers(0, n, size=(min(block, n_resamples - start), n))
+        for name, values in regression_metrics(actual[idx], predicted[idx]).items():
+            samples[name].append(values)
+
+    point = regression_metrics(actual, predicted)
+    result = {}
+    for name, chunks in samples.items():
+        low, high = _interval(np.concatenate(chunks), confidence)
+        result[name] = {"value": float(point[name]), "ci_low": low, "ci_high": high}
+    return result
+
+
+def corrected_cv_interval(scores: np.ndarray, n_splits: int, confidence: float = 0.95) -> tuple:
+    """
+    t interval of the mean of repeated k-fold scores with the Nadeau-Bengio
+    correction: var = (1 / J + n_val / n_train) * s², J = number of scores,
+    n_val / n_train = 1 / (k - 1).
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    n_scores = scores.shape[0]
+    mean = float(scores.mean())
+    if n_scores < 2:
+        return mean, mean
+    variance = (1.0 / n_scores + 1.0 / (n_splits - 1)) * scores.var(ddof=1)
+    half_width = stats.t.ppf(0.5 + confidence / 2.0, df=n_scores - 1) * np.sqrt(variance)
+    return mean - float(half_width), mean + float(half_width)
+
+
+# -----------------------------
+# Worker side
+# -----------------------------
+# Set once per worker by _init_worker
+_splits = None
+_estimator = None
+
+
+def _init_worker(sources, estimator) -> None:
+    """Opens every split once per worker; sources as from matrix_source."""
+    global _splits, _estimator
+    _splits = [open_matrix_source(source) for source in sources]
+    _estimator = estimator
+
+
+def _gather(idx: np.ndarray):
+    """Rows `idx` of the virtual concatenation of all splits."""
+    X_parts, y_parts = [], []
+    offset = 0
+    for X, y in _splits:
+        n = X.shape[0]
+        local = idx[(idx >= offset) & (idx < offset + n)] - offset
+        X_parts.append(np.asarray(X[local], dtype=np.float64))
+        y_parts.append(np.asarray(y[local], dtype=np.float64))
+        offset += n
+    return np.concatenate(X_parts), np.concatenate(y_parts)
+
+
+def _run_fold(task) -> tuple:
+    from sklearn.base import clone
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    fold, train_idx, val_idx = task
+    X_train, y_train = _gather(train_idx)
+    X_val, y_val = _gather(val_idx)
+
+    # Scaler refitted on the fold's training rows only (see module docstring)
+    model = make_pipeline(StandardScaler(), clone(_estimator))
+    model.fit(X_train, y_train)
+    metrics = regression_metrics(y_val, np.asarray(model.predict(X_val), dtype=np.float64))
+    return fold, {name: float(value) for name, value in metrics.items()}
+
+
+# -----------------------------
+# Driver
+# -----------------------------
+def repeated_kfold(
+    estimator,
+    sources: list,
+    n_rows: int,
+    n_splits: int = 5,
+    n_repeats: int = 3,
+    n_jobs: int = 0,
+    random_state: int = 42,
+) -> dict:
+    """
+    Scores `estimator` with repeated k-fold CV over the rows of `sources`.
+
+    Args:
+        estimator: Unfitted (or fitted; it is cloned) sklearn estimator
+        sources: matrix_source() tuples of the splits to concatenate
+        n_rows: Total rows over all sources
+        n_jobs: Worker processes; 0 = one per core, 1 = in-process
+
+    Returns:
+        dict: metric -> (n_splits * n_repeats,) array of fold scores
+    """
+    splitter = RepeatedKFold(n_splits=n_splits, n_repeats=n_repeats, random_state=random_state)
+    tasks = [
+        (fold, train_idx, val_idx)
+        for fold, (train_idx, val_idx) in enumerate(splitter.split(np.arange(n_rows)))
+    ]
+
+    n_workers = min(n_jobs or os.cpu_count() or 1, len(tasks))
+    if n_workers <= 1:
+        _init_worker(sources, estimator)
+        results = [_run_fold(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=process_pool_context(),
+            initializer=_init_worker,
+            initargs=(sources, estimator),
+        ) as pool:
+            results = list(pool.map(_run_fold, tasks))
+
+    results.sort(key=lambda item: item[0])
+    return {
+        name: np.array([metrics[name] for _, metrics in results])
+        for name in ("rmse", "mae", "r2")
+    }
@@ -1,9 +1,6 @@
-import sys 
-import urllib.request as request
-import zipfile  
 from Red_Wine_Prediction import logger
 from Red_Wine_Prediction.entity.config_entity import DataIngestionConfig
-from Red_Wine_Prediction.utils.common import get_size
+from Red_Wine_Prediction.components.ingestion_engine import extract_members, fetch
 
 from pathlib import Path
 import os
@@ -14,27 +11,46 @@ class DataIngestion:
         self.config = config
         
         
-    def download_file(self) -> str:
-        if not os.path.exists(self.config.local_data_file):
-            filename, headers = request.urlretrieve(
-                url=self.config.source_URL,
-                filename=self.config.local_data_file
-            )
-            
-            logger.info(f"{filename} downloaded! with following info: \n{headers}")
-        else:
-            logger.info(f"File already exists of size: {get_size(Path(self.config.local_data_file))}")
+    def download_file(self) -> dict:
+        """
+        Streams source_URL (or its offline mirror) to local_data_file with
+        resume, timeout and SHA-256 verification; see
+        components/ingestion_engine.py.
+
+        Returns:
+            dict: Fetch record (bytes, seconds, throughput, ...)
+        """
+        return fetch(
+            source=self.config.source_URL,
+            destination=self.config.local_data_file,
+            sha256=self.config.source_sha256,
+            mirror_dir=self.config.mirror_dir,
+            timeout=self.config.download_timeout,
+            chunk_size=self.config.download_chunk_size,
+            retries=self.config.download_retries,
+        )
             
             
             
-    def extract_zip_file(self) -> None:
+    def extract_zip_file(self) -> dict:
         
-        """zip_file_path: str 
-        Extracts the zip file into the data directory 
-        Function returns None
         """
-        unzip_path = self.config.unzip_dir
-        os.makedirs(unzip_path, exist_ok=True)
-        with zipfile.ZipFile(self.config.local_data_file, 'r') as zip_ref:
-            zip_ref.extractall(unzip_path)
-        logger.info(f"File extracted to {unzip_path}")
\ No newline at end of file
+        Extracts the configured members of the zip file into the data
+        directory, skipping members already on disk with the same size
+        and CRC-32. Does nothing when extraction is disabled (the readers
+        stream the member out of the archive).
+
+        Returns:
+            dict: {"extracted": [...], "unchanged": [...]} member names
+        """
+        if not self.config.extract:
+            logger.info(f"Extraction disabled; data is read from inside {self.config.local_data_file}")
+            return {"extracted": [], "unchanged": []}
+
+        return extract_members(
+            self.config.local_data_file,
+            self.config.unzip_dir,
+            members=self.config.extract_members,
+            manifest_path=Path(self.config.root_dir) / "extracted_members.json",
+            chunk_size=self.config.download_chunk_size,
+        )
@@ -0,0 +1,81 @@
+'''Deterministic, hash-based train/test assignment.
+
+Each row goes to the test split when a 64-bit hash of its row key, mapped
+to [0, 1), falls below test_size. The decision depends only on the key and
+the seed, never on the other rows, so it can be made chunk by chunk while
+streaming and does not change when rows are appended.
+
+The row key is the row number, the row content or a set of key columns.
+Content keys also survive reordering and deduplication, and keep exact
+duplicate rows on the same side of the split.
+
+Row keys come from pandas' vectorized hash_pandas_object, then SplitMix64
+(NumPy uint64 arithmetic) mixes in the seed: no per-row Python calls.'''
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+
+
+def splitmix64(x: np.ndarray) -> np.ndarray:
+    """SplitMix64 finalizer over a uint64 array (wrapping arithmetic)."""
+    with np.errstate(over="ignore"):
+        z = np.asarray(x, dtype=np.uint64) + _GOLDEN
+        z = (z ^ (z >> np.uint64(30))) * _MIX_1
+        z = (z ^ (z >> np.uint64(27))) * _MIX_2
+        return z ^ (z >> np.uint64(31))
+
+
+def hash_unit_interval(keys: np.ndarray, seed: int = 0) -> np.ndarray:
+    """Maps uint64 keys to reproducible floats in [0, 1)."""
+    mixed = splitmix64(np.asarray(keys, dtype=np.uint64) ^ splitmix64(np.uint64(seed)))
+    return (mixed >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def row_keys(frame: pd.DataFrame, key="content", start: int = 0) -> np.ndarray:
+    """
+    64-bit keys identifying the rows of `frame`.
+
+    Args:
+        frame (pd.DataFrame): Rows to key (one chunk of the dataset)
+        key: "row_number" (position in the file, `start` being the first
+            row of the chunk), "content" (every column of `frame`) or a
+            list of key columns
+        start (int): Row number of the first row of `frame`
+
+    Returns:
+        np.ndarray: (len(frame),) uint64 keys
+    """
+    if isinstance(key, str) and key == "row_number":
+        return np.arange(start, start + len(frame), dtype=np.uint64)
+    if isinstance(key, str) and key != "content":
+        raise ValueError(f"Unknown split key {key!r}; expected row_number, content or a list of columns")
+
+    columns = frame if key == "content" else frame[list(key)]
+    # Numbers are hashed as float64 so a value hashes the same whether a
+    # chunk parsed its column as int or float ("+ 0.0" folds -0.0 into 0.0)
+    normalized = pd.DataFrame({
+        name: (column.astype(np.float64) + 0.0) if is_numeric_dtype(column) else column.astype(str)
+        for name, column in columns.items()
+    })
+    return pd.util.hash_pandas_object(normalized, index=False).to_numpy(dtype=np.uint64)
+
+
+def hash_test_mask(keys: np.ndarray, test_size: float, seed: int = 0) -> np.ndarray:
+    """
+    Test-split membership of rows from their row_keys().
+
+    Args:
+        keys (np.ndarray): uint64 row keys
+        test_size (float): Expected fraction of rows in the test split
+        seed (int): Changes the assignment as a whole
+
+    Returns:
+        np.ndarray: Boolean mask, True for test rows
+    """
+    return hash_unit_interval(keys, seed) < test_size
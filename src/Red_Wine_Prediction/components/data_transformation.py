@@ -1,23 +1,23 @@
 # components/data_transformation.py
 
-import os
-import pandas as pd
-from sklearn.model_selection import train_test_split
-
-from Red_Wine_Prediction import logger
-from Red_Wine_Prediction.entity.config_entity import DataTransformationConfig
-
-# component
-
 import os
 import numpy as np
 import pandas as pd
 import joblib
-
-from Red_Wine_Prediction import logger
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.entity.config_entity import DataTransformationConfig
+from Red_Wine_Prediction.utils.artifact_io import save_xy
+from Red_Wine_Prediction.components.feature_store import FeatureStore, scaler_fingerprint
+from Red_Wine_Prediction.components.data_split import hash_test_mask, row_keys
+from Red_Wine_Prediction.components.out_of_core import chunk_slices
+from Red_Wine_Prediction.components.ingestion_engine import open_dataset
+from Red_Wine_Prediction.components.drift import ReferenceStatsBuilder
+from Red_Wine_Prediction.components.feature_engineering import FeatureSpec
+from Red_Wine_Prediction.utils.stage_metrics import add_rows
+
 
 class DataTransformation:
     """
@@ -31,41 +31,53 @@ class DataTransformation:
     def __init__(self, config: DataTransformationConfig):
         self.config = config
         self.scaler = StandardScaler()
+        self.feature_spec = FeatureSpec(config.feature_spec)
 
     def train_test_splitting(self) -> None:
+        if self.config.mode == "out_of_core":
+            return self.out_of_core_splitting()
+        if self.config.mode != "in_memory":
+            raise ValueError(f"Unknown data transformation mode {self.config.mode!r}")
+        if self.config.split_strategy not in ("random", "hash"):
+            raise ValueError(f"Unknown split strategy {self.config.split_strategy!r}")
+
         # -----------------------------
         # Load data
         # -----------------------------
-        data = pd.read_csv(self.config.data_path)
+        with open_dataset(self.config.data_path) as f:
+            data = pd.read_csv(f)
         logger.info("Data loaded successfully")
 
         # -----------------------------
         # 🔧 FEATURE ENGINEERING
         # -----------------------------
-        data["log_residual_sugar"] = np.log1p(data["residual sugar"])
-        data["log_chlorides"] = np.log1p(data["chlorides"])
-        data["log_free_sulfur_dioxide"] = np.log1p(data["free sulfur dioxide"])
-        data["log_total_sulfur_dioxide"] = np.log1p(data["total sulfur dioxide"])
-        data["log_sulphates"] = np.log1p(data["sulphates"])
-        data["alcohol_density_ratio"] = data["alcohol"] / (data["density"] + 1e-6)
+        # Declarative spec from params.yaml compiled into one NumPy kernel;
+        # the trained model carries the same spec to serving
+        features = self.feature_spec.transform(
+            data[self.feature_spec.raw_columns].to_numpy(dtype=np.float64)
+        )
 
         logger.info("Feature engineering completed")
 
         # -----------------------------
         # Separate features & target
         # -----------------------------
-        X = data.drop(columns=["quality"])
+        X = pd.DataFrame(features, columns=self.feature_spec.feature_columns)
         y = data["quality"]
 
         # -----------------------------
         # Train-Test Split (75/25)
         # -----------------------------
-        X_train, X_test, y_train, y_test = train_test_split(
-            X,
-            y,
-            test_size=0.25,
-            random_state=42
-        )
+        if self.config.split_strategy == "hash":
+            test = self._test_mask(data, start=0)
+            X_train, X_test, y_train, y_test = X[~test], X[test], y[~test], y[test]
+        else:
+            X_train, X_test, y_train, y_test = train_test_split(
+                X,
+                y,
+                test_size=self.config.test_size,
+                random_state=self.config.split_seed
+            )
 
         # -----------------------------
         # 🔥 FEATURE SCALING (NO LEAKAGE)
@@ -73,33 +85,174 @@ class DataTransformation:
         X_train_scaled = self.scaler.fit_transform(X_train)
         X_test_scaled = self.scaler.transform(X_test)
 
-        X_train_scaled = pd.DataFrame(X_train_scaled, columns=X.columns)
-        X_test_scaled = pd.DataFrame(X_test_scaled, columns=X.columns)
-
-        # Reattach target
-        train = pd.concat([X_train_scaled, y_train.reset_index(drop=True)], axis=1)
-        test = pd.concat([X_test_scaled, y_test.reset_index(drop=True)], axis=1)
-
         # -----------------------------
         # Save artifacts (UNCHANGED STYLE)
         # -----------------------------
         os.makedirs(self.config.root_dir, exist_ok=True)
 
-        train_path = os.path.join(self.config.root_dir, "train.csv")
-        test_path = os.path.join(self.config.root_dir, "test.csv")
         scaler_path = os.path.join(self.config.root_dir, "scaler.joblib")
 
-        train.to_csv(train_path, index=False)
-        test.to_csv(test_path, index=False)
+        # Format comes from config.yaml (npy feature store / feather / parquet / csv)
+        fingerprint = scaler_fingerprint(self.scaler)
+        for split, X_split, y_split in (
+            ("train", X_train_scaled, y_train),
+            ("test", X_test_scaled, y_test),
+        ):
+            save_xy(
+                X_split,
+                y_split.to_numpy(),
+                feature_columns=self.feature_spec.feature_columns,
+                target_column="quality",
+                path=os.path.join(self.config.root_dir, split),
+                fmt=self.config.artifact_format,
+                scaler_fingerprint=fingerprint,
+            )
         joblib.dump(self.scaler, scaler_path)
 
+        # Unscaled train features: what the server sees after feature engineering
+        reference = self._reference_builder()
+        reference.update(X_train.to_numpy(dtype=np.float64))
+        reference.save(self.config.reference_stats_path, self.feature_spec)
+
         # -----------------------------
         # Logging
         # -----------------------------
+        add_rows(len(X_train) + len(X_test))
+
         logger.info("Train-test split completed")
-        logger.info(f"Train shape: {train.shape}")
-        logger.info(f"Test shape: {test.shape}")
+        logger.info(f"Train shape: {X_train_scaled.shape}")
+        logger.info(f"Test shape: {X_test_scaled.shape}")
         logger.info(f"Scaler saved at: {scaler_path}")
+        logger.info(f"Reference statistics saved at: {self.config.reference_stats_path}")
+
+    def _reference_builder(self) -> ReferenceStatsBuilder:
+        """Training-split statistics for the serving drift monitor."""
+        return ReferenceStatsBuilder(
+            self.feature_spec.feature_columns,
+            bins=self.config.drift_bins,
+            sample_size=self.config.reference_sample_size,
+            random_state=self.config.split_seed,
+        )
+
+    # -----------------------------
+    # HASH SPLIT
+    # -----------------------------
+    def _key_frame(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Columns the split key is computed from."""
+        if self.config.split_key == "content":
+            return data[self.feature_spec.raw_columns + ["quality"]]
+        return data
+
+    def _test_mask(self, data: pd.DataFrame, start: int) -> np.ndarray:
+        """Test rows of `data`, whose first row is row number `start`."""
+        keys = row_keys(self._key_frame(data), self.config.split_key, start=start)
+        return hash_test_mask(keys, self.config.test_size, self.config.split_seed)
 
-        print(train.shape)
-        print(test.shape)
+    # -----------------------------
+    # OUT-OF-CORE MODE
+    # -----------------------------
+    def _csv_chunks(self):
+        """Yields (first row number, chunk) for chunk_size-row CSV chunks."""
+        columns = self.feature_spec.raw_columns + ["quality"]
+        if not isinstance(self.config.split_key, str):
+            columns += [c for c in self.config.split_key if c not in columns]
+        start = 0
+        with open_dataset(self.config.data_path) as f:
+            for chunk in pd.read_csv(f, usecols=columns, chunksize=self.config.chunk_size):
+                yield start, chunk
+                start += len(chunk)
+
+    def out_of_core_splitting(self) -> None:
+        """
+        Same outputs as train_test_splitting, without ever holding the
+        dataset in memory, in a single pass over the CSV:
+
+        - each chunk is feature engineered and hash split; train rows
+          update the scaler (partial_fit)
+        - unscaled rows are appended to a raw float64 spill file per split
+        - once the scaler is final, each spill file is scaled chunk by
+          chunk into preallocated memory-mapped feature store files
+
+        The binary spill pass is much cheaper than re-parsing the CSV.
+        """
+        if self.config.artifact_format != "npy":
+            raise ValueError("out_of_core mode writes the npy feature store; set artifact_format: npy")
+        if self.config.split_strategy != "hash":
+            raise ValueError("out_of_core mode cannot use train_test_split; set split_strategy: hash")
+
+        os.makedirs(self.config.root_dir, exist_ok=True)
+        n_features = len(self.feature_spec.feature_columns)
+        spill_paths = {
+            split: (
+                os.path.join(self.config.root_dir, f".{split}_X.{os.getpid()}.spill"),
+                os.path.join(self.config.root_dir, f".{split}_y.{os.getpid()}.spill"),
+            )
+            for split in ("train", "test")
+        }
+        rows = {"train": 0, "test": 0}
+        reference = self._reference_builder()
+
+        try:
+            # -----------------------------
+            # The CSV pass: features, split, scaler statistics
+            # -----------------------------
+            spills = {split: [open(path, "wb") for path in paths] for split, paths in spill_paths.items()}
+            try:
+                for start, chunk in self._csv_chunks():
+                    test = self._test_mask(chunk, start)
+                    features = self.feature_spec.transform(
+                        chunk[self.feature_spec.raw_columns].to_numpy(dtype=np.float64)
+                    )
+                    target = chunk["quality"].to_numpy(dtype=np.float64)
+                    for split, mask in (("train", ~test), ("test", test)):
+                        if not mask.any():
+                            continue
+                        if split == "train":
+                            self.scaler.partial_fit(features[mask])
+                            reference.update(features[mask])
+                        x_file, y_file = spills[split]
+                        x_file.write(np.ascontiguousarray(features[mask]).tobytes())
+                        y_file.write(target[mask].tobytes())
+                        rows[split] += int(mask.sum())
+            finally:
+                for files in spills.values():
+                    for f in files:
+                        f.close()
+
+            if rows["train"] == 0 or rows["test"] == 0:
+                raise ValueError(f"Hash split left an empty split: {rows['train']} train / {rows['test']} test rows")
+            logger.info(f"Scaler fitted in one streaming pass over {rows['train'] + rows['test']} rows")
+
+            # -----------------------------
+            # Scale spill files into the feature store
+            # -----------------------------
+            store = FeatureStore(self.config.root_dir)
+            fingerprint = scaler_fingerprint(self.scaler)
+            for split, (x_path, y_path) in spill_paths.items():
+                X_raw = np.memmap(x_path, dtype=np.float64, mode="r", shape=(rows[split], n_features))
+                y_raw = np.memmap(y_path, dtype=np.float64, mode="r", shape=(rows[split],))
+                writer = store.writer(split, rows[split], n_features)
+                try:
+                    for chunk_rows in chunk_slices(rows[split], self.config.chunk_size):
+                        writer.append(self.scaler.transform(X_raw[chunk_rows]), y_raw[chunk_rows])
+                except BaseException:
+                    writer.abort()
+                    raise
+                del X_raw, y_raw
+                writer.close(self.feature_spec.feature_columns, "quality", scaler_fingerprint=fingerprint)
+        finally:
+            for paths in spill_paths.values():
+                for path in paths:
+                    if os.path.exists(path):
+                        os.remove(path)
+
+        scaler_path = os.path.join(self.config.root_dir, "scaler.joblib")
+        joblib.dump(self.scaler, scaler_path)
+        reference.save(self.config.reference_stats_path, self.feature_spec)
+
+        add_rows(rows["train"] + rows["test"])
+
+        logger.info("Out-of-core train-test split completed")
+        logger.info(f"Train shape: {(rows['train'], n_features)}")
+        logger.info(f"Test shape: {(rows['test'], n_features)}")
+        logger.info(f"Scaler saved at: {scaler_path}")
@@ -1,34 +1,165 @@
-'''The DataValidation class reads the ingested dataset, 
-verifies that all dataset columns match the defined schema,
-and records the validation result in a status file.'''
+'''The DataValidation class streams the ingested dataset in chunks,
+verifies its columns and dtypes against schema.yaml, tracks per-column
+null counts, min/max and out-of-range counts in a single pass, and
+records the result in a status file plus a JSON report.
+
+Only one chunk is held in memory at a time, so memory use is bounded by
+chunk_size rather than by the size of the input file.'''
+
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
 
 from Red_Wine_Prediction import logger
 from Red_Wine_Prediction.entity.config_entity import DataValidationConfig
-import pandas as pd 
-import os
+from Red_Wine_Prediction.components.ingestion_engine import open_dataset
+from Red_Wine_Prediction.utils.common import atomic_write
+from Red_Wine_Prediction.utils.stage_metrics import add_rows
+
+
+# schema.yaml dtypes checked numerically; integral ones must also hold whole numbers
+_INTEGRAL_DTYPES = {"int64", "int32", "int16", "int8"}
+_NUMERIC_DTYPES = _INTEGRAL_DTYPES | {"float64", "float32"}
+
+
+class _ColumnStats:
+    """
+    Running statistics of one column, updated chunk by chunk.
+    """
+
+    def __init__(self, dtype: str, value_range: dict = None):
+        self.dtype = dtype
+        self.low = None if not value_range else value_range.get("min")
+        self.high = None if not value_range else value_range.get("max")
+        self.rows = 0
+        self.null_count = 0
+        self.type_errors = 0
+        self.out_of_range = 0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, series: pd.Series) -> None:
+        self.rows += len(series)
+        nulls = series.isna()
+        self.null_count += int(nulls.sum())
+
+        if self.dtype not in _NUMERIC_DTYPES:
+            return
+
+        # Fast path: pandas already parsed the chunk as numbers. Otherwise
+        # coerce, and count non-null cells that failed to parse.
+        if pd.api.types.is_numeric_dtype(series):
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            values = pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64)
+            self.type_errors += int((np.isnan(values) & ~nulls.to_numpy()).sum())
+
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+
+        if self.dtype in _INTEGRAL_DTYPES:
+            self.type_errors += int(np.count_nonzero(values != np.floor(values)))
+
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+        if self.low is not None:
+            self.out_of_range += int(np.count_nonzero(values < self.low))
+        if self.high is not None:
+            self.out_of_range += int(np.count_nonzero(values > self.high))
+
+    @property
+    def ok(self) -> bool:
+        return self.null_count == 0 and self.type_errors == 0 and self.out_of_range == 0
+
+    def to_dict(self) -> dict:
+        seen = self.min <= self.max
+        return {
+            "dtype": self.dtype,
+            "rows": self.rows,
+            "null_count": self.null_count,
+            "type_errors": self.type_errors,
+            "min": self.min if seen else None,
+            "max": self.max if seen else None,
+            "range": {"min": self.low, "max": self.high},
+            "out_of_range": self.out_of_range,
+            "ok": self.ok,
+        }
 
 
 class DataValidation:
+    """
+    DataValidation handles:
+    - Column name checks (missing / unexpected columns)
+    - dtype checks against schema.yaml COLUMNS
+    - Null counts, min/max and out-of-range counts against schema.yaml RANGES
+    - Writing status.txt and the JSON validation report
+    """
+
     def __init__(self, config: DataValidationConfig):
         self.config = config
 
     def validate_all_columns(self) -> bool:
         try:
-            validation_status = None
+            start = time.perf_counter()
+            schema = {str(col): str(dtype).strip() for col, dtype in self.config.all_schema.items()}
+            ranges = self.config.column_ranges or {}
+
+            # -----------------------------
+            # Column names (header only)
+            # -----------------------------
+            with open_dataset(self.config.unzip_data_dir) as f:
+                header = [str(c) for c in pd.read_csv(f, nrows=0).columns]
+            missing = [c for c in schema if c not in header]
+            unexpected = [c for c in header if c not in schema]
+
+            # -----------------------------
+            # One streaming pass over the rows
+            # -----------------------------
+            present = [c for c in schema if c in header]
+            stats = {c: _ColumnStats(schema[c], ranges.get(c)) for c in present}
+
+            rows = 0
+            with open_dataset(self.config.unzip_data_dir) as f:
+                for chunk in pd.read_csv(f, usecols=present, chunksize=self.config.chunk_size):
+                    rows += len(chunk)
+                    for col in present:
+                        stats[col].update(chunk[col])
+
+            add_rows(rows)
+
+            columns_ok = not missing and not unexpected
+            validation_status = columns_ok and all(s.ok for s in stats.values())
 
-            data = pd.read_csv(self.config.unzip_data_dir)
-            all_cols = list(data.columns)
-            all_schema = self.config.all_schema.keys()
+            report = {
+                "status": validation_status,
+                "source": str(self.config.unzip_data_dir),
+                "rows": rows,
+                "missing_columns": missing,
+                "unexpected_columns": unexpected,
+                "columns": {col: s.to_dict() for col, s in stats.items()},
+                "seconds": round(time.perf_counter() - start, 4),
+            }
 
-            for col in all_cols:
-                if col not in all_schema:
-                    validation_status = False
-                else:
-                    validation_status = True
+            # -----------------------------
+            # Save status + report
+            # -----------------------------
+            os.makedirs(os.path.dirname(self.config.STATUS_FILE), exist_ok=True)
+            with open(self.config.STATUS_FILE, 'w') as f:
+                f.write(f"Validation status: {validation_status}")
 
-                with open(self.config.STATUS_FILE, 'w') as f:
-                    f.write(f"Validation status: {validation_status}")
+            with atomic_write(self.config.REPORT_FILE) as f:
+                json.dump(report, f, indent=4)
 
+            failed = [col for col, s in stats.items() if not s.ok]
+            logger.info(
+                f"Validated {rows} rows in {report['seconds']}s: status={validation_status}, "
+                f"missing={missing}, unexpected={unexpected}, failing columns={failed}"
+            )
             return validation_status
 
         except Exception as e:
@@ -0,0 +1,225 @@
+'''Feature statistics for input drift monitoring.
+
+Training side: ReferenceStatsBuilder summarizes the training split, chunk
+by chunk, into reference_stats.json: per feature (the raw schema columns
+and the engineered features) the count, mean, variance, min, max and a
+fixed histogram whose bin edges are reference quantiles, so every bin
+holds about the same share of training rows. Edges come from a bounded
+uniform sample of rows, so the builder needs O(sample_size) memory
+however large the split is.
+
+Serving side: FeatureSketch keeps constant-memory running statistics of
+served inputs over the same bins: Welford mean / variance (merged batch
+by batch with Chan's formula) and histogram counts.
+
+Drift scores compare a sketch with its reference:
+
+- PSI  = Σ (p_cur − p_ref) · ln(p_cur / p_ref) over bins
+         (< 0.1 stable, 0.1–0.2 moderate, > 0.2 significant shift)
+- KS   = max |F_cur − F_ref| over bin edges: the two-sample KS statistic
+         evaluated at histogram resolution'''
+
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from Red_Wine_Prediction.components.feature_engineering import FeatureSpec
+from Red_Wine_Prediction.utils.common import atomic_write
+
+
+# Floor for empty-bin proportions in PSI (avoids log(0))
+_PSI_EPS = 1e-4
+
+
+# -----------------------------
+# Histogram helpers
+# -----------------------------
+def bin_counts(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """(N, F) values → (F, B) counts over per-feature interior edges (F, B - 1)."""
+    n_features, n_inner = edges.shape
+    # Bin index per value, offset per feature so one bincount covers all
+    idx = np.empty(values.shape, dtype=np.int64)
+    for j in range(n_features):
+        idx[:, j] = np.searchsorted(edges[j], values[:, j], side="right")
+    idx += np.arange(n_features) * (n_inner + 1)
+    counts = np.bincount(idx.ravel(), minlength=n_features * (n_inner + 1))
+    return counts.reshape(n_features, n_inner + 1)
+
+
+def psi(reference: np.ndarray, current: np.ndarray) -> np.ndarray:
+    """Population stability index per row of (F, B) proportion arrays."""
+    ref = np.maximum(reference, _PSI_EPS)
+    cur = np.maximum(current, _PSI_EPS)
+    return np.sum((cur - ref) * np.log(cur / ref), axis=-1)
+
+
+def ks_statistic(reference: np.ndarray, current: np.ndarray) -> np.ndarray:
+    """Binned two-sample KS statistic per row of (F, B) proportion arrays."""
+    return np.max(np.abs(np.cumsum(current, axis=-1) - np.cumsum(reference, axis=-1)), axis=-1)
+
+
+# -----------------------------
+# Training side
+# -----------------------------
+class ReferenceStatsBuilder:
+    """
+    Accumulates reference statistics of (N, F) feature chunks:
+    Welford / Chan moments, min / max and a bottom-k random sample of
+    rows (uniform over everything seen) used for the quantile edges.
+    """
+
+    def __init__(self, feature_columns: list, bins: int = 20, sample_size: int = 100_000, random_state: int = 42):
+        self.feature_columns = list(feature_columns)
+        self.bins = bins
+        self.sample_size = sample_size
+        self._rng = np.random.default_rng(random_state)
+
+        n_features = len(self.feature_columns)
+        self.count = 0
+        self.mean = np.zeros(n_features)
+        self.m2 = np.zeros(n_features)
+        self.min = np.full(n_features, np.inf)
+        self.max = np.full(n_features, -np.inf)
+        self._sample = np.empty((0, n_features))
+        self._sample_keys = np.empty(0)
+
+    def update(self, X: np.ndarray) -> None:
+        X = np.asarray(X, dtype=np.float64)
+        n = X.shape[0]
+        if n == 0:
+            return
+
+        # Chan et al. parallel merge of (count, mean, M2)
+        batch_mean = X.mean(axis=0)
+        batch_m2 = ((X - batch_mean) ** 2).sum(axis=0)
+        total = self.count + n
+        delta = batch_mean - self.mean
+        self.mean = self.mean + delta * (n / total)
+        self.m2 = self.m2 + batch_m2 + delta ** 2 * (self.count * n / total)
+        self.count = total
+        self.min = np.minimum(self.min, X.min(axis=0))
+        self.max = np.maximum(self.max, X.max(axis=0))
+
+        # Bottom-k sampling: keep the rows with the smallest random keys
+        keys = np.concatenate([self._sample_keys, self._rng.random(n)])
+        rows = np.concatenate([self._sample, X])
+        if keys.shape[0] > self.sample_size:
+            keep = np.argpartition(keys, self.sample_size)[:self.sample_size]
+            keys, rows = keys[keep], rows[keep]
+        self._sample_keys, self._sample = keys, rows
+
+    def build(self, feature_spec: FeatureSpec) -> dict:
+        if self.count == 0:
+            raise ValueError("No rows seen; cannot build reference statistics")
+
+        quantiles = np.linspace(0.0, 1.0, self.bins + 1)[1:-1]
+        features = {}
+        for j, name in enumerate(self.feature_columns):
+            column = self._sample[:, j]
+            edges = np.unique(np.quantile(column, quantiles))
+            counts = np.bincount(np.searchsorted(edges, column, side="right"), minlength=edges.size + 1)
+            features[name] = {
+                "count": int(self.count),
+                "mean": float(self.mean[j]),
+                "variance": float(self.m2[j] / self.count),
+                "min": float(self.min[j]),
+                "max": float(self.max[j]),
+                "edges": edges.tolist(),
+                "proportions": (counts / counts.sum()).tolist(),
+            }
+        return {
+            "raw_columns": feature_spec.raw_columns,
+            "feature_spec": feature_spec.to_list(),
+            "rows": int(self.count),
+            "sample_rows": int(self._sample.shape[0]),
+            "created_at": time.time(),
+            "features": features,
+        }
+
+    def save(self, path: Path, feature_spec: FeatureSpec) -> dict:
+        reference = self.build(feature_spec)
+        with atomic_write(path) as f:
+            json.dump(reference, f, indent=4)
+        return reference
+
+
+# -----------------------------
+# Serving side
+# -----------------------------
+class FeatureSketch:
+    """
+    Constant-memory running statistics of served inputs over the bins
+    of a reference (see load_reference).
+    """
+
+    def __init__(self, reference: dict):
+        self.reference = reference
+        self.feature_spec = FeatureSpec(reference["feature_spec"])
+        self.feature_columns = list(reference["features"])
+        if self.feature_columns != self.feature_spec.feature_columns:
+            raise ValueError("Reference statistics do not match their feature spec")
+
+        stats = [reference["features"][name] for name in self.feature_columns]
+        # Edge lists can differ in length (ties collapse quantiles): pad
+        # with +inf, whose bins stay empty, to one (F, B - 1) array
+        width = max(len(s["edges"]) for s in stats)
+        self.edges = np.full((len(stats), width), np.inf)
+        self.reference_proportions = np.zeros((len(stats), width + 1))
+        for j, s in enumerate(stats):
+            self.edges[j, :len(s["edges"])] = s["edges"]
+            self.reference_proportions[j, :len(s["proportions"])] = s["proportions"]
+
+        n_features = len(stats)
+        self.count = 0
+        self.mean = np.zeros(n_features)
+        self.m2 = np.zeros(n_features)
+        self.counts = np.zeros((n_features, width + 1), dtype=np.int64)
+
+    def update(self, X_raw: np.ndarray) -> None:
+        """Adds (N, raw columns) served inputs."""
+        X = self.feature_spec.transform(np.asarray(X_raw, dtype=np.float64))
+        finite = np.isfinite(X).all(axis=1)
+        X = X[finite]
+        n = X.shape[0]
+        if n == 0:
+            return
+
+        batch_mean = X.mean(axis=0)
+        batch_m2 = ((X - batch_mean) ** 2).sum(axis=0)
+        total = self.count + n
+        delta = batch_mean - self.mean
+        self.mean = self.mean + delta * (n / total)
+        self.m2 = self.m2 + batch_m2 + delta ** 2 * (self.count * n / total)
+        self.count = total
+        self.counts += bin_counts(X, self.edges)
+
+    def scores(self, psi_alert: float = 0.2) -> dict:
+        """Per-feature statistics and PSI / KS against the reference."""
+        result = {"rows": int(self.count), "features": {}, "drifted_features": []}
+        if self.count == 0:
+            return result
+
+        proportions = self.counts / self.count
+        psi_scores = psi(self.reference_proportions, proportions)
+        ks_scores = ks_statistic(self.reference_proportions, proportions)
+        for j, name in enumerate(self.feature_columns):
+            ref = self.reference["features"][name]
+            result["features"][name] = {
+                "mean": float(self.mean[j]),
+                "std": float(np.sqrt(self.m2[j] / self.count)),
+                "reference_mean": ref["mean"],
+                "reference_std": float(np.sqrt(ref["variance"])),
+                "psi": float(psi_scores[j]),
+                "ks": float(ks_scores[j]),
+            }
+            if psi_scores[j] > psi_alert:
+                result["drifted_features"].append(name)
+        result["max_psi"] = float(psi_scores.max())
+        return result
+
+
+def load_reference(path: Path) -> dict:
+    with open(path) as f:
+        return json.load(f)
@@ -0,0 +1,261 @@
+'''Declarative feature engineering shared by training (DataTransformation)
+and serving (InferencePipeline / CompiledLinearModel). NumPy only, so the
+serving path never needs pandas.
+
+Derived features are declared in params.yaml (feature_engineering.features),
+one entry per feature:
+
+    - {name: log_chlorides, op: log1p, input: chlorides}
+    - {name: alcohol_density_ratio, op: ratio, inputs: [alcohol, density], eps: 1.0e-6}
+
+FeatureSpec compiles the list once into a sequence of NumPy ufunc calls
+that all write into one preallocated (N, raw + derived) output matrix.
+Inputs may name raw columns or any feature declared earlier in the list.
+The spec travels with the trained model (compiled model JSON and the
+pickled InferencePipeline), so serving always applies exactly the features
+the model was trained on.
+
+Supported ops:
+- log1p, log, sqrt, square, abs   input: <col>
+- ratio                           inputs: [numerator, denominator], eps (default 0)
+- product, sum                    inputs: [<col>, <col>, ...]
+- difference                      inputs: [a, b]  → a - b
+- clip                            input: <col>, min and/or max
+- power                           input: <col>, degree
+- polynomial                      input: <col>, degree → <name>_2 ... <name>_<degree>'''
+
+from typing import List, Optional
+
+import numpy as np
+
+
+# -----------------------------
+# Column layout
+# -----------------------------
+# Raw input columns, in schema.yaml / CSV order
+RAW_FEATURE_COLUMNS = [
+    "fixed acidity",
+    "volatile acidity",
+    "citric acid",
+    "residual sugar",
+    "chlorides",
+    "free sulfur dioxide",
+    "total sulfur dioxide",
+    "density",
+    "pH",
+    "sulphates",
+    "alcohol",
+]
+
+# Used when params.yaml has no feature_engineering section and by the
+# legacy model.joblib + scaler.joblib serving fallback
+DEFAULT_FEATURE_SPEC = [
+    {"name": "log_residual_sugar", "op": "log1p", "input": "residual sugar"},
+    {"name": "log_chlorides", "op": "log1p", "input": "chlorides"},
+    {"name": "log_free_sulfur_dioxide", "op": "log1p", "input": "free sulfur dioxide"},
+    {"name": "log_total_sulfur_dioxide", "op": "log1p", "input": "total sulfur dioxide"},
+    {"name": "log_sulphates", "op": "log1p", "input": "sulphates"},
+    {"name": "alcohol_density_ratio", "op": "ratio", "inputs": ["alcohol", "density"], "eps": 1e-6},
+]
+
+_UNARY_OPS = {
+    "log1p": np.log1p,
+    "log": np.log,
+    "sqrt": np.sqrt,
+    "square": np.square,
+    "abs": np.abs,
+}
+_NARY_OPS = {"ratio", "product", "sum", "difference"}
+_OPS = set(_UNARY_OPS) | _NARY_OPS | {"clip", "power", "polynomial"}
+
+
+class FeatureSpec:
+    """
+    FeatureSpec handles:
+    - Validating the declarative feature list (ops, names, input references)
+    - Compiling it into ufunc calls over one preallocated output matrix
+    - Fusing runs of the same unary op into a single vectorized call
+    """
+
+    def __init__(self, features: Optional[List[dict]] = None, raw_columns: Optional[List[str]] = None):
+        self.features = [dict(f) for f in (DEFAULT_FEATURE_SPEC if features is None else features)]
+        self.raw_columns = list(RAW_FEATURE_COLUMNS if raw_columns is None else raw_columns)
+        self.engineered_columns = []
+        self._steps = []
+        self._compile()
+        self.feature_columns = self.raw_columns + self.engineered_columns
+
+    # Pickles (joblib'd InferencePipeline) store the declarative list only
+    # and recompile on load
+    def __reduce__(self):
+        return (FeatureSpec, (self.features, self.raw_columns))
+
+    def to_list(self) -> List[dict]:
+        return [dict(f) for f in self.features]
+
+    # -----------------------------
+    # Compilation
+    # -----------------------------
+    def _compile(self) -> None:
+        index = {name: j for j, name in enumerate(self.raw_columns)}
+        if len(index) != len(self.raw_columns):
+            raise ValueError(f"Duplicate raw columns: {self.raw_columns}")
+
+        def resolve(feature, column):
+            if column not in index:
+                raise ValueError(
+                    f"Feature {feature.get('name')!r} references unknown column {column!r}; "
+                    f"inputs must be raw columns or features declared earlier"
+                )
+            return index[column]
+
+        unary_run = None   # (ufunc, [src...], dst_start) of consecutive unary ops
+
+        def flush():
+            nonlocal unary_run
+            if unary_run is not None:
+                self._steps.append(self._unary_step(*unary_run))
+                unary_run = None
+
+        for feature in self.features:
+            op = feature.get("op")
+            name = feature.get("name")
+            if op not in _OPS:
+                raise ValueError(f"Unknown feature op {op!r} for {name!r}; expected one of {sorted(_OPS)}")
+            if not name:
+                raise ValueError(f"Feature without a name: {feature}")
+
+            dst = len(index)
+            if op == "polynomial":
+                degree = int(feature["degree"])
+                if degree < 2:
+                    raise ValueError(f"Feature {name!r}: polynomial degree must be >= 2")
+                names = [f"{name}_{d}" for d in range(2, degree + 1)]
+            else:
+                names = [name]
+            for column in names:
+                if column in index:
+                    raise ValueError(f"Duplicate feature name {column!r}")
+
+            if op in _UNARY_OPS:
+                src = resolve(feature, feature["input"])
+                ufunc = _UNARY_OPS[op]
+                # Extend the current run only if its sources are already
+                # computed (a run reads all sources before writing)
+                if unary_run is not None and unary_run[0] is ufunc and src < unary_run[2]:
+                    unary_run[1].append(src)
+                else:
+                    flush()
+                    unary_run = (ufunc, [src], dst)
+            else:
+                flush()
+                if op in _NARY_OPS:
+                    srcs = [resolve(feature, c) for c in feature["inputs"]]
+                    if op in ("ratio", "difference") and len(srcs) != 2:
+                        raise ValueError(f"Feature {name!r}: {op} takes exactly 2 inputs")
+                    if len(srcs) < 2:
+                        raise ValueError(f"Feature {name!r}: {op} takes at least 2 inputs")
+                    self._steps.append(self._nary_step(op, srcs, dst, float(feature.get("eps", 0.0))))
+                elif op == "clip":
+                    src = resolve(feature, feature["input"])
+                    self._steps.append(self._clip_step(src, dst, feature.get("min"), feature.get("max")))
+                elif op == "power":
+                    src = resolve(feature, feature["input"])
+                    self._steps.append(self._power_step(src, dst, float(feature["degree"])))
+                else:
+                    src = resolve(feature, feature["input"])
+                    self._steps.append(self._polynomial_step(src, dst, len(names)))
+
+            for column in names:
+                index[column] = len(index)
+                self.engineered_columns.append(column)
+        flush()
+
+    @staticmethod
+    def _unary_step(ufunc, srcs, dst):
+        stop = dst + len(srcs)
+        if len(srcs) == 1:
+            src = srcs[0]
+            return lambda out: ufunc(out[:, src], out=out[:, dst])
+        srcs = np.asarray(srcs)
+        return lambda out: ufunc(out[:, srcs], out=out[:, dst:stop])
+
+    @staticmethod
+    def _nary_step(op, srcs, dst, eps):
+        first, rest = srcs[0], srcs[1:]
+
+        if op == "ratio":
+            def step(out):
+                column = out[:, dst]
+                np.add(out[:, rest[0]], eps, out=column)
+                np.divide(out[:, first], column, out=column)
+            return step
+
+        ufunc = {"product": np.multiply, "sum": np.add, "difference": np.subtract}[op]
+
+        def step(out):
+            column = out[:, dst]
+            ufunc(out[:, first], out[:, rest[0]], out=column)
+            for src in rest[1:]:
+                ufunc(column, out[:, src], out=column)
+        return step
+
+    @staticmethod
+    def _clip_step(src, dst, low, high):
+        low = -np.inf if low is None else float(low)
+        high = np.inf if high is None else float(high)
+        return lambda out: np.clip(out[:, src], low, high, out=out[:, dst])
+
+    @staticmethod
+    def _power_step(src, dst, degree):
+        return lambda out: np.power(out[:, src], degree, out=out[:, dst])
+
+    @staticmethod
+    def _polynomial_step(src, dst, n_terms):
+        def step(out):
+            # x^d = x^(d-1) * x: one multiply per extra degree
+            np.multiply(out[:, src], out[:, src], out=out[:, dst])
+            for k in range(1, n_terms):
+                np.multiply(out[:, dst + k - 1], out[:, src], out=out[:, dst + k])
+        return step
+
+    # -----------------------------
+    # Kernel
+    # -----------------------------
+    def transform(self, X: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """
+        Appends the engineered features to a raw (N, R) matrix.
+
+        Args:
+            X (np.ndarray): Raw features in raw_columns order
+            out (np.ndarray): Optional preallocated (N, R + E) float64 buffer
+
+        Returns:
+            np.ndarray: (N, R + E) matrix in feature_columns order
+        """
+        X = np.asarray(X, dtype=np.float64)
+        n_raw = len(self.raw_columns)
+        if X.ndim != 2 or X.shape[1] != n_raw:
+            raise ValueError(f"Expected an (N, {n_raw}) array, got shape {X.shape}")
+
+        if out is None:
+            out = np.empty((X.shape[0], len(self.feature_columns)), dtype=np.float64)
+        elif out.shape != (X.shape[0], len(self.feature_columns)) or out.dtype != np.float64:
+            raise ValueError(f"Output buffer must be float64 {(X.shape[0], len(self.feature_columns))}")
+
+        out[:, :n_raw] = X
+        for step in self._steps:
+            step(out)
+        return out
+
+
+DEFAULT_FEATURES = FeatureSpec()
+
+
+def as_feature_spec(feature_spec) -> FeatureSpec:
+    """None -> DEFAULT_FEATURES, list of dicts -> compiled FeatureSpec."""
+    if feature_spec is None:
+        return DEFAULT_FEATURES
+    if isinstance(feature_spec, FeatureSpec):
+        return feature_spec
+    return FeatureSpec(feature_spec)
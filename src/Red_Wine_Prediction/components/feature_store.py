@@ -0,0 +1,211 @@
+'''Memory-mapped feature store for the train/test matrices.
+
+Each split is stored as two contiguous float64 .npy files under the data
+transformation directory:
+
+    train_X.npy, train_y.npy, test_X.npy, test_y.npy
+    feature_store.json      sidecar index: columns, shapes, scaler fingerprint
+
+Readers map the arrays read-only (np.load(mmap_mode="r")), so any number of
+stages, CV folds or worker processes share the same OS page cache
+instead of each holding a private pandas copy.'''
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.utils.common import atomic_write
+
+
+INDEX_FILE_NAME = "feature_store.json"
+INDEX_VERSION = 1
+
+
+def scaler_fingerprint(scaler) -> str:
+    """
+    sha256 over a fitted StandardScaler's mean_ and scale_, used to check that
+    a model is combined with the scaler its training matrices came from.
+    """
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(scaler.mean_, dtype=np.float64).tobytes())
+    digest.update(np.ascontiguousarray(scaler.scale_, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class FeatureSet:
+    """
+    One split mapped from the store. X and y are read-only memory maps.
+    """
+    X: np.ndarray
+    y: np.ndarray
+    feature_columns: List[str]
+    target_column: str
+    scaler_fingerprint: Optional[str]
+
+
+class FeatureStore:
+    """
+    FeatureStore handles:
+    - Writing X / y of a split as contiguous float64 .npy files
+    - Recording columns, shapes and the scaler fingerprint in the index
+    - Mapping splits read-only with zero copies
+    """
+
+    # Serializes index read-modify-write between threads of one process
+    _index_lock = threading.Lock()
+
+    def __init__(self, root_dir: Path):
+        self.root_dir = Path(root_dir)
+        self.index_path = self.root_dir / INDEX_FILE_NAME
+
+    def paths(self, split: str) -> List[Path]:
+        """Files backing one split: X, y and the shared index."""
+        return [self.root_dir / f"{split}_X.npy", self.root_dir / f"{split}_y.npy", self.index_path]
+
+    def read_index(self) -> dict:
+        try:
+            with open(self.index_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"version": INDEX_VERSION, "splits": {}}
+
+    def write(
+        self,
+        split: str,
+        X: np.ndarray,
+        y: np.ndarray,
+        feature_columns: List[str],
+        target_column: str,
+        scaler_fingerprint: Optional[str] = None,
+    ) -> None:
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        y = np.ascontiguousarray(y, dtype=np.float64).ravel()
+        if X.shape[0] != y.shape[0] or X.shape[1] != len(feature_columns):
+            raise ValueError(
+                f"Inconsistent split {split}: X {X.shape}, y {y.shape}, {len(feature_columns)} columns"
+            )
+
+        os.makedirs(self.root_dir, exist_ok=True)
+        x_path, y_path, _ = self.paths(split)
+        with atomic_write(x_path, "wb") as f:
+            np.save(f, X)
+        with atomic_write(y_path, "wb") as f:
+            np.save(f, y)
+
+        self._record_split(split, X.shape, feature_columns, target_column, scaler_fingerprint)
+
+    def writer(self, split: str, n_rows: int, n_features: int) -> "FeatureSplitWriter":
+        """
+        Streaming alternative to write() for splits larger than memory:
+        rows are appended chunk by chunk into preallocated memory-mapped
+        files. n_rows must be known up front (e.g. from a counting pass).
+        """
+        return FeatureSplitWriter(self, split, n_rows, n_features)
+
+    def _record_split(self, split, shape, feature_columns, target_column, scaler_fingerprint) -> None:
+        x_path, y_path, _ = self.paths(split)
+        with self._index_lock:
+            index = self.read_index()
+            index["splits"][split] = {
+                "X": x_path.name,
+                "y": y_path.name,
+                "shape": list(shape),
+                "dtype": "float64",
+                "feature_columns": list(feature_columns),
+                "target_column": target_column,
+                "scaler_fingerprint": scaler_fingerprint,
+                "written_at": time.time(),
+            }
+            with atomic_write(self.index_path) as f:
+                json.dump(index, f, indent=4)
+
+        logger.info(f"Feature store split '{split}' {tuple(shape)} saved at: {self.root_dir}")
+
+    def open(self, split: str, expected_scaler_fingerprint: Optional[str] = None) -> FeatureSet:
+        """
+        Maps a split read-only.
+
+        Raises:
+            KeyError: If the split was never written
+            ValueError: If shapes or the scaler fingerprint do not match the index
+        """
+        entry = self.read_index()["splits"].get(split)
+        if entry is None:
+            raise KeyError(f"Split '{split}' not found in {self.index_path}")
+
+        X = np.load(self.root_dir / entry["X"], mmap_mode="r")
+        y = np.load(self.root_dir / entry["y"], mmap_mode="r")
+        if list(X.shape) != entry["shape"] or y.shape != (entry["shape"][0],):
+            raise ValueError(f"Split '{split}' on disk does not match {self.index_path}")
+
+        if expected_scaler_fingerprint and entry["scaler_fingerprint"] != expected_scaler_fingerprint:
+            raise ValueError(
+                f"Split '{split}' was scaled with a different scaler "
+                f"({entry['scaler_fingerprint']}) than expected ({expected_scaler_fingerprint})"
+            )
+
+        return FeatureSet(
+            X=X,
+            y=y,
+            feature_columns=entry["feature_columns"],
+            target_column=entry["target_column"],
+            scaler_fingerprint=entry["scaler_fingerprint"],
+        )
+
+
+class FeatureSplitWriter:
+    """
+    Appends rows of one split into temporary .npy memory maps, which
+    replace the split's files on close(). Memory use is bounded by the
+    chunks passed to append(), not by the split size.
+    """
+
+    def __init__(self, store: FeatureStore, split: str, n_rows: int, n_features: int):
+        self.store = store
+        self.split = split
+        self.shape = (int(n_rows), int(n_features))
+        os.makedirs(store.root_dir, exist_ok=True)
+
+        x_path, y_path, _ = store.paths(split)
+        self._targets = [x_path, y_path]
+        self._tmp_paths = [p.with_name(f".{p.name}.{os.getpid()}.tmp") for p in self._targets]
+        self._X = np.lib.format.open_memmap(self._tmp_paths[0], mode="w+", dtype=np.float64, shape=self.shape)
+        self._y = np.lib.format.open_memmap(self._tmp_paths[1], mode="w+", dtype=np.float64, shape=(self.shape[0],))
+        self.rows_written = 0
+
+    def append(self, X: np.ndarray, y: np.ndarray) -> None:
+        n = X.shape[0]
+        end = self.rows_written + n
+        if end > self.shape[0]:
+            raise ValueError(f"Split '{self.split}' was sized for {self.shape[0]} rows, got more")
+        self._X[self.rows_written:end] = X
+        self._y[self.rows_written:end] = np.ravel(y)
+        self.rows_written = end
+
+    def close(self, feature_columns: List[str], target_column: str, scaler_fingerprint: Optional[str] = None) -> None:
+        if self.rows_written != self.shape[0]:
+            self.abort()
+            raise ValueError(
+                f"Split '{self.split}' expected {self.shape[0]} rows, {self.rows_written} were written"
+            )
+        for array in (self._X, self._y):
+            array.flush()
+        self._X = self._y = None
+        for tmp_path, target in zip(self._tmp_paths, self._targets):
+            os.replace(tmp_path, target)
+        self.store._record_split(self.split, self.shape, feature_columns, target_column, scaler_fingerprint)
+
+    def abort(self) -> None:
+        self._X = self._y = None
+        for tmp_path in self._tmp_paths:
+            if tmp_path.exists():
+                os.remove(tmp_path)
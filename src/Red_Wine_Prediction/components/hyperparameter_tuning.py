@@ -0,0 +1,202 @@
+'''Cross-validated ElasticNet search over alpha × l1_ratio.
+
+Candidates are the alpha / l1_ratio grids from params.yaml plus random
+draws from their ranges. Rather than fitting one ElasticNet per candidate,
+every (fold, l1_ratio) pair is one task that runs a regularization path
+(sklearn enet_path) over all alphas from largest to smallest: each fit is
+warm-started from the previous alpha's coefficients, so a whole path costs
+about as much as a few cold single fits. Tasks run on a process pool; the
+training matrix is shipped to each worker once (or, for the npy feature
+store, memory-mapped by every worker from the same file).
+
+The best (lowest mean CV RMSE) alpha / l1_ratio and the full CV table are
+written to tuned_params.json, which the trainer reads when tuning is
+enabled.'''
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from sklearn.linear_model import enet_path
+from sklearn.model_selection import KFold
+
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.entity.config_entity import HyperparameterTuningConfig
+from Red_Wine_Prediction.utils.artifact_io import matrix_source, open_matrix_source
+from Red_Wine_Prediction.utils.common import atomic_write, process_pool_context
+from Red_Wine_Prediction.utils.stage_metrics import add_rows
+
+
+# -----------------------------
+# Worker side
+# -----------------------------
+# Training matrix of the current worker process, set once by _init_worker
+_X = None
+_y = None
+
+
+def _init_worker(source) -> None:
+    """Loads the training matrix once per worker (see matrix_source)."""
+    global _X, _y
+    _X, _y = open_matrix_source(source)
+
+
+def _fold_path(task) -> tuple:
+    """
+    Fits one warm-started ElasticNet path on a training fold and scores
+    every alpha on the held-out fold.
+
+    Args:
+        task: (l1_ratio, fold, train_idx, val_idx, alphas, max_iter, tol),
+            alphas sorted in decreasing order
+
+    Returns:
+        tuple: (l1_ratio, fold, (A,) validation MSE per alpha)
+    """
+    l1_ratio, fold, train_idx, val_idx, alphas, max_iter, tol = task
+
+    X_train = np.asarray(_X[train_idx], dtype=np.float64)
+    y_train = np.asarray(_y[train_idx], dtype=np.float64)
+
+    # Same centering ElasticNet(fit_intercept=True) applies before descent
+    X_mean = X_train.mean(axis=0)
+    y_mean = y_train.mean()
+    X_train -= X_mean
+    y_train -= y_mean
+
+    _, coefs, _ = enet_path(
+        X_train,
+        y_train,
+        l1_ratio=l1_ratio,
+        alphas=alphas,
+        max_iter=max_iter,
+        tol=tol,
+        check_input=False,
+    )
+    # coefs: (F, A); one intercept per alpha
+    intercepts = y_mean - X_mean @ coefs
+
+    X_val = np.asarray(_X[val_idx], dtype=np.float64)
+    residuals = X_val @ coefs + intercepts - np.asarray(_y[val_idx], dtype=np.float64)[:, None]
+    return l1_ratio, fold, np.mean(residuals * residuals, axis=0)
+
+
+# -----------------------------
+# Driver
+# -----------------------------
+class HyperparameterTuner:
+    """
+    HyperparameterTuner handles:
+    - Building the alpha / l1_ratio candidates (grids + random draws)
+    - Running warm-started CV paths on a process pool
+    - Picking the best candidate and saving tuned_params.json
+    """
+
+    def __init__(self, config: HyperparameterTuningConfig):
+        self.config = config
+
+    def candidates(self):
+        """
+        Returns (alphas, l1_ratios): the grids merged with random draws,
+        alphas sorted in decreasing order for warm starts.
+        """
+        rng = np.random.default_rng(self.config.random_state)
+
+        alphas = np.asarray(self.config.alphas, dtype=np.float64)
+        if self.config.n_random_alphas:
+            log_low, log_high = np.log10(alphas.min()), np.log10(alphas.max())
+            alphas = np.concatenate([
+                alphas, 10.0 ** rng.uniform(log_low, log_high, self.config.n_random_alphas)
+            ])
+
+        l1_ratios = np.asarray(self.config.l1_ratios, dtype=np.float64)
+        if self.config.n_random_l1_ratios:
+            low, high = self.config.l1_ratio_range
+            l1_ratios = np.concatenate([
+                l1_ratios, rng.uniform(low, high, self.config.n_random_l1_ratios)
+            ])
+
+        return np.unique(alphas)[::-1].copy(), np.unique(l1_ratios)
+
+    def tune(self) -> dict:
+        start = time.perf_counter()
+        alphas, l1_ratios = self.candidates()
+        source, n_rows = matrix_source(
+            self.config.train_data_path, self.config.artifact_format, self.config.target_column
+        )
+        add_rows(n_rows)
+
+        folds = list(
+            KFold(n_splits=self.config.cv_folds, shuffle=True, random_state=self.config.random_state)
+            .split(np.arange(n_rows))
+        )
+        tasks = [
+            (float(l1_ratio), fold, train_idx, val_idx, alphas, self.config.max_iter, self.config.tol)
+            for l1_ratio in l1_ratios
+            for fold, (train_idx, val_idx) in enumerate(folds)
+        ]
+
+        n_workers = min(self.config.n_jobs or os.cpu_count() or 1, len(tasks))
+        logger.info(
+            f"Tuning ElasticNet: {len(alphas)} alphas x {len(l1_ratios)} l1_ratios, "
+            f"{self.config.cv_folds}-fold CV, {len(tasks)} paths on {n_workers} worker(s)"
+        )
+
+        if n_workers <= 1:
+            _init_worker(source)
+            results = [_fold_path(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=process_pool_context(),
+                initializer=_init_worker,
+                initargs=(source,),
+            ) as pool:
+                results = list(pool.map(_fold_path, tasks))
+
+        # -----------------------------
+        # Aggregate: RMSE per (l1_ratio, alpha) over folds
+        # -----------------------------
+        l1_index = {float(r): i for i, r in enumerate(l1_ratios)}
+        mse = np.empty((len(l1_ratios), self.config.cv_folds, len(alphas)))
+        for l1_ratio, fold, fold_mse in results:
+            mse[l1_index[l1_ratio], fold] = fold_mse
+        rmse = np.sqrt(mse)
+        mean_rmse = rmse.mean(axis=1)
+        std_rmse = rmse.std(axis=1)
+
+        best_l1, best_alpha = np.unravel_index(np.argmin(mean_rmse), mean_rmse.shape)
+        tuned = {
+            "alpha": float(alphas[best_alpha]),
+            "l1_ratio": float(l1_ratios[best_l1]),
+            "cv_rmse": float(mean_rmse[best_l1, best_alpha]),
+            "cv_rmse_std": float(std_rmse[best_l1, best_alpha]),
+            "cv_folds": self.config.cv_folds,
+            "n_candidates": int(mean_rmse.size),
+            "seconds": round(time.perf_counter() - start, 3),
+            "results": sorted(
+                (
+                    {
+                        "alpha": float(alphas[j]),
+                        "l1_ratio": float(l1_ratios[i]),
+                        "cv_rmse": float(mean_rmse[i, j]),
+                        "cv_rmse_std": float(std_rmse[i, j]),
+                    }
+                    for i in range(len(l1_ratios))
+                    for j in range(len(alphas))
+                ),
+                key=lambda row: row["cv_rmse"],
+            ),
+        }
+
+        with atomic_write(self.config.tuned_params_path) as f:
+            json.dump(tuned, f, indent=4)
+
+        logger.info(
+            f"Best ElasticNet params alpha={tuned['alpha']:.6g}, l1_ratio={tuned['l1_ratio']:.4g} "
+            f"(CV RMSE {tuned['cv_rmse']:.5f} ± {tuned['cv_rmse_std']:.5f}) in {tuned['seconds']}s; "
+            f"saved at: {self.config.tuned_params_path}"
+        )
+        return tuned
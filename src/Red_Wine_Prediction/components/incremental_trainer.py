@@ -0,0 +1,309 @@
+'''Incremental (online) training from newly appended labelled rows.
+
+The ingested CSV is treated as append-only. A watermark in the artifacts
+directory records how far it has been consumed (byte offset and row
+count), so each run seeks straight to the new rows and never re-reads
+historical data:
+
+- the scaler's running mean / variance are updated with
+  StandardScaler.partial_fit
+- an SGDRegressor is updated with partial_fit on the rescaled new rows
+- each new batch is scored before the model learns from it
+  (test-then-train), giving an honest error for the batch
+
+Because earlier updates were made under earlier scaler statistics, the
+model drifts slightly from a fresh fit. A full refit (streamed over the
+whole file in chunks) runs every `full_refit_every` incremental batches,
+and whenever the file was rewritten rather than appended, its header or
+the feature spec changed, or no state exists yet.
+
+With `publish` set (config.yaml; off by default) each update is
+published as a new serving model version through the same ModelStore as
+the batch trainer, replacing the served model. Otherwise the updated
+model only lives in root_dir.'''
+
+import csv
+import hashlib
+import io
+import json
+import os
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import SGDRegressor
+from sklearn.preprocessing import StandardScaler
+
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.entity.config_entity import IncrementalTrainingConfig
+from Red_Wine_Prediction.components.feature_engineering import FeatureSpec
+from Red_Wine_Prediction.components.inference_pipeline import InferencePipeline
+from Red_Wine_Prediction.components.model_store import ModelStore
+from Red_Wine_Prediction.components.model_trainer import publish_model_version
+from Red_Wine_Prediction.utils.common import atomic_write
+
+
+# Bytes before the watermark hashed to detect a rewritten (not appended) file
+_TAIL_BYTES = 4096
+# Batches kept in the watermark history
+_MAX_HISTORY = 100
+
+
+def _sha256(data) -> str:
+    if not isinstance(data, bytes):
+        data = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+class _ByteRange(io.RawIOBase):
+    """Read-only view of bytes [start, stop) of a binary file."""
+
+    def __init__(self, f, start: int, stop: int):
+        self._f = f
+        self._f.seek(start)
+        self._remaining = stop - start
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        n = min(len(buffer), self._remaining)
+        if n <= 0:
+            return 0
+        data = self._f.read(n)
+        buffer[:len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+
+
+class IncrementalTrainer:
+    """
+    IncrementalTrainer handles:
+    - Reading the watermark and deciding between an incremental update and
+      a full refit
+    - Streaming new (or all) rows in chunks through the feature spec
+    - Updating the scaler and SGD model with partial_fit
+    - Saving state + watermark and publishing a serving version
+    """
+
+    def __init__(self, config: IncrementalTrainingConfig):
+        self.config = config
+        self.feature_spec = FeatureSpec(config.feature_spec)
+        self.root_dir = Path(config.root_dir)
+        self.scaler_path = self.root_dir / config.scaler_name
+        self.model_path = self.root_dir / config.model_name
+
+    # -----------------------------
+    # Reading
+    # -----------------------------
+    def _scan(self):
+        """
+        Returns (columns, header, header_end, data_end): the CSV columns,
+        the raw header line, the byte offset of the first data row and the
+        end of the last complete line (a row still being appended is left
+        for the next run).
+        """
+        with open(self.config.data_path, "rb") as f:
+            header = f.readline()
+            header_end = f.tell()
+
+            size = os.fstat(f.fileno()).st_size
+            data_end = size
+            if size > header_end:
+                f.seek(max(header_end, size - _TAIL_BYTES))
+                tail = f.read()
+                data_end = size - len(tail) + tail.rfind(b"\n") + 1 if b"\n" in tail else header_end
+
+        columns = next(csv.reader([header.decode("utf-8")]))
+        return [c.strip() for c in columns], header, header_end, data_end
+
+    def _tail_sha256(self, header_end: int, offset: int) -> str:
+        with open(self.config.data_path, "rb") as f:
+            start = max(header_end, offset - _TAIL_BYTES)
+            f.seek(start)
+            return _sha256(f.read(offset - start))
+
+    def _chunks(self, columns, start: int, stop: int):
+        """Yields (raw X, y) chunks of the rows in bytes [start, stop)."""
+        if stop <= start:
+            return
+        missing = [c for c in self.feature_spec.raw_columns + [self.config.target_column] if c not in columns]
+        if missing:
+            raise ValueError(f"{self.config.data_path} is missing columns {missing}")
+
+        with open(self.config.data_path, "rb") as f:
+            text = io.TextIOWrapper(io.BufferedReader(_ByteRange(f, start, stop)), encoding="utf-8")
+            for chunk in pd.read_csv(text, header=None, names=columns, chunksize=self.config.chunk_size):
+                yield (
+                    chunk[self.feature_spec.raw_columns].to_numpy(dtype=np.float64),
+                    chunk[self.config.target_column].to_numpy(dtype=np.float64),
+                )
+
+    # -----------------------------
+    # State
+    # -----------------------------
+    def _load_watermark(self):
+        try:
+            with open(self.config.watermark_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _full_refit_reason(self, watermark, header, header_end, data_end):
+        if watermark is None or not (self.scaler_path.exists() and self.model_path.exists()):
+            return "no incremental state yet"
+        if watermark["header_sha256"] != _sha256(header):
+            return "CSV header changed"
+        if watermark["feature_spec_sha256"] != _sha256(self.feature_spec.to_list()):
+            return "feature spec changed"
+        if watermark["model_params_sha256"] != _sha256(self.config.sgd_params):
+            return "SGDRegressor params changed"
+        offset = watermark["byte_offset"]
+        if data_end < offset or self._tail_sha256(header_end, offset) != watermark["tail_sha256"]:
+            return "data file was rewritten, not appended"
+        if self.config.full_refit_every and watermark["batches_since_full_refit"] >= self.config.full_refit_every:
+            return f"{watermark['batches_since_full_refit']} incremental batches since the last full refit"
+        return None
+
+    def _new_model(self) -> SGDRegressor:
+        return SGDRegressor(random_state=self.config.random_state, **self.config.sgd_params)
+
+    # -----------------------------
+    # Training
+    # -----------------------------
+    def _full_refit(self, columns, header_end, data_end):
+        rng = np.random.default_rng(self.config.random_state)
+        scaler = StandardScaler()
+        model = self._new_model()
+
+        # Pass 1: streaming mean / variance
+        rows = 0
+        for X, _ in self._chunks(columns, header_end, data_end):
+            scaler.partial_fit(self.feature_spec.transform(X))
+            rows += X.shape[0]
+        if rows == 0:
+            raise ValueError(f"{self.config.data_path} has no data rows to fit")
+
+        # Passes 2..: SGD epochs over shuffled chunks
+        for _ in range(self.config.full_refit_epochs):
+            for X, y in self._chunks(columns, header_end, data_end):
+                features = scaler.transform(self.feature_spec.transform(X))
+                order = rng.permutation(X.shape[0])
+                model.partial_fit(features[order], y[order])
+
+        return scaler, model, rows, None
+
+    def _update(self, scaler, model, columns, start, stop):
+        rows = 0
+        squared_error = 0.0
+        for X, y in self._chunks(columns, start, stop):
+            features = self.feature_spec.transform(X)
+
+            # Test-then-train: score the batch before learning from it
+            residuals = model.predict(scaler.transform(features)) - y
+            squared_error += float(residuals @ residuals)
+
+            scaler.partial_fit(features)
+            scaled = scaler.transform(features)
+            for _ in range(self.config.epochs_per_batch):
+                model.partial_fit(scaled, y)
+            rows += X.shape[0]
+
+        rmse = float(np.sqrt(squared_error / rows)) if rows else None
+        return scaler, model, rows, rmse
+
+    def run(self) -> dict:
+        """
+        Consumes the rows appended since the last run (or refits fully).
+
+        Returns:
+            dict: The new watermark
+        """
+        start_time = time.perf_counter()
+        os.makedirs(self.root_dir, exist_ok=True)
+
+        columns, header, header_end, data_end = self._scan()
+        watermark = self._load_watermark()
+        reason = self._full_refit_reason(watermark, header, header_end, data_end)
+
+        if reason is None and data_end == watermark["byte_offset"]:
+            logger.info(f"No new rows in {self.config.data_path} since byte {data_end}; nothing to do")
+            return watermark
+
+        if reason is not None:
+            logger.info(f"Incremental training: full refit ({reason})")
+            scaler, model, rows, prequential_rmse = self._full_refit(columns, header_end, data_end)
+            mode, rows_seen, batches_since_full_refit = "full_refit", rows, 0
+            last_full_refit_at = time.time()
+        else:
+            scaler, model, rows, prequential_rmse = self._update(
+                joblib.load(self.scaler_path),
+                joblib.load(self.model_path),
+                columns,
+                watermark["byte_offset"],
+                data_end,
+            )
+            mode = "incremental"
+            rows_seen = watermark["rows_seen"] + rows
+            batches_since_full_refit = watermark["batches_since_full_refit"] + 1
+            last_full_refit_at = watermark["last_full_refit_at"]
+
+        with atomic_write(self.scaler_path, "wb") as f:
+            joblib.dump(scaler, f)
+        with atomic_write(self.model_path, "wb") as f:
+            joblib.dump(model, f)
+
+        version = None
+        if self.config.publish:
+            store = ModelStore(
+                root_dir=self.config.model_store_dir,
+                pointer_name=self.config.current_pointer_name,
+                keep_versions=self.config.keep_versions,
+            )
+            version = publish_model_version(
+                store,
+                model,
+                InferencePipeline.from_fitted(scaler=scaler, model=model, feature_spec=self.feature_spec),
+                model_name=self.config.published_model_name,
+                inference_pipeline_name=self.config.inference_pipeline_name,
+                compiled_model_name=self.config.compiled_model_name,
+            )
+        else:
+            logger.info(f"Model saved at {self.model_path}; not published (incremental_training.publish is false)")
+
+        history = (watermark or {}).get("history", []) if mode == "incremental" else []
+        history.append({
+            "mode": mode,
+            "rows": rows,
+            "byte_range": [header_end if mode == "full_refit" else watermark["byte_offset"], data_end],
+            "prequential_rmse": prequential_rmse,
+            "version": version,
+            "seconds": round(time.perf_counter() - start_time, 3),
+            "at": time.time(),
+        })
+
+        # Written last: it is the commit point of this run
+        new_watermark = {
+            "source": str(self.config.data_path),
+            "header_sha256": _sha256(header),
+            "byte_offset": data_end,
+            "rows_seen": rows_seen,
+            "tail_sha256": self._tail_sha256(header_end, data_end),
+            "feature_spec_sha256": _sha256(self.feature_spec.to_list()),
+            "model_params_sha256": _sha256(self.config.sgd_params),
+            "batches_since_full_refit": batches_since_full_refit,
+            "last_full_refit_at": last_full_refit_at,
+            "updated_at": time.time(),
+            "history": history[-_MAX_HISTORY:],
+        }
+        with atomic_write(self.config.watermark_path) as f:
+            json.dump(new_watermark, f, indent=4)
+
+        logger.info(
+            f"Incremental training ({mode}): {rows} new rows, {rows_seen} total, "
+            f"prequential rmse={prequential_rmse}, version={version}; "
+            f"watermark saved at: {self.config.watermark_path}"
+        )
+        return new_watermark
@@ -0,0 +1,75 @@
+'''InferencePipeline is the single serving artifact produced by training.
+It bundles feature engineering, the fitted StandardScaler statistics and
+the linear model coefficients as plain NumPy arrays, so one batched call
+on a raw (N, 11) matrix gives the final predictions.'''
+
+import numpy as np
+
+from Red_Wine_Prediction.components.feature_engineering import DEFAULT_FEATURES, as_feature_spec
+
+
+class InferencePipeline:
+    """
+    Fitted feature engineering + scaling + linear model.
+
+    - built from the fitted scaler and model at the end of training
+    - holds only NumPy arrays (no sklearn objects), so unpickling is cheap
+    - predict() is one feature pass and one matrix-vector product per batch
+    """
+
+    def __init__(self, mean, scale, coef, intercept, clip_range=(3, 8), feature_spec=None):
+        self.feature_spec = as_feature_spec(feature_spec)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.coef = np.asarray(coef, dtype=np.float64).ravel()
+        self.intercept = float(np.ravel(intercept)[0])
+        self.clip_range = clip_range
+        self.raw_columns = list(self.feature_spec.raw_columns)
+        self.feature_columns = list(self.feature_spec.feature_columns)
+
+        n_features = len(self.feature_columns)
+        if not (self.mean.shape == self.scale.shape == self.coef.shape == (n_features,)):
+            raise ValueError(
+                f"Scaler/model expect {self.coef.shape[0]} features, "
+                f"feature engineering produces {n_features}"
+            )
+
+    def __setstate__(self, state):
+        # Pipelines pickled before the feature spec existed used the defaults
+        state.setdefault("feature_spec", DEFAULT_FEATURES)
+        self.__dict__.update(state)
+
+    @classmethod
+    def from_fitted(cls, scaler, model, clip_range=(3, 8), feature_spec=None) -> "InferencePipeline":
+        """
+        Builds the pipeline from a fitted StandardScaler and a fitted linear
+        model (anything exposing coef_ and intercept_), for the features
+        produced by `feature_spec` (defaults to DEFAULT_FEATURE_SPEC).
+        """
+        return cls(
+            mean=scaler.mean_,
+            scale=scaler.scale_,
+            coef=model.coef_,
+            intercept=model.intercept_,
+            clip_range=clip_range,
+            feature_spec=feature_spec,
+        )
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """Raw (N, R) -> engineered and scaled (N, R + E)."""
+        features = self.feature_spec.transform(X)
+        features -= self.mean
+        features /= self.scale
+        return features
+
+    def score(self, features: np.ndarray) -> np.ndarray:
+        """Transformed (N, R + E) -> clipped quality predictions (N,)."""
+        prediction = features @ self.coef
+        prediction += self.intercept
+        if self.clip_range is not None:
+            np.clip(prediction, *self.clip_range, out=prediction)
+        return prediction
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Raw (N, R) -> clipped quality predictions (N,)."""
+        return self.score(self.transform(X))
@@ -0,0 +1,395 @@
+'''Streaming, resumable and verified file fetching for data ingestion.
+
+fetch() copies one source to a local file:
+
+- sources are http(s):// URLs, file:// URLs or local paths; a local
+  directory source (or the configured offline mirror) is searched for a
+  file named like the source or the destination, so ingestion can run
+  offline
+- data is streamed in fixed-size chunks into "<destination>.part" and
+  renamed over the destination only once complete and verified, so a
+  file at the destination is never a truncated download
+- an existing destination is reused if it matches the configured digest;
+  without one, an existing .zip is reused only if it reads back intact
+  (older downloads were written in place and may be truncated)
+- an interrupted download is resumed from the .part file with an HTTP
+  Range request (or a seek for local sources); servers that ignore Range
+  restart it from zero
+- the SHA-256 is computed while streaming and compared with the
+  configured digest; a mismatch discards the download
+- each socket operation is bounded by a timeout, and failed transfers are
+  retried with exponential backoff
+
+Every call returns a record with the bytes transferred, time and
+throughput.
+
+ZIP archives:
+
+- extract_members() writes only the configured members, and skips any
+  member whose file on disk already has the member's size and CRC-32
+  (cached by size + mtime in a manifest, so unchanged files are not
+  re-read)
+- a dataset path may point inside an archive, "<archive>.zip/<member>"
+  (the zipimport convention); open_dataset() then streams the member
+  straight out of the archive, with no extracted copy on disk'''
+
+import hashlib
+import http.client
+import json
+import os
+import shutil
+import time
+import urllib.error
+import urllib.request
+import zipfile
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.utils.common import atomic_write
+
+
+class ChecksumError(ValueError):
+    """Downloaded bytes do not match the configured SHA-256."""
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def zip_intact(path: Path) -> bool:
+    """True unless `path` is a .zip whose directory or member CRCs fail."""
+    if Path(path).suffix.lower() != ".zip":
+        return True
+    try:
+        with zipfile.ZipFile(path) as zf:
+            return zf.testzip() is None
+    except (zipfile.BadZipFile, EOFError, OSError):
+        return False
+
+
+def source_name(source: str) -> str:
+    """Base file name of a URL or path source."""
+    return Path(unquote(urlparse(source).path) if "://" in source else source).name
+
+
+def resolve_local_source(source: str, names: list, mirror_dir: Optional[str] = None) -> Optional[Path]:
+    """
+    Local file backing `source`, or None for a remote source.
+
+    Order: the offline mirror, then file:// URLs, local directories and
+    local files. Directories are searched for the first of `names` (e.g.
+    the source's and the destination's base names) that exists.
+
+    Raises:
+        FileNotFoundError: If a mirror-less file:// / local source does not exist
+    """
+    def lookup(directory: Path) -> Optional[Path]:
+        for name in names:
+            if (directory / name).is_file():
+                return directory / name
+        return None
+
+    if mirror_dir:
+        mirrored = lookup(Path(mirror_dir))
+        if mirrored is not None:
+            return mirrored
+
+    scheme = urlparse(source).scheme.lower()
+    if scheme in ("http", "https"):
+        return None
+    path = Path(unquote(urlparse(source).path)) if scheme == "file" else Path(source)
+    if path.is_dir():
+        found = lookup(path)
+        if found is None:
+            raise FileNotFoundError(f"None of {names} found in source directory {path}")
+        return found
+    if not path.is_file():
+        raise FileNotFoundError(f"Source {source!r} does not exist")
+    return path
+
+
+def _open_stream(source: str, local: Optional[Path], offset: int, timeout: float):
+    """
+    Returns (readable, resumed, total_bytes or None) positioned at `offset`
+    when resuming is possible, at 0 otherwise.
+    """
+    if local is not None:
+        f = open(local, "rb")
+        f.seek(offset)
+        return f, offset > 0, os.fstat(f.fileno()).st_size
+
+    request = urllib.request.Request(source, headers={"User-Agent": "Red_Wine_Prediction-ingestion"})
+    if offset:
+        request.add_header("Range", f"bytes={offset}-")
+    try:
+        response = urllib.request.urlopen(request, timeout=timeout)
+    except urllib.error.HTTPError as e:
+        if e.code == 416 and offset:
+            # Nothing past `offset`: the partial file is already complete
+            return _EmptyStream(), True, offset
+        raise
+
+    length = response.headers.get("Content-Length")
+    if response.status == 206:
+        content_range = response.headers.get("Content-Range", "")
+        total = content_range.rsplit("/", 1)[-1]
+        total = int(total) if total.isdigit() else (offset + int(length) if length else None)
+        return response, True, total
+    return response, False, int(length) if length else None
+
+
+class _EmptyStream:
+    def read(self, size=-1) -> bytes:
+        return b""
+
+    def close(self) -> None:
+        pass
+
+
+def fetch(
+    source: str,
+    destination: Path,
+    sha256: Optional[str] = None,
+    mirror_dir: Optional[str] = None,
+    timeout: float = 30.0,
+    chunk_size: int = 1 << 20,
+    retries: int = 3,
+) -> dict:
+    """
+    Streams `source` to `destination` (see module docstring).
+
+    Args:
+        source (str): http(s):// or file:// URL, local file or directory
+        destination (Path): Local file to create
+        sha256 (str, optional): Expected hex digest; None skips the check
+        mirror_dir (str, optional): Offline mirror searched first
+        timeout (float): Seconds per connect / read
+        chunk_size (int): Bytes per streamed read
+        retries (int): Extra attempts after a failed transfer
+
+    Returns:
+        dict: Fetch record (bytes, seconds, throughput, whether it was
+            cached / resumed and the digest)
+
+    Raises:
+        ChecksumError: If the fetched bytes do not match `sha256`
+    """
+    destination = Path(destination)
+    sha256 = sha256.lower() if sha256 else None
+    record = {"source": source, "path": str(destination), "cached": False, "resumed": False}
+
+    # -----------------------------
+    # Already fetched?
+    # -----------------------------
+    # Without a digest, an archive must at least read back intact: files
+    # written before downloads went through .part may be truncated
+    if destination.exists():
+        if sha256:
+            digest = file_sha256(destination)
+            reusable, problem = digest == sha256, "does not match the configured SHA-256"
+        else:
+            digest = None
+            reusable, problem = zip_intact(destination), "is not a readable ZIP archive"
+        if reusable:
+            record.update(cached=True, bytes=destination.stat().st_size, sha256=digest,
+                          downloaded_bytes=0, seconds=0.0, throughput_mb_s=None)
+            logger.info(f"{destination} already fetched ({destination.stat().st_size} bytes); skipping")
+            return record
+        logger.warning(f"{destination} {problem}; fetching again")
+        os.remove(destination)
+
+    local = resolve_local_source(source, [source_name(source), destination.name], mirror_dir)
+    if local is not None and local.resolve() == destination.resolve():
+        raise ValueError(f"Source and destination are the same file: {destination}")
+    record["read_from"] = str(local) if local is not None else source
+    os.makedirs(destination.parent, exist_ok=True)
+    part_path = destination.with_name(destination.name + ".part")
+
+    start = time.perf_counter()
+    downloaded = 0
+    for attempt in range(retries + 1):
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        try:
+            stream, resumed, total = _open_stream(source, local, offset, timeout)
+            try:
+                digest = hashlib.sha256()
+                if resumed:
+                    # Hash the bytes kept from the earlier attempt
+                    with open(part_path, "rb") as f:
+                        for block in iter(lambda: f.read(chunk_size), b""):
+                            digest.update(block)
+                else:
+                    offset = 0
+                record["resumed"] = record["resumed"] or (resumed and offset > 0)
+
+                with open(part_path, "ab" if resumed else "wb") as out:
+                    for block in iter(lambda: stream.read(chunk_size), b""):
+                        out.write(block)
+                        digest.update(block)
+                        downloaded += len(block)
+                    size = out.tell()
+            finally:
+                stream.close()
+
+            if total is not None and size != total:
+                raise ConnectionError(f"Transfer ended at byte {size} of {total}")
+            break
+        except (OSError, http.client.HTTPException) as e:
+            if isinstance(e, urllib.error.HTTPError) and e.code < 500 and e.code != 408:
+                raise
+            if attempt == retries:
+                raise
+            wait = 2 ** attempt
+            logger.warning(f"Fetching {source} failed ({e}); resuming in {wait}s "
+                           f"(attempt {attempt + 2}/{retries + 1})")
+            time.sleep(wait)
+
+    hexdigest = digest.hexdigest()
+    if sha256 and hexdigest != sha256:
+        os.remove(part_path)
+        raise ChecksumError(f"SHA-256 of {source} is {hexdigest}, expected {sha256}")
+    os.replace(part_path, destination)
+
+    seconds = time.perf_counter() - start
+    throughput = downloaded / 2**20 / seconds if seconds > 0 else None
+    record.update(bytes=size, downloaded_bytes=downloaded, seconds=round(seconds, 3),
+                  throughput_mb_s=round(throughput, 3) if throughput else None, sha256=hexdigest)
+    logger.info(
+        f"Fetched {record['read_from']} -> {destination}: {size} bytes "
+        f"({downloaded} transferred{', resumed' if record['resumed'] else ''}) in {seconds:.2f}s"
+        + (f", {throughput:.2f} MB/s" if throughput else "")
+    )
+    return record
+
+
+# -----------------------------
+# ZIP archives
+# -----------------------------
+def split_archive_path(path) -> Tuple[Path, Optional[str]]:
+    """
+    Splits "<archive>.zip/<member>" into (archive, member); any other path
+    is returned as (path, None).
+    """
+    path = Path(path)
+    parts = path.parts
+    for i in range(len(parts) - 1):
+        candidate = Path(*parts[:i + 1])
+        if candidate.suffix.lower() == ".zip" and candidate.is_file():
+            return candidate, "/".join(parts[i + 1:])
+    return path, None
+
+
+def dataset_file(path) -> Path:
+    """The file backing a dataset path: the archive for archive members."""
+    return split_archive_path(path)[0]
+
+
+@contextmanager
+def open_dataset(path):
+    """
+    Opens a dataset path for binary streaming reads (e.g. by
+    pd.read_csv). Archive members are decompressed on the fly; zipfile
+    checks their CRC-32 once fully read.
+    """
+    archive, member = split_archive_path(path)
+    if member is None:
+        with open(archive, "rb") as f:
+            yield f
+        return
+    with zipfile.ZipFile(archive) as zf, zf.open(member) as f:
+        yield f
+
+
+def file_crc32(path: Path, chunk_size: int = 1 << 20) -> int:
+    crc = 0
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            crc = zlib.crc32(block, crc)
+    return crc
+
+
+def extract_members(
+    zip_path: Path,
+    unzip_dir: Path,
+    members: Optional[List[str]] = None,
+    manifest_path: Optional[Path] = None,
+    chunk_size: int = 1 << 20,
+) -> dict:
+    """
+    Extracts `members` (all when empty) of a ZIP archive into unzip_dir,
+    streaming each one and skipping members already on disk with the
+    same size and CRC-32.
+
+    Args:
+        manifest_path (Path, optional): JSON cache of the CRC-32 of
+            extracted files, keyed by member, so files whose size and
+            mtime are unchanged are not re-read
+
+    Returns:
+        dict: {"extracted": [...], "unchanged": [...]} member names
+
+    Raises:
+        KeyError: If a requested member is not in the archive
+        ValueError: If a member would be written outside unzip_dir
+    """
+    unzip_dir = Path(unzip_dir)
+    os.makedirs(unzip_dir, exist_ok=True)
+    manifest = {}
+    if manifest_path is not None and Path(manifest_path).exists():
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+    result = {"extracted": [], "unchanged": []}
+    with zipfile.ZipFile(zip_path) as zf:
+        infos = [info for info in zf.infolist() if not info.is_dir()]
+        if members:
+            by_name = {info.filename: info for info in infos}
+            missing = [m for m in members if m not in by_name]
+            if missing:
+                raise KeyError(f"{zip_path} has no member(s) {missing}; it contains {sorted(by_name)}")
+            infos = [by_name[m] for m in members]
+
+        root = unzip_dir.resolve()
+        for info in infos:
+            target = (unzip_dir / info.filename).resolve()
+            if root not in target.parents:
+                raise ValueError(f"Refusing to extract {info.filename!r} outside {unzip_dir}")
+
+            if target.exists():
+                st = target.stat()
+                cached = manifest.get(info.filename)
+                if cached and cached["size"] == st.st_size and cached["mtime_ns"] == st.st_mtime_ns:
+                    crc = cached["crc"]
+                elif st.st_size == info.file_size:
+                    crc = file_crc32(target, chunk_size)
+                else:
+                    crc = None
+                if st.st_size == info.file_size and crc == info.CRC:
+                    manifest[info.filename] = {"crc": crc, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+                    result["unchanged"].append(info.filename)
+                    continue
+
+            with zf.open(info) as src, atomic_write(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, chunk_size)
+            st = target.stat()
+            manifest[info.filename] = {"crc": info.CRC, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+            result["extracted"].append(info.filename)
+
+    if manifest_path is not None:
+        with atomic_write(manifest_path) as f:
+            json.dump(manifest, f, indent=4)
+
+    logger.info(
+        f"{zip_path}: extracted {result['extracted'] or 'nothing'}"
+        + (f", unchanged {result['unchanged']}" if result["unchanged"] else "")
+        + f" in {unzip_dir}"
+    )
+    return result
@@ -7,8 +7,14 @@ from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 from urllib.parse import urlparse 
 import numpy as np 
 import joblib 
+import json
+import time
+from Red_Wine_Prediction import logger
 from Red_Wine_Prediction.entity.config_entity import ModelEvaluationConfig
 from Red_Wine_Prediction.utils.common import save_json
+from Red_Wine_Prediction.utils.artifact_io import load_xy, matrix_source
+from Red_Wine_Prediction.utils.stage_metrics import add_rows
+from Red_Wine_Prediction.components.cross_validation import bootstrap_metrics, corrected_cv_interval, repeated_kfold
 
 class ModelEvaluation:
     def __init__(self,config: ModelEvaluationConfig):
@@ -23,13 +29,13 @@ class ModelEvaluation:
     
     def save_results(self):
         
-        test_data =pd.read_csv(self.config.test_data_path)
+        # Memory-mapped for npy artifacts: no parsing, no copy
+        test_x, test_y, _ = load_xy(
+            self.config.test_data_path, self.config.artifact_format, self.config.target_column
+        )
+        add_rows(test_x.shape[0])
         model= joblib.load(self.config.model_path)
         
-        
-        test_x =test_data.drop([self.config.target_column],axis=1)
-        test_y= test_data[[self.config.target_column]]
-        
         predicted_qualities=model.predict(test_x)
         
         (rmse,mae,r2) =self.eval_metrics(test_y,predicted_qualities)
@@ -38,4 +44,146 @@ class ModelEvaluation:
         
         score ={"rmse":rmse,"mae":mae,"r2":r2}
         
-        save_json(path=Path(self.config.metric_file_name),data=score)
\ No newline at end of file
+        # Holdout point estimates above stay at the top level; bootstrap CIs
+        # and cross-validation add the uncertainty around them
+        score["confidence"] = self.config.confidence
+        score["holdout"] = bootstrap_metrics(
+            test_y,
+            predicted_qualities,
+            n_resamples=self.config.bootstrap_resamples,
+            confidence=self.config.confidence,
+            random_state=self.config.random_state,
+        )
+        if self.config.cv_enabled:
+            score["cross_validation"] = self.cross_validate(model)
+        
+        save_json(path=Path(self.config.metric_file_name),data=score)
+    
+    
+    def cross_validate(self, model) -> dict:
+        """
+        Repeated k-fold CV of the trained model's estimator over the train and
+        test splits (scaler refitted per fold), with Nadeau-Bengio corrected
+        t intervals of the mean fold scores.
+        """
+        start = time.perf_counter()
+        train_source, n_train = matrix_source(
+            self.config.train_data_path, self.config.artifact_format, self.config.target_column
+        )
+        test_source, n_test = matrix_source(
+            self.config.test_data_path, self.config.artifact_format, self.config.target_column
+        )
+        
+        fold_scores = repeated_kfold(
+            model,
+            [train_source, test_source],
+            n_rows=n_train + n_test,
+            n_splits=self.config.cv_n_splits,
+            n_repeats=self.config.cv_n_repeats,
+            n_jobs=self.config.cv_n_jobs,
+            random_state=self.config.random_state,
+        )
+        
+        result = {
+            "n_splits": self.config.cv_n_splits,
+            "n_repeats": self.config.cv_n_repeats,
+            "rows": n_train + n_test,
+            "preprocessing": "StandardScaler refitted on each fold's training rows",
+            "ci_method": "Nadeau-Bengio corrected t interval over correlated fold scores",
+        }
+        for name, scores in fold_scores.items():
+            ci_low, ci_high = corrected_cv_interval(
+                scores, n_splits=self.config.cv_n_splits, confidence=self.config.confidence
+            )
+            result[name] = {
+                "mean": float(scores.mean()),
+                "std": float(scores.std(ddof=1)),
+                "ci_low": ci_low,
+                "ci_high": ci_high,
+            }
+        result["seconds"] = round(time.perf_counter() - start, 3)
+        
+        logger.info(
+            f"{self.config.cv_n_repeats}x{self.config.cv_n_splits}-fold CV: "
+            f"rmse {result['rmse']['mean']:.4f} [{result['rmse']['ci_low']:.4f}, {result['rmse']['ci_high']:.4f}], "
+            f"r2 {result['r2']['mean']:.4f} [{result['r2']['ci_low']:.4f}, {result['r2']['ci_high']:.4f}] "
+            f"in {result['seconds']}s"
+        )
+        return result
+    
+    
+    def _predict_latency(self, model, test_x):
+        """
+        Per-row predict latency in microseconds:
+        - batch: best of 3 full-test-set predicts, divided by the row count
+        - single_row: median of single-row predicts (the /predict case)
+        """
+        batch_seconds = min(
+            self._timed(model.predict, test_x) for _ in range(3)
+        )
+        n_single = min(200, test_x.shape[0])
+        single_seconds = np.median([
+            self._timed(model.predict, test_x[i:i + 1]) for i in range(n_single)
+        ])
+        return batch_seconds / test_x.shape[0] * 1e6, float(single_seconds) * 1e6
+    
+    @staticmethod
+    def _timed(fn, *args):
+        start = time.perf_counter()
+        fn(*args)
+        return time.perf_counter() - start
+    
+    
+    def benchmark_model_zoo(self):
+        """
+        Scores every model of the zoo on the test split and records accuracy
+        next to serving cost: fit time, peak RSS of the fitting worker, size on disk, load
+        time and per-row predict latency.
+        """
+        if not self.config.zoo_enabled:
+            return None
+        
+        with open(self.config.zoo_manifest_path) as f:
+            manifest = json.load(f)
+        
+        test_x, test_y, _ = load_xy(
+            self.config.test_data_path, self.config.artifact_format, self.config.target_column
+        )
+        test_x = np.ascontiguousarray(test_x)
+        
+        rows = []
+        for name, record in manifest["models"].items():
+            start = time.perf_counter()
+            model = joblib.load(record["path"])
+            load_seconds = time.perf_counter() - start
+            
+            rmse, mae, r2 = self.eval_metrics(test_y, model.predict(test_x))
+            batch_us, single_us = self._predict_latency(model, test_x)
+            rows.append({
+                "model": name,
+                "type": record["type"],
+                "rmse": rmse,
+                "mae": mae,
+                "r2": r2,
+                "fit_seconds": record["fit_seconds"],
+                "worker_peak_rss_mb": record.get("worker_peak_rss_mb"),
+                "size_bytes": record["size_bytes"],
+                "load_seconds": load_seconds,
+                "batch_latency_us_per_row": batch_us,
+                "single_row_latency_us": single_us,
+            })
+        
+        rows.sort(key=lambda row: row["rmse"])
+        save_json(path=Path(self.config.benchmark_file_name), data={"test_rows": int(test_x.shape[0]), "models": rows})
+        
+        header = f"{'model':<24}{'rmse':>8}{'r2':>8}{'fit s':>9}{'wkr RSS MB':>11}{'size KB':>10}{'us/row':>9}{'1-row us':>10}"
+        lines = [header, "-" * len(header)]
+        for row in rows:
+            peak = row["worker_peak_rss_mb"]
+            lines.append(
+                f"{row['model']:<24}{row['rmse']:>8.4f}{row['r2']:>8.4f}{row['fit_seconds']:>9.3f}"
+                f"{(f'{peak:.1f}' if peak is not None else '-'):>11}{row['size_bytes'] / 1024:>10.1f}"
+                f"{row['batch_latency_us_per_row']:>9.2f}{row['single_row_latency_us']:>10.1f}"
+            )
+        logger.info("Model zoo benchmark:\n" + "\n".join(lines))
+        return rows
@@ -0,0 +1,111 @@
+'''Versioned, atomically published model artifacts.
+
+Layout under the model_trainer root directory:
+
+    versions/<version>/            immutable, one directory per training run
+    current.json                   pointer to the version being served
+
+A version is written into a hidden staging directory, renamed into place
+in one step, and only then published by atomically replacing current.json.
+Readers following the pointer therefore never see a partial version.'''
+
+import json
+import os
+import shutil
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.utils.common import atomic_write
+
+
+class ModelStore:
+    """
+    ModelStore handles:
+    - Creating a new immutable version directory
+    - Publishing it via the "current" pointer file
+    - Resolving the currently published version
+    - Pruning old versions
+    """
+
+    def __init__(self, root_dir: Path, pointer_name: str = "current.json", keep_versions: int = 5):
+        self.root_dir = Path(root_dir)
+        self.versions_dir = self.root_dir / "versions"
+        self.pointer_path = self.root_dir / pointer_name
+        self.keep_versions = keep_versions
+
+    @contextmanager
+    def new_version(self):
+        """
+        Yields (version, directory) for a new version. The version is
+        published only if the block exits without an exception.
+        """
+        version = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        staging_dir = self.versions_dir / f".{version}.partial"
+        os.makedirs(staging_dir)
+        try:
+            yield version, staging_dir
+            os.rename(staging_dir, self.versions_dir / version)
+        except BaseException:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+
+        self.publish(version)
+
+    def publish(self, version: str) -> None:
+        """Atomically points current.json at an existing version."""
+        if not (self.versions_dir / version).is_dir():
+            raise FileNotFoundError(f"Model version {version} does not exist in {self.versions_dir}")
+
+        with atomic_write(self.pointer_path) as f:
+            json.dump(
+                {
+                    "version": version,
+                    "path": f"versions/{version}",
+                    "published_at": time.time(),
+                },
+                f,
+                indent=4,
+            )
+        logger.info(f"Published model version {version} -> {self.pointer_path}")
+        self.prune()
+
+    def prune(self) -> None:
+        """Removes all but the newest keep_versions versions (never the current one)."""
+        current = self.current()
+        current_version = current["version"] if current else None
+
+        versions = sorted(
+            p.name for p in self.versions_dir.iterdir()
+            if p.is_dir() and not p.name.startswith(".")
+        )
+        for version in versions[:-self.keep_versions] if self.keep_versions > 0 else []:
+            if version != current_version:
+                shutil.rmtree(self.versions_dir / version, ignore_errors=True)
+                logger.info(f"Pruned model version {version}")
+
+    def current(self) -> Optional[dict]:
+        """Returns the pointer content plus the resolved version directory."""
+        return read_model_pointer(self.pointer_path)
+
+
+def read_model_pointer(pointer_path: Path) -> Optional[dict]:
+    """
+    Reads a current.json pointer.
+
+    Returns:
+        dict: {"version", "path", "published_at", "dir"} or None if no
+            version has been published yet
+    """
+    pointer_path = Path(pointer_path)
+    try:
+        with open(pointer_path) as f:
+            pointer = json.load(f)
+    except FileNotFoundError:
+        return None
+
+    pointer["dir"] = pointer_path.parent / pointer["path"]
+    return pointer
@@ -1,4 +1,5 @@
 
+import json
 import pandas as pd
 import os 
 from Red_Wine_Prediction import logger 
@@ -7,6 +8,16 @@ from sklearn.linear_model import ElasticNet
 import joblib
 
 from Red_Wine_Prediction.entity.config_entity import ModelTrainerConfig
+from Red_Wine_Prediction.components.inference_pipeline import InferencePipeline
+from Red_Wine_Prediction.components.feature_engineering import FeatureSpec
+from Red_Wine_Prediction.components.compiled_linear_model import CompiledLinearModel
+from Red_Wine_Prediction.components.model_store import ModelStore
+from Red_Wine_Prediction.components.out_of_core import fit_elasticnet_out_of_core
+from Red_Wine_Prediction.utils.common import atomic_write
+from Red_Wine_Prediction.utils.artifact_io import load_xy
+from Red_Wine_Prediction.utils.stage_metrics import add_rows
+from Red_Wine_Prediction.components.feature_store import FeatureStore, scaler_fingerprint
+from pathlib import Path
 
 
 
@@ -16,18 +27,99 @@ class ModelTrainer:
 
     
     def train(self):
-        train_data = pd.read_csv(self.config.train_data_path)
-        test_data = pd.read_csv(self.config.test_data_path)
+        scaler = joblib.load(self.config.scaler_path)
 
+        # Memory-mapped for npy artifacts: no parsing, no copy
+        if self.config.artifact_format == "npy":
+            train_path = Path(self.config.train_data_path)
+            feature_set = FeatureStore(train_path.parent).open(
+                train_path.name, expected_scaler_fingerprint=scaler_fingerprint(scaler)
+            )
+            train_x, train_y, feature_columns = feature_set.X, feature_set.y, feature_set.feature_columns
+        else:
+            train_x, train_y, feature_columns = load_xy(
+                self.config.train_data_path, self.config.artifact_format, self.config.target_column
+            )
 
-        train_x = train_data.drop([self.config.target_column], axis=1)
-        test_x = test_data.drop([self.config.target_column], axis=1)
-        train_y = train_data[[self.config.target_column]]
-        test_y = test_data[[self.config.target_column]]
+        add_rows(train_x.shape[0])
 
+        feature_spec = FeatureSpec(self.config.feature_spec)
+        if feature_columns != feature_spec.feature_columns:
+            raise ValueError(
+                f"Training matrix columns {feature_columns} do not match the configured "
+                f"feature spec {feature_spec.feature_columns}; rerun data transformation"
+            )
 
-        lr = ElasticNet(alpha=self.config.alpha, l1_ratio=self.config.l1_ratio, random_state=42)
-        lr.fit(train_x, train_y)
 
-        joblib.dump(lr, os.path.join(self.config.root_dir, self.config.model_name))
+        alpha, l1_ratio = self.config.alpha, self.config.l1_ratio
+        if self.config.use_tuned_params:
+            # Best CV params from the hyperparameter tuning stage
+            with open(self.config.tuned_params_path) as f:
+                tuned = json.load(f)
+            alpha, l1_ratio = tuned["alpha"], tuned["l1_ratio"]
+            logger.info(f"Using tuned ElasticNet params alpha={alpha}, l1_ratio={l1_ratio}")
 
+        if self.config.out_of_core:
+            # One pass over memory-mapped chunks; memory is O(features²)
+            lr = fit_elasticnet_out_of_core(
+                train_x, train_y, alpha=alpha, l1_ratio=l1_ratio,
+                chunk_size=self.config.chunk_size, random_state=42,
+            )
+        else:
+            lr = ElasticNet(alpha=alpha, l1_ratio=l1_ratio, random_state=42)
+            lr.fit(train_x, train_y)
+
+        # Flat copy read by the evaluation stage; atomic so a concurrent reader
+        # never sees a half-written file
+        with atomic_write(os.path.join(self.config.root_dir, self.config.model_name), "wb") as f:
+            joblib.dump(lr, f)
+
+        # Single serving artifact: feature engineering + scaler + coefficients
+        inference_pipeline = InferencePipeline.from_fitted(
+            scaler=scaler, model=lr, feature_spec=feature_spec
+        )
+
+        store = ModelStore(
+            root_dir=self.config.root_dir,
+            pointer_name=self.config.current_pointer_name,
+            keep_versions=self.config.keep_versions,
+        )
+        publish_model_version(
+            store,
+            lr,
+            inference_pipeline,
+            model_name=self.config.model_name,
+            inference_pipeline_name=self.config.inference_pipeline_name,
+            compiled_model_name=self.config.compiled_model_name,
+        )
+
+
+
+def publish_model_version(
+    store: ModelStore,
+    model,
+    inference_pipeline: InferencePipeline,
+    model_name: str,
+    inference_pipeline_name: str,
+    compiled_model_name: str,
+) -> str:
+    """
+    Writes the serving artifacts of a fitted linear model into a new
+    immutable version directory, which is published (current.json) only
+    once every file is in place. Shared by the batch and incremental
+    trainers.
+
+    Returns:
+        str: The published version
+    """
+    with store.new_version() as (version, version_dir):
+        joblib.dump(model, version_dir / model_name)
+        joblib.dump(inference_pipeline, version_dir / inference_pipeline_name)
+
+        # Scaler folded into the coefficients: NumPy/JSON-only serving artifact
+        CompiledLinearModel.from_inference_pipeline(inference_pipeline).save(
+            version_dir / compiled_model_name
+        )
+
+    logger.info(f"Model version {version} saved at: {store.versions_dir / version}")
+    return version
@@ -0,0 +1,209 @@
+'''Model zoo: a registry of regressors that can be trained side by side
+with the served ElasticNet and benchmarked on accuracy vs serving cost.
+
+Candidates are declared in params.yaml (model_zoo.models) by registry type
+or by a "package.module:Class" path, with their constructor params:
+
+    random_forest: {type: random_forest, params: {n_estimators: 200}}
+    my_model:      {type: "my_pkg.models:MyRegressor", params: {...}}
+
+ModelZooTrainer fits every candidate concurrently on a process pool, one
+fresh process per candidate, so each fit's wall time and the worker's
+peak RSS are measured in isolation. The peak RSS covers the whole worker
+(interpreter, imports and data as well as the fit), not the model alone.
+Fitted models and their fit records are written to the zoo directory;
+ModelEvaluation adds accuracy, latency and size.
+
+The zoo is for benchmarking only: serving keeps using the model published
+by the model trainer stage.'''
+
+import importlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Union
+
+import joblib
+
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.entity.config_entity import ModelZooConfig
+from Red_Wine_Prediction.utils.artifact_io import matrix_source, open_matrix_source
+from Red_Wine_Prediction.utils.common import atomic_write, process_pool_context
+from Red_Wine_Prediction.utils.stage_metrics import add_rows
+
+
+# -----------------------------
+# Registry
+# -----------------------------
+# type name → "module:Class" (imported lazily) or a factory callable
+MODEL_REGISTRY = {
+    "elasticnet": "sklearn.linear_model:ElasticNet",
+    "lasso": "sklearn.linear_model:Lasso",
+    "ridge": "sklearn.linear_model:Ridge",
+    "linear_regression": "sklearn.linear_model:LinearRegression",
+    "random_forest": "sklearn.ensemble:RandomForestRegressor",
+    "extra_trees": "sklearn.ensemble:ExtraTreesRegressor",
+    "hist_gradient_boosting": "sklearn.ensemble:HistGradientBoostingRegressor",
+    "knn": "sklearn.neighbors:KNeighborsRegressor",
+    "svr": "sklearn.svm:SVR",
+}
+
+
+def register_model(name: str, factory: Union[str, Callable]) -> None:
+    """
+    Adds a model type to the registry.
+
+    Args:
+        name (str): Type name used in params.yaml
+        factory: "module:Class" path or a callable taking the params as kwargs
+    """
+    MODEL_REGISTRY[name] = factory
+
+
+def resolve_model(model_type: str) -> Callable:
+    """
+    Returns the class / factory of a registered (or "module:Class") type.
+
+    Raises:
+        ValueError: If the type is neither registered nor a "module:Class" path
+    """
+    factory = MODEL_REGISTRY.get(model_type, model_type)
+    if isinstance(factory, str):
+        if ":" not in factory:
+            raise ValueError(
+                f"Unknown model type {model_type!r}; expected one of {sorted(MODEL_REGISTRY)} "
+                f"or a 'package.module:Class' path"
+            )
+        module_name, class_name = factory.split(":", 1)
+        factory = getattr(importlib.import_module(module_name), class_name)
+    return factory
+
+
+# -----------------------------
+# Worker side (one fresh process per candidate)
+# -----------------------------
+def _peak_rss_bytes():
+    try:
+        import resource
+    except ImportError:   # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _fit_candidate(task) -> dict:
+    """
+    Fits one candidate and saves it.
+
+    Args:
+        task: (name, model_type, factory, params, source, model_path);
+            factory is resolved by the parent so models registered at
+            runtime work in the worker too; source as returned by
+            matrix_source
+
+    Returns:
+        dict: Fit record (fit time, worker peak RSS, size on disk)
+    """
+    name, model_type, factory, params, source, model_path = task
+    X, y = open_matrix_source(source)
+    model = factory(**params)
+
+    start = time.perf_counter()
+    model.fit(X, y)
+    fit_seconds = time.perf_counter() - start
+    peak_rss = _peak_rss_bytes()
+
+    with atomic_write(model_path, "wb") as f:
+        joblib.dump(model, f)
+
+    return {
+        "name": name,
+        "type": model_type,
+        "params": params,
+        "path": str(model_path),
+        "fit_seconds": fit_seconds,
+        # Peak RSS of the worker process after the fit (None where unsupported)
+        "worker_peak_rss_mb": peak_rss / 2**20 if peak_rss is not None else None,
+        "size_bytes": os.path.getsize(model_path),
+    }
+
+
+def _fit_in_fresh_processes(tasks: list, n_workers: int) -> list:
+    """Runs _fit_candidate for every task, each in a new process."""
+    context = process_pool_context()
+    if sys.version_info >= (3, 11):
+        # max_tasks_per_child=1: a fresh process per candidate, so peak
+        # memory is not inflated by earlier fits
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=context, max_tasks_per_child=1) as pool:
+            return list(pool.map(_fit_candidate, tasks))
+
+    # max_tasks_per_child is 3.11+: a single-use pool per candidate, at most
+    # n_workers of them at a time
+    def fit_one(task):
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            return pool.submit(_fit_candidate, task).result()
+
+    with ThreadPoolExecutor(max_workers=n_workers) as threads:
+        return list(threads.map(fit_one, tasks))
+
+
+# -----------------------------
+# Driver
+# -----------------------------
+class ModelZooTrainer:
+    """
+    ModelZooTrainer handles:
+    - Building every configured candidate from the registry
+    - Fitting them concurrently, one isolated process each
+    - Saving the fitted models and the zoo manifest
+    """
+
+    def __init__(self, config: ModelZooConfig):
+        self.config = config
+
+    def train(self) -> dict:
+        root_dir = Path(self.config.root_dir)
+        os.makedirs(root_dir, exist_ok=True)
+
+        source, n_rows = matrix_source(
+            self.config.train_data_path, self.config.artifact_format, self.config.target_column
+        )
+        add_rows(n_rows)
+        # Resolving here fails fast on unknown types before any process starts
+        tasks = [
+            (
+                name,
+                spec["type"],
+                resolve_model(spec["type"]),
+                dict(spec.get("params") or {}),
+                source,
+                root_dir / f"{name}.joblib",
+            )
+            for name, spec in self.config.models.items()
+        ]
+
+        n_workers = max(1, min(self.config.max_workers or os.cpu_count() or 1, len(tasks)))
+        logger.info(f"Training {len(tasks)} zoo models on {n_rows} rows with {n_workers} worker(s)")
+
+        start = time.perf_counter()
+        records = _fit_in_fresh_processes(tasks, n_workers)
+
+        manifest = {
+            "rows": n_rows,
+            "seconds": round(time.perf_counter() - start, 3),
+            "models": {record["name"]: record for record in records},
+        }
+        with atomic_write(self.config.manifest_path) as f:
+            json.dump(manifest, f, indent=4)
+
+        for record in records:
+            logger.info(
+                f"Zoo model {record['name']}: fit {record['fit_seconds']:.3f}s, "
+                f"{record['size_bytes'] / 1024:.1f} KB"
+            )
+        logger.info(f"Model zoo manifest saved at: {self.config.manifest_path}")
+        return manifest
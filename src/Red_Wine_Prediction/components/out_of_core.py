@@ -0,0 +1,105 @@
+'''ElasticNet fitting from chunks, for training splits larger than memory.
+
+ElasticNet's objective depends on the data only through the centered Gram
+matrix G = Xcᵀ Xc, Xcᵀ yc and the target's variance, so a single pass over
+the memory-mapped split accumulates everything the fit needs in O(F²)
+memory, whatever the row count:
+
+    n, Σx, Σy, Σ xxᵀ, Σ x y
+
+The fit then runs on an (F, F) surrogate problem with the same objective:
+with G = V Λ Vᵀ, R = Λ^½ Vᵀ and z = Λ^-½ Vᵀ Xcᵀ yc we have RᵀR = G and
+Rᵀz = Xcᵀ yc, so ‖z − R w‖² differs from ‖yc − Xc w‖² by a constant.
+Rescaling alpha by n / F keeps the penalty's weight relative to the
+1 / (2 n_samples) loss factor of sklearn. The result is a regular fitted
+ElasticNet, interchangeable with one fitted in memory.'''
+
+import numpy as np
+from sklearn.linear_model import ElasticNet
+
+
+def chunk_slices(n_rows: int, chunk_size: int):
+    """Yields slice objects covering range(n_rows) in chunk_size steps."""
+    for start in range(0, n_rows, chunk_size):
+        yield slice(start, min(start + chunk_size, n_rows))
+
+
+def gram_statistics(X: np.ndarray, y: np.ndarray, chunk_size: int) -> dict:
+    """
+    Accumulates the sufficient statistics of a least-squares fit in one
+    pass over row chunks of X / y (typically memory maps).
+
+    Returns:
+        dict: n, x_mean (F,), y_mean, gram (F, F) and xy (F,), centered
+    """
+    n_rows, n_features = X.shape
+    if n_rows == 0:
+        raise ValueError("Cannot fit on an empty training split")
+
+    sum_x = np.zeros(n_features)
+    sum_y = 0.0
+    sum_xx = np.zeros((n_features, n_features))
+    sum_xy = np.zeros(n_features)
+    for rows in chunk_slices(n_rows, chunk_size):
+        X_chunk = np.asarray(X[rows], dtype=np.float64)
+        y_chunk = np.asarray(y[rows], dtype=np.float64)
+        sum_x += X_chunk.sum(axis=0)
+        sum_y += y_chunk.sum()
+        sum_xx += X_chunk.T @ X_chunk
+        sum_xy += X_chunk.T @ y_chunk
+
+    x_mean = sum_x / n_rows
+    y_mean = sum_y / n_rows
+    return {
+        "n": n_rows,
+        "x_mean": x_mean,
+        "y_mean": y_mean,
+        "gram": sum_xx - n_rows * np.outer(x_mean, x_mean),
+        "xy": sum_xy - n_rows * x_mean * y_mean,
+    }
+
+
+def fit_elasticnet_out_of_core(
+    X: np.ndarray,
+    y: np.ndarray,
+    alpha: float,
+    l1_ratio: float,
+    chunk_size: int,
+    random_state: int = 42,
+    **params,
+) -> ElasticNet:
+    """
+    Fits ElasticNet(alpha, l1_ratio) with an intercept from row chunks.
+
+    Args:
+        X, y: Training matrix / target; read chunk_size rows at a time
+        params: Further ElasticNet params (max_iter, tol, ...)
+
+    Returns:
+        ElasticNet: Fitted model (coef_, intercept_ as from fit(X, y))
+    """
+    stats = gram_statistics(X, y, chunk_size)
+    n_features = X.shape[1]
+
+    eigenvalues, eigenvectors = np.linalg.eigh(stats["gram"])
+    # Directions with no variance carry no signal: zero rows of R / z
+    positive = eigenvalues > eigenvalues.max(initial=0.0) * n_features * np.finfo(np.float64).eps
+    root = np.sqrt(np.where(positive, eigenvalues, 0.0))
+    R = root[:, None] * eigenvectors.T
+    z = np.divide(eigenvectors.T @ stats["xy"], root, out=np.zeros(n_features), where=positive)
+
+    surrogate = ElasticNet(
+        alpha=alpha * stats["n"] / n_features,
+        l1_ratio=l1_ratio,
+        fit_intercept=False,
+        random_state=random_state,
+        **params,
+    ).fit(R, z)
+
+    model = ElasticNet(alpha=alpha, l1_ratio=l1_ratio, random_state=random_state, **params)
+    model.coef_ = surrogate.coef_
+    model.intercept_ = float(stats["y_mean"] - stats["x_mean"] @ surrogate.coef_)
+    model.n_features_in_ = n_features
+    model.n_iter_ = surrogate.n_iter_
+    model.dual_gap_ = surrogate.dual_gap_
+    return model
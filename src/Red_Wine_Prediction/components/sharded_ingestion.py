@@ -0,0 +1,324 @@
+'''Parallel ingestion of datasets delivered as many shards (e.g. daily
+files).
+
+Sources are a list of http(s):// URLs, file:// URLs, local paths and
+local globs ("data/daily/*.csv.gz"). Every shard is fetched with the
+ingestion engine (resume, timeout, checksum record) and decompressed
+(.csv, .csv.gz or a .zip holding one CSV) on a bounded thread pool; both
+steps are I/O or zlib bound, which release the GIL.
+
+A shard manifest records every ingested shard (digest, rows, local
+copy). Later runs only fetch shards that are new, or local shards whose
+size / mtime changed. New shards are appended to the combined CSV read
+by the downstream stages, so it stays append-only (the incremental
+trainer and the hash split both rely on that); it is rebuilt from the
+local shard copies only when an ingested shard changed or disappeared.
+
+The manifest also records the combined CSV's size after each run. An
+append interrupted before the manifest was written (a crash) leaves the
+file longer than recorded; the next run truncates it back to that size
+before appending, so shards are never appended twice.'''
+
+import glob
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlparse
+
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.entity.config_entity import DataIngestionConfig
+from Red_Wine_Prediction.components.ingestion_engine import fetch, source_name
+from Red_Wine_Prediction.utils.common import atomic_write
+from Red_Wine_Prediction.utils.stage_metrics import add_rows
+
+
+MANIFEST_VERSION = 1
+
+
+def expand_sources(sources: list) -> list:
+    """
+    Expands local globs (sorted, so date-named shards keep their order)
+    and drops duplicates; URLs and plain paths are kept as given.
+
+    Raises:
+        FileNotFoundError: If a glob matches nothing
+    """
+    expanded = []
+    for source in sources:
+        source = str(source)
+        if urlparse(source).scheme.lower() in ("http", "https") or not glob.has_magic(source):
+            expanded.append(source)
+            continue
+        pattern = urlparse(source).path if source.startswith("file://") else source
+        matches = sorted(glob.glob(pattern))
+        if not matches:
+            raise FileNotFoundError(f"Shard glob {source!r} matches no files")
+        expanded.extend(matches)
+    return list(dict.fromkeys(expanded))
+
+
+def _local_path(source: str):
+    scheme = urlparse(source).scheme.lower()
+    if scheme in ("http", "https"):
+        return None
+    return Path(urlparse(source).path) if scheme == "file" else Path(source)
+
+
+def _shard_key(source: str) -> str:
+    """File-name-safe, collision-free name of a shard's local copies."""
+    name = source_name(source)
+    return f"{hashlib.sha1(source.encode('utf-8')).hexdigest()[:10]}_{name}"
+
+
+def _open_decompressed(path: Path):
+    """Binary stream of the CSV inside a .csv / .gz / .zip shard."""
+    suffix = path.suffix.lower()
+    if suffix == ".gz":
+        return gzip.open(path, "rb")
+    if suffix == ".zip":
+        zf = zipfile.ZipFile(path)
+        members = [i for i in zf.infolist() if not i.is_dir() and i.filename.lower().endswith(".csv")]
+        if len(members) != 1:
+            zf.close()
+            raise ValueError(f"Shard archive {path} must hold exactly one CSV, found {len(members)}")
+        stream = zf.open(members[0])
+        close = stream.close
+
+        def close_both():
+            close()
+            zf.close()
+
+        stream.close = close_both
+        return stream
+    return open(path, "rb")
+
+
+class ShardedIngestion:
+    """
+    ShardedIngestion handles:
+    - Expanding the configured shard sources
+    - Fetching + decompressing new shards on a bounded worker pool
+    - Appending them to (or rebuilding) the combined CSV
+    - Saving the shard manifest
+    """
+
+    def __init__(self, config: DataIngestionConfig):
+        self.config = config
+        self.shard_dir = Path(config.shard_dir)
+
+    # -----------------------------
+    # Manifest
+    # -----------------------------
+    def _load_manifest(self) -> dict:
+        try:
+            with open(self.config.shard_manifest) as f:
+                manifest = json.load(f)
+            if manifest.get("version") == MANIFEST_VERSION:
+                return manifest
+        except FileNotFoundError:
+            pass
+        return {"version": MANIFEST_VERSION, "shards": {}, "combined": []}
+
+    @staticmethod
+    def _source_stat(source: str):
+        path = _local_path(source)
+        if path is None:
+            return None
+        st = path.stat()
+        return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+    def _is_current(self, source: str, record) -> bool:
+        """True when the manifest's copy of `source` can be reused."""
+        return (
+            record is not None
+            and Path(record["csv"]).exists()
+            and record.get("source_stat") == self._source_stat(source)
+        )
+
+    # -----------------------------
+    # One shard (worker thread)
+    # -----------------------------
+    def _ingest_shard(self, source: str) -> dict:
+        key = _shard_key(source)
+        raw_path = self.shard_dir / "raw" / key
+        stem = key
+        for suffix in (".gz", ".zip", ".csv"):
+            if stem.lower().endswith(suffix):
+                stem = stem[:-len(suffix)]
+        csv_path = self.shard_dir / f"{stem}.csv"
+
+        # A changed local shard: drop the stale copy so fetch() copies it again
+        if raw_path.exists():
+            os.remove(raw_path)
+        record = fetch(
+            source,
+            raw_path,
+            mirror_dir=self.config.mirror_dir,
+            timeout=self.config.download_timeout,
+            chunk_size=self.config.download_chunk_size,
+            retries=self.config.download_retries,
+        )
+
+        start = time.perf_counter()
+        if raw_path.suffix.lower() in (".gz", ".zip"):
+            with _open_decompressed(raw_path) as src, atomic_write(csv_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, self.config.download_chunk_size)
+            if not self.config.keep_raw_shards:
+                os.remove(raw_path)
+        else:
+            os.replace(raw_path, csv_path)
+
+        with open(csv_path, "rb") as f:
+            header = f.readline()
+            rows, last = 0, b"\n"
+            for block in iter(lambda: f.read(1 << 20), b""):
+                rows += block.count(b"\n")
+                last = block[-1:]
+            rows += last != b"\n"   # last line without a newline
+
+        return {
+            "source": source,
+            "csv": str(csv_path),
+            "sha256": record["sha256"],
+            "bytes": record["bytes"],
+            "csv_bytes": csv_path.stat().st_size,
+            "rows": rows,
+            "header": header.decode("utf-8").rstrip("\r\n"),
+            "source_stat": self._source_stat(source),
+            "fetch_seconds": record["seconds"],
+            "decompress_seconds": round(time.perf_counter() - start, 3),
+            "ingested_at": time.time(),
+        }
+
+    # -----------------------------
+    # Combined CSV
+    # -----------------------------
+    def _write_combined(self, shards: list, records: dict, append: bool) -> None:
+        """Writes (or appends) the data lines of `shards` under one header."""
+        combined = Path(self.config.combined_data_file)
+        header = records[shards[0]]["header"] if shards else None
+
+        def copy_rows(out, source):
+            with open(records[source]["csv"], "rb") as f:
+                f.readline()
+                last = b"\n"
+                for block in iter(lambda: f.read(self.config.download_chunk_size), b""):
+                    out.write(block)
+                    last = block[-1:]
+                if last != b"\n":
+                    out.write(b"\n")
+
+        if append:
+            with open(combined, "ab") as out:   # after _truncate_unrecorded()
+                for source in shards:
+                    copy_rows(out, source)
+        else:
+            with atomic_write(combined, "wb") as out:
+                out.write(header.encode("utf-8") + b"\n")
+                for source in shards:
+                    copy_rows(out, source)
+
+    def _truncate_unrecorded(self, manifest: dict) -> bool:
+        """
+        Cuts the combined CSV back to the size recorded in the manifest,
+        dropping rows of an append whose run never committed.
+
+        Returns:
+            bool: False if the file cannot be trusted for appending (missing,
+                shorter than recorded, or no recorded size) and must be rebuilt
+        """
+        combined = Path(self.config.combined_data_file)
+        recorded = manifest.get("combined_bytes")
+        if recorded is None or not combined.exists():
+            return False
+        size = combined.stat().st_size
+        if size < recorded:
+            return False
+        if size > recorded:
+            logger.warning(
+                f"{combined} has {size - recorded} bytes not recorded in the shard manifest "
+                f"(interrupted append); truncating to {recorded} bytes"
+            )
+            with open(combined, "r+b") as f:
+                f.truncate(recorded)
+        return True
+
+    def run(self) -> dict:
+        """
+        Ingests every configured shard not ingested yet.
+
+        Returns:
+            dict: The shard manifest
+        """
+        start = time.perf_counter()
+        os.makedirs(self.shard_dir / "raw", exist_ok=True)
+        sources = expand_sources(self.config.shard_sources)
+        if not sources:
+            raise ValueError("No shard sources configured")
+        manifest = self._load_manifest()
+        previous = manifest["shards"]
+
+        pending = [s for s in sources if not self._is_current(s, previous.get(s))]
+        n_workers = max(1, min(self.config.max_workers or os.cpu_count() or 1, len(pending) or 1))
+        logger.info(
+            f"{len(sources)} shard(s) configured, {len(sources) - len(pending)} already ingested; "
+            f"ingesting {len(pending)} on {n_workers} worker(s)"
+        )
+
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            fresh = {record["source"]: record for record in pool.map(self._ingest_shard, pending)}
+        records = {s: fresh.get(s) or previous[s] for s in sources}
+        add_rows(sum(record["rows"] for record in fresh.values()))
+
+        headers = {records[s]["header"] for s in sources}
+        if len(headers) > 1:
+            raise ValueError(f"Shards have different CSV headers: {sorted(headers)}")
+
+        # -----------------------------
+        # Append new shards, or rebuild when ingested ones changed
+        # -----------------------------
+        combined_before = [s for s in manifest["combined"] if s in records]
+        changed = [s for s in manifest["combined"] if s not in records or s in fresh]
+        new = [s for s in sources if s not in manifest["combined"]]
+        if changed or not self._truncate_unrecorded(manifest):
+            order = combined_before + new
+            logger.info(f"Rebuilding {self.config.combined_data_file} from {len(order)} shard(s)")
+            self._write_combined(order, records, append=False)
+        else:
+            order = manifest["combined"] + new
+            if new:
+                self._write_combined(new, records, append=True)
+
+        # Local copies of shards no longer configured
+        for source, record in previous.items():
+            if source not in records and Path(record["csv"]).exists():
+                os.remove(record["csv"])
+
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "combined_data_file": str(self.config.combined_data_file),
+            "combined": order,
+            "rows": sum(records[s]["rows"] for s in order),
+            "combined_bytes": Path(self.config.combined_data_file).stat().st_size,
+            "shards": records,
+            "last_run": {
+                "ingested": list(fresh),
+                "seconds": round(time.perf_counter() - start, 3),
+                "bytes": sum(r["bytes"] for r in fresh.values()),
+                "at": time.time(),
+            },
+        }
+        with atomic_write(self.config.shard_manifest) as f:
+            json.dump(manifest, f, indent=4)
+
+        logger.info(
+            f"Ingested {len(fresh)} new shard(s) in {manifest['last_run']['seconds']}s; "
+            f"{self.config.combined_data_file} now holds {manifest['rows']} rows from {len(order)} shard(s)"
+        )
+        return manifest
@@ -1,10 +1,14 @@
 # Import all constant values such as file paths (CONFIG_FILE_PATH, PARAMS_FILE_PATH, SCHEMA_FILE_PATH)
 from Red_Wine_Prediction.constants import *
 
+import numpy as np
+
 # Import common utility functions
 # - read_yaml: reads YAML configuration files
 # - create_directories: creates required directories if they do not exist
 from Red_Wine_Prediction.utils.common import read_yaml, create_directories     
+from Red_Wine_Prediction.utils.artifact_io import artifact_path
+from Red_Wine_Prediction.components.feature_engineering import DEFAULT_FEATURE_SPEC
 
 # Import configuration entity classes
 # These classes define the structure of configuration objects
@@ -13,7 +17,17 @@ from Red_Wine_Prediction.entity.config_entity import (
     DataValidationConfig,
     DataTransformationConfig,
     ModelTrainerConfig,
-    ModelEvaluationConfig
+    ModelEvaluationConfig,
+    PredictionConfig,
+    BatchPredictionConfig,
+    MicroBatchingConfig,
+    DriftMonitoringConfig,
+    MetricsConfig,
+    StageCacheConfig,
+    DagRunnerConfig,
+    HyperparameterTuningConfig,
+    ModelZooConfig,
+    IncrementalTrainingConfig
     
 )
 
@@ -70,7 +84,20 @@ class ConfigurationManager:
             root_dir=Path(config.root_dir),
             source_URL=config.source_URL,
             local_data_file=Path(config.local_data_file),
-            unzip_dir=Path(config.unzip_dir)
+            unzip_dir=Path(config.unzip_dir),
+            source_sha256=config.source_sha256 or None,
+            mirror_dir=Path(config.mirror_dir) if config.mirror_dir else None,
+            download_timeout=float(config.download_timeout),
+            download_chunk_size=int(config.download_chunk_size),
+            download_retries=int(config.download_retries),
+            extract=bool(config.extract),
+            extract_members=list(config.extract_members or []),
+            shard_sources=[str(s) for s in (config.shard_sources or [])],
+            shard_dir=Path(config.shard_dir),
+            shard_manifest=Path(config.shard_manifest),
+            combined_data_file=Path(config.combined_data_file),
+            max_workers=int(config.max_workers),
+            keep_raw_shards=bool(config.keep_raw_shards),
         )
 
         return data_ingestion_config
@@ -101,12 +128,24 @@ class ConfigurationManager:
                 STATUS_FILE=config.STATUS_FILE,
                 unzip_data_dir=config.unzip_data_dir,
                 all_schema=schema,
+                column_ranges=self.schema.get("RANGES", {}),
+                REPORT_FILE=config.REPORT_FILE,
+                chunk_size=int(config.chunk_size),
             )
 
             # Return the prepared configuration to the DataValidation component
             return data_validation_config
     
     
+    def get_feature_spec(self) -> list:
+        # Derived feature declarations from params.yaml; the built-in
+        # defaults apply when the section is absent
+        if "feature_engineering" not in self.params:
+            return [dict(f) for f in DEFAULT_FEATURE_SPEC]
+        return self.params.feature_engineering.to_dict()["features"]
+    
+    
+    
     def get_data_transformation_config(self) -> DataTransformationConfig:
         config =self.config.data_transformation 
         
@@ -115,8 +154,18 @@ class ConfigurationManager:
         Data_transformation_config =  DataTransformationConfig(
             root_dir=config.root_dir,
             data_path=config.data_path,
-            
-            
+            artifact_format=config.artifact_format,
+            feature_spec=self.get_feature_spec(),
+            mode=config.mode,
+            chunk_size=int(config.chunk_size),
+            test_size=float(config.test_size),
+            split_strategy=config.split_strategy,
+            # BoxList → plain list
+            split_key=config.split_key if isinstance(config.split_key, str) else list(config.split_key),
+            split_seed=int(config.split_seed),
+            reference_stats_path=Path(config.reference_stats_file),
+            drift_bins=int(self.params.drift_monitoring.bins),
+            reference_sample_size=int(self.params.drift_monitoring.reference_sample_size),
         )
         
         return Data_transformation_config
@@ -127,28 +176,97 @@ class ConfigurationManager:
         config = self.config.model_trainer
         params = self.params.ElasticNet
         schema =  self.schema.TARGET_COLUMN
+        artifact_format = self.config.data_transformation.artifact_format
 
         create_directories([config.root_dir])
 
         model_trainer_config = ModelTrainerConfig(
             root_dir=config.root_dir,
-            train_data_path = config.train_data_path,
-            test_data_path = config.test_data_path,
+            train_data_path = artifact_path(config.train_data_path, artifact_format),
+            test_data_path = artifact_path(config.test_data_path, artifact_format),
+            artifact_format = artifact_format,
             model_name = config.model_name,
+            scaler_path = config.scaler_path,
+            inference_pipeline_name = config.inference_pipeline_name,
+            compiled_model_name = config.compiled_model_name,
+            current_pointer_name = config.current_pointer_name,
+            keep_versions = int(config.keep_versions),
             alpha = params.alpha,
             l1_ratio = params.l1_ratio,
-            target_column = schema.name
-            
+            target_column = schema.name,
+            feature_spec = self.get_feature_spec(),
+            tuned_params_path = Path(self.config.hyperparameter_tuning.tuned_params_file),
+            use_tuned_params = bool(self.params.hyperparameter_tuning.enabled),
+            out_of_core = self.config.data_transformation.mode == "out_of_core",
+            chunk_size = int(self.config.data_transformation.chunk_size),
         )
 
         return model_trainer_config
     
     
     
+    def get_hyperparameter_tuning_config(self) -> HyperparameterTuningConfig:
+        config = self.config.hyperparameter_tuning
+        params = self.params.hyperparameter_tuning
+        artifact_format = self.config.data_transformation.artifact_format
+
+        create_directories([config.root_dir])
+
+        # Log-spaced alpha grid from params.yaml
+        grid = params.alpha_grid
+        alphas = np.logspace(np.log10(grid.min), np.log10(grid.max), int(grid.num)).tolist()
+
+        hyperparameter_tuning_config = HyperparameterTuningConfig(
+            root_dir=Path(config.root_dir),
+            train_data_path=artifact_path(config.train_data_path, artifact_format),
+            artifact_format=artifact_format,
+            target_column=self.schema.TARGET_COLUMN.name,
+            tuned_params_path=Path(config.tuned_params_file),
+            enabled=bool(params.enabled),
+            cv_folds=int(params.cv_folds),
+            n_jobs=int(params.n_jobs),
+            random_state=int(params.random_state),
+            l1_ratios=[float(r) for r in params.l1_ratios],
+            alphas=alphas,
+            n_random_alphas=int(params.n_random_alphas),
+            n_random_l1_ratios=int(params.n_random_l1_ratios),
+            l1_ratio_range=[float(r) for r in params.l1_ratio_range],
+            max_iter=int(params.max_iter),
+            tol=float(params.tol),
+        )
+
+        return hyperparameter_tuning_config
+    
+    
+    
+    def get_model_zoo_config(self) -> ModelZooConfig:
+        config = self.config.model_zoo
+        params = self.params.model_zoo
+        artifact_format = self.config.data_transformation.artifact_format
+
+        create_directories([config.root_dir])
+
+        model_zoo_config = ModelZooConfig(
+            root_dir=Path(config.root_dir),
+            train_data_path=artifact_path(config.train_data_path, artifact_format),
+            artifact_format=artifact_format,
+            target_column=self.schema.TARGET_COLUMN.name,
+            manifest_path=Path(config.manifest_file),
+            enabled=bool(params.enabled),
+            max_workers=int(params.max_workers),
+            models=params.models.to_dict(),
+        )
+
+        return model_zoo_config
+    
+    
+    
     def get_model_evaluation_config(self)-> ModelEvaluationConfig:
         config=self.config.model_evaluation
         params=self.params.ElasticNet
+        evaluation=self.params.evaluation
         schema=self.schema.TARGET_COLUMN
+        artifact_format=self.config.data_transformation.artifact_format
         
         
         create_directories([config.root_dir])
@@ -156,13 +274,151 @@ class ConfigurationManager:
         
         
         root_dir = config.root_dir,
-        test_data_path=config.test_data_path,
+        test_data_path=artifact_path(config.test_data_path, artifact_format),
+        artifact_format=artifact_format,
         model_path= config.model_path,
         metric_file_name = config.metric_file_name,
         all_params=params,
-        target_column=schema.name 
+        target_column=schema.name,
+        zoo_enabled=bool(self.params.model_zoo.enabled),
+        zoo_manifest_path=Path(self.config.model_zoo.manifest_file),
+        benchmark_file_name=Path(config.benchmark_file_name),
+        train_data_path=artifact_path(config.train_data_path, artifact_format),
+        cv_enabled=bool(evaluation.cross_validation.enabled),
+        cv_n_splits=int(evaluation.cross_validation.n_splits),
+        cv_n_repeats=int(evaluation.cross_validation.n_repeats),
+        cv_n_jobs=int(evaluation.cross_validation.n_jobs),
+        bootstrap_resamples=int(evaluation.bootstrap.n_resamples),
+        confidence=float(evaluation.bootstrap.confidence),
+        random_state=int(evaluation.random_state),
         
         )
         
         
-        return model_evaluation_config
\ No newline at end of file
+        return model_evaluation_config
+    
+    
+    
+    def get_prediction_config(self) -> PredictionConfig:
+        config = self.config.prediction
+
+        prediction_config = PredictionConfig(
+            model_pointer_path=Path(config.model_pointer_path),
+            compiled_model_name=config.compiled_model_name,
+            inference_pipeline_name=config.inference_pipeline_name,
+            model_path=Path(config.model_path),
+            scaler_path=Path(config.scaler_path)
+        )
+
+        return prediction_config
+    
+    
+    
+    def get_batch_prediction_config(self) -> BatchPredictionConfig:
+        config = self.config.batch_prediction
+
+        batch_prediction_config = BatchPredictionConfig(
+            chunk_size=int(config.chunk_size),
+            prediction_column=config.prediction_column
+        )
+
+        return batch_prediction_config
+    
+    
+    
+    def get_micro_batching_config(self) -> MicroBatchingConfig:
+        params = self.params.micro_batching
+
+        micro_batching_config = MicroBatchingConfig(
+            enabled=bool(params.enabled),
+            max_batch_rows=int(params.max_batch_rows),
+            max_wait_us=int(params.max_wait_us)
+        )
+
+        return micro_batching_config
+    
+    
+    
+    def get_drift_monitoring_config(self) -> DriftMonitoringConfig:
+        params = self.params.drift_monitoring
+
+        drift_monitoring_config = DriftMonitoringConfig(
+            enabled=bool(params.enabled),
+            reference_stats_path=Path(self.config.data_transformation.reference_stats_file),
+            queue_size=int(params.queue_size),
+            max_merge_batches=int(params.max_merge_batches),
+            psi_alert=float(params.psi_alert),
+            reference_check_seconds=float(params.reference_check_seconds),
+        )
+
+        return drift_monitoring_config
+    
+    
+    
+    def get_metrics_config(self) -> MetricsConfig:
+        params = self.params.metrics
+
+        metrics_config = MetricsConfig(
+            enabled=bool(params.enabled),
+            stage_metrics_file_name="stage_metrics.json",
+        )
+
+        return metrics_config
+    
+    
+    
+    def get_incremental_training_config(self) -> IncrementalTrainingConfig:
+        config = self.config.incremental_training
+        params = self.params.incremental_training
+        trainer = self.config.model_trainer
+
+        create_directories([config.root_dir])
+
+        incremental_training_config = IncrementalTrainingConfig(
+            root_dir=Path(config.root_dir),
+            data_path=Path(config.data_path),
+            watermark_path=Path(config.watermark_file),
+            scaler_name=config.scaler_name,
+            model_name=config.model_name,
+            chunk_size=int(config.chunk_size),
+            publish=bool(config.publish),
+            target_column=self.schema.TARGET_COLUMN.name,
+            feature_spec=self.get_feature_spec(),
+            full_refit_every=int(params.full_refit_every),
+            full_refit_epochs=int(params.full_refit_epochs),
+            epochs_per_batch=int(params.epochs_per_batch),
+            random_state=int(params.random_state),
+            sgd_params=params.SGDRegressor.to_dict(),
+            model_store_dir=Path(trainer.root_dir),
+            current_pointer_name=trainer.current_pointer_name,
+            keep_versions=int(trainer.keep_versions),
+            published_model_name=trainer.model_name,
+            inference_pipeline_name=trainer.inference_pipeline_name,
+            compiled_model_name=trainer.compiled_model_name,
+        )
+
+        return incremental_training_config
+    
+    
+    
+    def get_stage_cache_config(self) -> StageCacheConfig:
+        config = self.config.stage_cache
+
+        create_directories([config.root_dir])
+
+        stage_cache_config = StageCacheConfig(
+            root_dir=Path(config.root_dir)
+        )
+
+        return stage_cache_config
+    
+    
+    
+    def get_dag_runner_config(self) -> DagRunnerConfig:
+        config = self.config.dag_runner
+
+        dag_runner_config = DagRunnerConfig(
+            max_workers=int(config.max_workers)
+        )
+
+        return dag_runner_config
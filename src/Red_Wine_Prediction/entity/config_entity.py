@@ -1,5 +1,6 @@
 from dataclasses import dataclass 
 from pathlib import Path    
+from typing import List, Optional, Union
 
 @dataclass(frozen=True)
 class DataIngestionConfig:
@@ -23,6 +24,45 @@ class DataIngestionConfig:
     unzip_dir: Path
     # Directory where the downloaded data will be extracted
 
+    source_sha256: Optional[str]
+    # Expected SHA-256 of the downloaded file (None = not verified)
+
+    mirror_dir: Optional[Path]
+    # Offline mirror directory searched before source_URL
+
+    download_timeout: float
+    # Seconds per connect / read of a download
+
+    download_chunk_size: int
+    # Bytes per streamed read
+
+    download_retries: int
+    # Resumed retries after a failed transfer
+
+    extract: bool
+    # Extract the archive (false: readers stream members out of it)
+
+    extract_members: List[str]
+    # Members to extract; empty = all
+
+    shard_sources: List[str]
+    # Shard URLs / paths / globs; empty = single source_URL
+
+    shard_dir: Path
+    # Local (decompressed) copies of the shards
+
+    shard_manifest: Path
+    # JSON record of every ingested shard
+
+    combined_data_file: Path
+    # CSV holding the rows of every shard, read by the later stages
+
+    max_workers: int
+    # Concurrent shard fetches (0 = one per core)
+
+    keep_raw_shards: bool
+    # Keep compressed shards after decompression
+
 
 
 @dataclass(frozen=True)
@@ -46,6 +86,15 @@ class DataValidationConfig:
     # Schema definition loaded from schema.yaml
     # Contains expected columns, data types, etc.
     all_schema: dict
+
+    # Inclusive {min, max} per column from schema.yaml (RANGES)
+    column_ranges: dict
+
+    # JSON file receiving the per-column validation report
+    REPORT_FILE: Path
+
+    # Rows read per chunk by the streaming validator
+    chunk_size: int
     
     
 from dataclasses import dataclass
@@ -63,6 +112,17 @@ class DataTransformationConfig:
     """
     root_dir: Path        # Root directory where transformation artifacts will be stored
     data_path: Path       # Path to the raw input dataset
+    artifact_format: str  # npy | feather | parquet | csv for the train/test matrices
+    feature_spec: list    # Declarative derived features (params.yaml feature_engineering)
+    mode: str             # in_memory | out_of_core
+    chunk_size: int       # Rows per CSV chunk in out_of_core mode
+    test_size: float      # Fraction of rows in the test split
+    split_strategy: str   # random (train_test_split) | hash (stable row-key hash)
+    split_key: Union[str, List[str]]  # row_number | content | key columns (hash split)
+    split_seed: int       # random_state of the split (or seed of the row hash)
+    reference_stats_path: Path  # Training feature statistics for drift monitoring
+    drift_bins: int       # Histogram bins of the reference statistics
+    reference_sample_size: int  # Rows sampled for the reference bin edges
 
 
 @dataclass(frozen=True)
@@ -75,12 +135,23 @@ class ModelTrainerConfig:
     and save a machine learning model.
     """
     root_dir: Path            # Root directory for model training artifacts
-    train_data_path: Path     # Path to the training dataset
-    test_data_path: Path      # Path to the testing dataset
+    train_data_path: Path     # Path to the training dataset (with format suffix)
+    test_data_path: Path      # Path to the testing dataset (with format suffix)
+    artifact_format: str      # Format of the train/test artifacts
     model_name: str           # Name/identifier of the model to be trained
+    scaler_path: Path         # Fitted scaler from the data transformation stage
+    inference_pipeline_name: str  # File name of the single serving artifact
+    compiled_model_name: str  # File name of the compiled linear model JSON sidecar
+    current_pointer_name: str # Pointer file naming the published model version
+    keep_versions: int        # Number of model versions kept on disk
     alpha: float              # Regularization strength (e.g., for ElasticNet)
     l1_ratio: float           # Balance between L1 and L2 regularization
     target_column: str        # Name of the target variable in the dataset
+    feature_spec: list        # Feature spec the train matrices were built with
+    tuned_params_path: Path   # tuned_params.json from the hyperparameter tuning stage
+    use_tuned_params: bool    # Take alpha / l1_ratio from tuned_params_path
+    out_of_core: bool         # Fit from chunks of the memory-mapped train split
+    chunk_size: int           # Rows per chunk in out_of_core mode
 
 
 
@@ -90,7 +161,168 @@ class ModelTrainerConfig:
 class ModelEvaluationConfig:
     root_dir: Path
     test_data_path: Path
+    artifact_format: str
     model_path :Path
     metric_file_name :Path
     all_params:dict 
     target_column: str
+    zoo_enabled: bool             # Benchmark the model zoo next to the served model
+    zoo_manifest_path: Path       # Fit records written by the model zoo stage
+    benchmark_file_name: Path     # Accuracy vs serving cost table of the zoo
+    train_data_path: Path         # Train split, combined with test for cross-validation
+    cv_enabled: bool              # Run repeated k-fold CV
+    cv_n_splits: int              # k
+    cv_n_repeats: int             # Number of reshuffled k-fold rounds
+    cv_n_jobs: int                # Fold worker processes; 0 = one per core
+    bootstrap_resamples: int      # Bootstrap resamples per interval
+    confidence: float             # Confidence level of the intervals
+    random_state: int             # Seed for folds and resampling
+
+
+
+@dataclass(frozen=True)
+class PredictionConfig:
+    """
+    Configuration for the serving (prediction) side.
+
+    Holds the paths of the fitted artifacts that the model registry
+    loads once per worker process.
+    """
+    model_pointer_path: Path  # current.json naming the published model version
+    compiled_model_name: str  # Compiled linear model JSON sidecar (preferred)
+    inference_pipeline_name: str  # Inference pipeline inside a version directory
+    model_path: Path          # Legacy fallback: trained model
+    scaler_path: Path         # Legacy fallback: fitted StandardScaler
+
+
+
+@dataclass(frozen=True)
+class BatchPredictionConfig:
+    """
+    Configuration for streaming batch scoring of CSV/Parquet files.
+    """
+    chunk_size: int           # Rows read, scored and written per chunk
+    prediction_column: str    # Name of the appended prediction column
+
+
+
+@dataclass(frozen=True)
+class MicroBatchingConfig:
+    """
+    Configuration for coalescing concurrent prediction requests
+    into one vectorized predict call.
+    """
+    enabled: bool             # Route PredictionPipeline.predict through the batcher
+    max_batch_rows: int       # Flush once this many rows are queued
+    max_wait_us: int          # Flush after waiting this long for more rows
+
+
+
+@dataclass(frozen=True)
+class DriftMonitoringConfig:
+    """
+    Configuration for monitoring served inputs against the training
+    reference statistics.
+    """
+    enabled: bool                 # Feed PredictionPipeline inputs to the monitor
+    reference_stats_path: Path    # Written by the data transformation stage
+    queue_size: int               # Batches queued before new ones are dropped
+    max_merge_batches: int        # Queued batches merged per sketch update
+    psi_alert: float              # PSI above which a feature is flagged
+    reference_check_seconds: float  # Interval between reference file checks
+
+
+
+@dataclass(frozen=True)
+class MetricsConfig:
+    """
+    Configuration for serving (/metrics) and training stage metrics.
+    """
+    enabled: bool                 # Record and expose metrics
+    stage_metrics_file_name: str  # Written in each stage's root_dir
+
+
+
+@dataclass(frozen=True)
+class StageCacheConfig:
+    """
+    Configuration for content-addressed skipping of up-to-date stages.
+    """
+    root_dir: Path            # Directory holding one manifest per stage
+
+
+
+@dataclass(frozen=True)
+class DagRunnerConfig:
+    """
+    Configuration for the training stage DAG runner.
+    """
+    max_workers: int          # Threads running independent stages concurrently
+
+
+
+@dataclass(frozen=True)
+class HyperparameterTuningConfig:
+    """
+    Configuration for the cross-validated ElasticNet search.
+    """
+    root_dir: Path            # Directory for tuning artifacts
+    train_data_path: Path     # Training matrix (with format suffix)
+    artifact_format: str      # Format of the train/test artifacts
+    target_column: str        # Name of the target variable
+    tuned_params_path: Path   # Output JSON with the best params and CV table
+    enabled: bool             # Run the search (otherwise the stage is a no-op)
+    cv_folds: int             # k of the k-fold split
+    n_jobs: int               # Worker processes; 0 = one per core
+    random_state: int         # Seed for the fold shuffle and random candidates
+    l1_ratios: list           # Grid of l1_ratio values
+    alphas: list              # Grid of alpha values
+    n_random_alphas: int      # Extra log-uniform alphas in the grid's range
+    n_random_l1_ratios: int   # Extra uniform l1_ratios in l1_ratio_range
+    l1_ratio_range: list      # [low, high] for the random l1_ratios
+    max_iter: int             # Coordinate descent iterations per alpha
+    tol: float                # Coordinate descent tolerance
+
+
+
+@dataclass(frozen=True)
+class ModelZooConfig:
+    """
+    Configuration for training the benchmark model zoo.
+    """
+    root_dir: Path            # Directory for fitted zoo models and the manifest
+    train_data_path: Path     # Training matrix (with format suffix)
+    artifact_format: str      # Format of the train/test artifacts
+    target_column: str        # Name of the target variable
+    manifest_path: Path       # Fit records of every zoo model
+    enabled: bool             # Train the zoo (otherwise the stage is a no-op)
+    max_workers: int          # Concurrent fit processes; 0 = one per core
+    models: dict              # name -> {type, params}
+
+
+
+@dataclass(frozen=True)
+class IncrementalTrainingConfig:
+    """
+    Configuration for online updates from newly appended labelled rows.
+    """
+    root_dir: Path                # Scaler / model state directory
+    data_path: Path               # Append-only labelled CSV
+    watermark_path: Path          # Consumed byte offset, row count and batch history
+    scaler_name: str              # StandardScaler state file name
+    model_name: str               # SGDRegressor state file name
+    chunk_size: int               # Rows per chunk
+    publish: bool                 # Publish each update as a serving version
+    target_column: str            # Name of the target variable
+    feature_spec: list            # Declarative derived features
+    full_refit_every: int         # Incremental batches between full refits; 0 = never forced
+    full_refit_epochs: int        # SGD passes over the file on a full refit
+    epochs_per_batch: int         # SGD passes over each new batch
+    random_state: int             # Seed for SGD and chunk shuffling
+    sgd_params: dict              # SGDRegressor constructor params
+    model_store_dir: Path         # Serving model store (model_trainer root)
+    current_pointer_name: str     # Pointer file of the serving model store
+    keep_versions: int            # Versions kept in the serving model store
+    published_model_name: str     # Model file name inside a published version
+    inference_pipeline_name: str  # Inference pipeline file name inside a version
+    compiled_model_name: str      # Compiled linear model file name inside a version
@@ -0,0 +1,136 @@
+'''Batch scoring of large CSV/Parquet files.
+
+Streams the input in fixed-size chunks through the served predictor
+(feature engineering + scaler + model) and appends each chunk's predictions
+to the output file as soon as it is scored, so memory stays flat no matter
+how many rows the input has.
+
+Usage:
+    python -m Red_Wine_Prediction.pipeline.batch_predict input.csv output.csv
+    python -m Red_Wine_Prediction.pipeline.batch_predict input.parquet output.parquet --chunk-size 500000
+'''
+
+import argparse
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.components.feature_engineering import RAW_FEATURE_COLUMNS
+from Red_Wine_Prediction.config.configuration import ConfigurationManager
+from Red_Wine_Prediction.entity.config_entity import BatchPredictionConfig
+from Red_Wine_Prediction.pipeline.prediction import PredictionPipeline
+
+
+def _iter_chunks(path: Path, chunk_size: int):
+    if path.suffix == ".parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet input requires pyarrow: pip install pyarrow")
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunk_size)
+
+
+class _ChunkWriter:
+    """Appends scored chunks to a CSV or Parquet output file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._parquet_writer = None
+        self._first = True
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        if self.path.suffix == ".parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            chunk.to_csv(self.path, mode="w" if self._first else "a", header=self._first, index=False)
+        self._first = False
+
+    def close(self) -> None:
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+
+class BatchPrediction:
+    """
+    BatchPrediction handles:
+    - Chunked reading of CSV/Parquet inputs
+    - Vectorized scoring of each chunk
+    - Incremental writing of predictions
+    - Throughput reporting (rows/sec)
+    """
+
+    def __init__(self, config: BatchPredictionConfig):
+        self.config = config
+
+    def predict_file(self, input_path: Path, output_path: Path) -> dict:
+        input_path, output_path = Path(input_path), Path(output_path)
+        os.makedirs(output_path.parent or ".", exist_ok=True)
+
+        predictor = PredictionPipeline()
+        writer = _ChunkWriter(output_path)
+
+        rows = 0
+        start = time.perf_counter()
+        try:
+            for chunk in _iter_chunks(input_path, self.config.chunk_size):
+                missing = [c for c in RAW_FEATURE_COLUMNS if c not in chunk.columns]
+                if missing:
+                    raise ValueError(f"{input_path} is missing columns: {missing}")
+
+                X = chunk[RAW_FEATURE_COLUMNS].to_numpy(dtype=np.float64)
+                chunk[self.config.prediction_column] = predictor.predict(X)
+                writer.write(chunk)
+
+                rows += len(chunk)
+                elapsed = time.perf_counter() - start
+                logger.info(f"Scored {rows} rows ({rows / elapsed:,.0f} rows/sec)")
+        finally:
+            writer.close()
+
+        elapsed = time.perf_counter() - start
+        summary = {
+            "rows": rows,
+            "seconds": elapsed,
+            "rows_per_sec": rows / elapsed if elapsed > 0 else 0.0,
+        }
+        logger.info(
+            f"Batch prediction finished: {rows} rows in {elapsed:.2f}s "
+            f"({summary['rows_per_sec']:,.0f} rows/sec) -> {output_path}"
+        )
+        return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a CSV/Parquet file in streaming chunks")
+    parser.add_argument("input", type=Path, help="Input .csv or .parquet with the 11 feature columns")
+    parser.add_argument("output", type=Path, help="Output .csv or .parquet (input columns + prediction)")
+    parser.add_argument("--chunk-size", type=int, default=None, help="Rows per chunk (default: config.yaml)")
+    args = parser.parse_args(argv)
+
+    config = ConfigurationManager().get_batch_prediction_config()
+    if args.chunk_size:
+        config = BatchPredictionConfig(
+            chunk_size=args.chunk_size,
+            prediction_column=config.prediction_column,
+        )
+
+    summary = BatchPrediction(config=config).predict_file(args.input, args.output)
+    print(f"{summary['rows']} rows, {summary['rows_per_sec']:,.0f} rows/sec")
+
+
+if __name__ == "__main__":
+    main()
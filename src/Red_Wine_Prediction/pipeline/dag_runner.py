@@ -0,0 +1,149 @@
+'''Small DAG runner for the training stages.
+
+Stages declare the stages they depend on. The runner submits every stage
+whose dependencies have finished to a thread pool, so independent stages
+run concurrently. One ConfigurationManager is shared by all of them, and
+a per-stage timing table is logged at the end of the run.'''
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class DagStage:
+    """
+    One node of the training DAG.
+    """
+    key: str                  # Short identifier ("model_trainer")
+    name: str                 # Display name used in logs
+    stage_cls: type           # Stage pipeline class exposing main(config) and stage_io(config)
+    depends_on: tuple = ()    # Keys of the stages that must finish first
+
+
+@dataclass
+class StageResult:
+    key: str
+    name: str
+    status: str = "pending"   # pending | completed | skipped | failed | cancelled
+    started_at: Optional[float] = None
+    seconds: Optional[float] = None
+    error: Optional[str] = None
+
+
+class DagRunner:
+    """
+    DagRunner handles:
+    - Validating the stage graph (unknown dependencies, cycles)
+    - Running ready stages concurrently on a thread pool
+    - Stopping the scheduling of new stages after the first failure
+    - Reporting per-stage timings
+    """
+
+    def __init__(self, stages: List[DagStage], max_workers: int = 4):
+        self.stages = {stage.key: stage for stage in stages}
+        self.order = [stage.key for stage in stages]
+        self.max_workers = max_workers
+        self._validate()
+
+    def _validate(self) -> None:
+        for stage in self.stages.values():
+            for dep in stage.depends_on:
+                if dep not in self.stages:
+                    raise ValueError(f"Stage {stage.key} depends on unknown stage {dep}")
+
+        # Kahn's algorithm: every stage must become ready eventually
+        remaining = {key: set(stage.depends_on) for key, stage in self.stages.items()}
+        while remaining:
+            ready = [key for key, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Cycle between stages: {sorted(remaining)}")
+            for key in ready:
+                del remaining[key]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    def descendants(self, key: str) -> set:
+        """Returns `key` and every stage that (transitively) depends on it."""
+        found = {key}
+        changed = True
+        while changed:
+            changed = False
+            for stage in self.stages.values():
+                if stage.key not in found and found.intersection(stage.depends_on):
+                    found.add(stage.key)
+                    changed = True
+        return found
+
+    def run(self, run_stage: Callable[[DagStage], str]) -> Dict[str, StageResult]:
+        """
+        Executes the DAG.
+
+        Args:
+            run_stage: Runs one stage and returns its final status
+                ("completed" or "skipped"); raising marks it failed
+
+        Raises:
+            Exception: Re-raises the first stage failure once running
+                stages have finished
+        """
+        results = {key: StageResult(key=key, name=self.stages[key].name) for key in self.order}
+        done = set()
+        running = {}
+        first_error = None
+        run_start = time.perf_counter()
+
+        def submit_ready(pool):
+            for key in self.order:
+                result = results[key]
+                if result.status == "pending" and key not in running and done.issuperset(self.stages[key].depends_on):
+                    result.started_at = time.perf_counter() - run_start
+                    running[key] = pool.submit(self._timed, run_stage, self.stages[key])
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="stage") as pool:
+            submit_ready(pool)
+            while running:
+                finished, _ = wait(running.values(), return_when=FIRST_COMPLETED)
+                for key in [k for k, f in running.items() if f in finished]:
+                    future = running.pop(key)
+                    result = results[key]
+                    try:
+                        result.status, result.seconds = future.result()
+                        done.add(key)
+                    except Exception as e:
+                        result.status = "failed"
+                        result.error = str(e)
+                        first_error = first_error or e
+                if first_error is None:
+                    submit_ready(pool)
+
+        for result in results.values():
+            if result.status == "pending":
+                result.status = "cancelled"
+
+        self.results = results
+        if first_error is not None:
+            raise first_error
+        return results
+
+    @staticmethod
+    def _timed(run_stage, stage):
+        start = time.perf_counter()
+        status = run_stage(stage)
+        return status, time.perf_counter() - start
+
+    def timing_table(self) -> str:
+        rows = [("stage", "status", "start (s)", "wall (s)")]
+        for key in self.order:
+            r = self.results[key]
+            rows.append((
+                r.key,
+                r.status,
+                f"{r.started_at:.2f}" if r.started_at is not None else "-",
+                f"{r.seconds:.2f}" if r.seconds is not None else "-",
+            ))
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        lines = ["  ".join(cell.ljust(w) for cell, w in zip(row, widths)) for row in rows]
+        lines.insert(1, "  ".join("-" * w for w in widths))
+        return "\n".join(lines)
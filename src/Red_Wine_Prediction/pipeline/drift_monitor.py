@@ -0,0 +1,143 @@
+'''Input drift monitor for the prediction server.
+
+PredictionPipeline hands every batch of raw inputs to observe(), which
+only puts a reference to the array on a bounded queue: O(1), never
+blocking. If the queue is full (the monitor cannot keep up) the batch is
+dropped and counted instead of slowing down predictions.
+
+A background thread drains the queue, merging queued batches into one
+vectorized FeatureSketch update, and reloads the reference statistics
+written by DataTransformation when they change (a retrain), starting
+fresh sketches against the new bins.'''
+
+import os
+import queue
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.components.drift import FeatureSketch, load_reference
+from Red_Wine_Prediction.entity.config_entity import DriftMonitoringConfig
+
+
+class DriftMonitor:
+    """
+    DriftMonitor handles:
+    - Non-blocking capture of served inputs
+    - Updating the streaming sketches off the request path
+    - Drift scores against the training reference
+    """
+
+    def __init__(self, config: DriftMonitoringConfig):
+        self.config = config
+        self._queue = queue.Queue(maxsize=config.queue_size)
+        self._lock = threading.Lock()   # guards the sketch (worker vs. scores())
+        self._sketch: Optional[FeatureSketch] = None
+        self._reference_signature = None
+        self.dropped_batches = 0
+        self.started_at = time.time()
+
+        self._worker = threading.Thread(target=self._run_forever, name="drift-monitor", daemon=True)
+        self._worker.start()
+
+    # -----------------------------
+    # Request side
+    # -----------------------------
+    def observe(self, X: np.ndarray) -> None:
+        try:
+            self._queue.put_nowait(X)
+        except queue.Full:
+            self.dropped_batches += 1
+
+    # -----------------------------
+    # Worker side
+    # -----------------------------
+    def _refresh_reference(self) -> None:
+        try:
+            st = os.stat(self.config.reference_stats_path)
+        except FileNotFoundError:
+            return
+        signature = (st.st_mtime_ns, st.st_size)
+        if signature == self._reference_signature:
+            return
+        try:
+            sketch = FeatureSketch(load_reference(self.config.reference_stats_path))
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Ignoring reference statistics {self.config.reference_stats_path}: {e}")
+            return
+        with self._lock:
+            self._sketch = sketch
+            self._reference_signature = signature
+        logger.info(f"Drift monitor using reference statistics {self.config.reference_stats_path}")
+
+    def _run_forever(self) -> None:
+        next_check = 0.0
+        while True:
+            batches = [self._queue.get()]
+            while len(batches) < self.config.max_merge_batches:
+                try:
+                    batches.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            now = time.monotonic()
+            if now >= next_check:
+                self._refresh_reference()
+                next_check = now + self.config.reference_check_seconds
+
+            sketch = self._sketch
+            if sketch is None:
+                continue
+            try:
+                X = batches[0] if len(batches) == 1 else np.concatenate(batches)
+                with self._lock:
+                    if sketch is self._sketch:
+                        sketch.update(X)
+            except Exception as e:   # never let a bad batch stop monitoring
+                logger.warning(f"Drift monitor skipped {len(batches)} batch(es): {e}")
+
+    # -----------------------------
+    # Reporting
+    # -----------------------------
+    def scores(self) -> dict:
+        with self._lock:
+            sketch = self._sketch
+            result = sketch.scores(self.config.psi_alert) if sketch is not None else {"rows": 0}
+        result.update(
+            reference=str(self.config.reference_stats_path) if sketch is not None else None,
+            psi_alert=self.config.psi_alert,
+            queued_batches=self._queue.qsize(),
+            dropped_batches=self.dropped_batches,
+            since=self.started_at,
+        )
+        return result
+
+
+# -----------------------------
+# Process-wide instance
+# -----------------------------
+_monitor: Optional[DriftMonitor] = None
+_monitoring_config: Optional[DriftMonitoringConfig] = None
+_monitor_lock = threading.Lock()
+
+
+def get_drift_monitor() -> Optional[DriftMonitor]:
+    """
+    Returns the shared DriftMonitor, or None if drift_monitoring is
+    disabled in params.yaml.
+    """
+    global _monitor, _monitoring_config
+    if _monitoring_config is None:
+        with _monitor_lock:
+            if _monitoring_config is None:
+                from Red_Wine_Prediction.config.configuration import ConfigurationManager
+
+                config = ConfigurationManager().get_drift_monitoring_config()
+                if config.enabled:
+                    _monitor = DriftMonitor(config=config)
+                    logger.info(f"Drift monitoring enabled: queue_size={config.queue_size}")
+                _monitoring_config = config
+    return _monitor
@@ -0,0 +1,168 @@
+'''Micro-batching request coalescer for the prediction server.
+
+Concurrent callers submit their (n, 11) rows; a single worker thread
+collects them until the next request would push the batch past
+max_batch_rows or max_wait_us has passed since the first one was
+submitted, runs one vectorized predict over the concatenated rows and
+hands each caller back its own slice. A request that does not fit is held
+back as the first request of the next batch; a single request larger than
+max_batch_rows is predicted on its own.'''
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Optional
+
+import numpy as np
+
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.entity.config_entity import MicroBatchingConfig
+from Red_Wine_Prediction.pipeline.serving_metrics import get_serving_metrics, predict_timed
+
+
+class MicroBatcher:
+    """
+    MicroBatcher handles:
+    - Queueing rows from concurrent callers
+    - Flushing on max rows or max wait, whichever comes first
+    - One predict_fn call per flushed batch
+    - A batch-size histogram (power-of-two buckets)
+    """
+
+    def __init__(self, predict_fn: Callable[[np.ndarray], np.ndarray], config: MicroBatchingConfig):
+        self.predict_fn = predict_fn
+        self.config = config
+        self._max_wait = config.max_wait_us / 1e6
+        self._queue = queue.Queue()
+        self._held = None   # Request held back from a full batch (worker only)
+
+        # Histogram bucket upper bounds: 1, 2, 4, ... >= max_batch_rows, +Inf
+        self._bounds = [1]
+        while self._bounds[-1] < config.max_batch_rows:
+            self._bounds.append(self._bounds[-1] * 2)
+        self._bucket_counts = [0] * (len(self._bounds) + 1)
+        self.batches = 0
+        self.rows = 0
+
+        self._worker = threading.Thread(target=self._run_forever, name="micro-batcher", daemon=True)
+        self._worker.start()
+
+    # -----------------------------
+    # Caller side
+    # -----------------------------
+    def submit(self, X: np.ndarray) -> Future:
+        future = Future()
+        self._queue.put((np.asarray(X, dtype=np.float64), future, time.perf_counter()))
+        return future
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return self.submit(X).result()
+
+    # -----------------------------
+    # Worker side
+    # -----------------------------
+    def _collect(self):
+        if self._held is not None:
+            first, self._held = self._held, None
+        else:
+            first = self._queue.get()
+        items = [first]
+        rows = len(first[0])
+        # The wait budget starts when the first caller submitted, not when
+        # the worker got to its request
+        deadline = first[2] + self._max_wait
+
+        while rows < self.config.max_batch_rows:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if rows + len(item[0]) > self.config.max_batch_rows:
+                self._held = item
+                break
+            items.append(item)
+            rows += len(item[0])
+        return items, rows
+
+    def _record(self, rows: int) -> None:
+        metrics = get_serving_metrics()
+        if metrics is not None:
+            metrics.batch_rows.observe(rows)
+        self.batches += 1
+        self.rows += rows
+        for i, bound in enumerate(self._bounds):
+            if rows <= bound:
+                self._bucket_counts[i] += 1
+                return
+        self._bucket_counts[-1] += 1
+
+    def _run_forever(self) -> None:
+        while True:
+            items, rows = self._collect()
+            self._record(rows)
+            try:
+                X = items[0][0] if len(items) == 1 else np.concatenate([x for x, _, _ in items])
+                predictions = self.predict_fn(X)
+            except Exception as e:
+                for _, future, _ in items:
+                    future.set_exception(e)
+                continue
+
+            offset = 0
+            for x, future, _ in items:
+                future.set_result(predictions[offset:offset + len(x)])
+                offset += len(x)
+
+    def stats(self) -> dict:
+        labels = [str(b) for b in self._bounds] + ["+Inf"]
+        return {
+            "batches": self.batches,
+            "rows": self.rows,
+            "mean_batch_rows": self.rows / self.batches if self.batches else None,
+            "batch_size_histogram": dict(zip(labels, self._bucket_counts)),
+            "max_batch_rows": self.config.max_batch_rows,
+            "max_wait_us": self.config.max_wait_us,
+        }
+
+
+# -----------------------------
+# Process-wide instance
+# -----------------------------
+_batcher: Optional[MicroBatcher] = None
+_batching_config: Optional[MicroBatchingConfig] = None
+_batcher_lock = threading.Lock()
+
+
+def _predict_with_current_model(X: np.ndarray) -> np.ndarray:
+    from Red_Wine_Prediction.pipeline.model_registry import get_model_registry
+
+    # Resolved per batch so a hot-swapped model is picked up
+    predictor = get_model_registry().get().predictor
+    metrics = get_serving_metrics()
+    if metrics is None:
+        return predictor.predict(X)
+    return predict_timed(predictor, X, metrics)
+
+
+def get_micro_batcher() -> Optional[MicroBatcher]:
+    """
+    Returns the shared MicroBatcher, or None if micro_batching is disabled
+    in params.yaml.
+    """
+    global _batcher, _batching_config
+    if _batching_config is None:
+        with _batcher_lock:
+            if _batching_config is None:
+                from Red_Wine_Prediction.config.configuration import ConfigurationManager
+
+                config = ConfigurationManager().get_micro_batching_config()
+                if config.enabled:
+                    _batcher = MicroBatcher(predict_fn=_predict_with_current_model, config=config)
+                    logger.info(
+                        f"Micro-batching enabled: max_batch_rows={config.max_batch_rows}, "
+                        f"max_wait_us={config.max_wait_us}"
+                    )
+                _batching_config = config
+    return _batcher
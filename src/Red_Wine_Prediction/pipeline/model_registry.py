@@ -0,0 +1,229 @@
+'''Process-wide registry for the fitted serving artifacts.
+
+The registry loads the published model version (the compiled linear model,
+or the InferencePipeline if no compiled model exists) once per worker
+process and hands out the same read-only LoadedModel to every request.
+Before any version has been published it falls back to the flat
+model.joblib + scaler.joblib pair.
+
+The hot path is a single os.stat of the watched file (the "current" pointer,
+or the flat artifacts in fallback mode) and no lock. When it changes, the
+new artifacts are loaded off to the side and swapped in with one reference
+assignment. Requests already holding the previous LoadedModel finish with
+it. A pointer rewrite that names the same version, or a flat artifact
+touched without a content change, does not trigger a reload.'''
+
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.components.compiled_linear_model import CompiledLinearModel
+from Red_Wine_Prediction.components.model_store import read_model_pointer
+from Red_Wine_Prediction.entity.config_entity import PredictionConfig
+
+
+@dataclass(frozen=True)
+class LoadedModel:
+    """
+    Immutable snapshot of the serving artifacts.
+
+    Requests keep a reference to the snapshot they started with, so a reload
+    never changes the model underneath a request that is already running.
+    """
+    predictor: Any            # Raw (N, 11) -> predictions (CompiledLinearModel/InferencePipeline)
+    version: str              # Published version, or "legacy" for flat artifacts
+    content_hash: str         # sha256 over the loaded artifact files
+    load_seconds: float       # Time spent reading + deserializing
+    loaded_at: float          # time.time() when the snapshot was built
+
+
+class ModelRegistry:
+    """
+    Loads the serving artifacts once and hot-swaps them on change.
+
+    - get() is the hot path: one os.stat, no lock
+    - reloads happen under a lock and swap a single reference
+    - hit/miss/reload counters and load timings are exposed via stats()
+    """
+
+    def __init__(self, config: PredictionConfig):
+        self.config = config
+
+        # Guards (re)loading only; readers never take it
+        self._lock = threading.Lock()
+        self._current: Optional[LoadedModel] = None
+        self._signature: Optional[Tuple] = None
+
+        # Counters (best-effort under concurrency; used for monitoring)
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.total_load_seconds = 0.0
+
+    # -----------------------------
+    # Change detection
+    # -----------------------------
+    def _legacy_paths(self) -> Tuple[Path, ...]:
+        return (Path(self.config.model_path), Path(self.config.scaler_path))
+
+    def _stat_signature(self) -> Tuple:
+        try:
+            st = os.stat(self.config.model_pointer_path)
+            return ("pointer", st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            pass
+
+        signature = ["legacy"]
+        for path in self._legacy_paths():
+            st = os.stat(path)
+            signature.append((st.st_mtime_ns, st.st_size))
+        return tuple(signature)
+
+    @staticmethod
+    def _content_hash(paths) -> str:
+        digest = hashlib.sha256()
+        for path in paths:
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+        return digest.hexdigest()
+
+    # -----------------------------
+    # Loading
+    # -----------------------------
+    def _load_version(self, pointer: dict) -> LoadedModel:
+        start = time.perf_counter()
+        version_dir = Path(pointer["dir"])
+        compiled_path = version_dir / self.config.compiled_model_name
+
+        if compiled_path.exists():
+            # NumPy + JSON only: no sklearn import, no unpickling
+            predictor = CompiledLinearModel.load(compiled_path)
+            paths = CompiledLinearModel.sidecar_paths(compiled_path)
+        else:
+            import joblib
+
+            inference_pipeline_path = version_dir / self.config.inference_pipeline_name
+            predictor = joblib.load(inference_pipeline_path)
+            paths = (inference_pipeline_path,)
+
+        content_hash = self._content_hash(paths)
+        return LoadedModel(
+            predictor=predictor,
+            version=pointer["version"],
+            content_hash=content_hash,
+            load_seconds=time.perf_counter() - start,
+            loaded_at=time.time(),
+        )
+
+    def _load_legacy(self, content_hash: str) -> LoadedModel:
+        import joblib
+        from Red_Wine_Prediction.components.inference_pipeline import InferencePipeline
+
+        start = time.perf_counter()
+        predictor = InferencePipeline.from_fitted(
+            scaler=joblib.load(self.config.scaler_path),
+            model=joblib.load(self.config.model_path),
+        )
+        return LoadedModel(
+            predictor=predictor,
+            version="legacy",
+            content_hash=content_hash,
+            load_seconds=time.perf_counter() - start,
+            loaded_at=time.time(),
+        )
+
+    def _reload(self, current: Optional[LoadedModel], signature: Tuple) -> Optional[LoadedModel]:
+        """Returns a new LoadedModel, or None if `current` is still up to date."""
+        if signature[0] == "pointer":
+            pointer = read_model_pointer(self.config.model_pointer_path)
+            if pointer is not None:
+                if current is not None and pointer["version"] == current.version:
+                    return None
+                return self._load_version(pointer)
+            # Pointer vanished between stat and read: fall through to legacy
+
+        content_hash = self._content_hash(self._legacy_paths())
+        if current is not None and content_hash == current.content_hash:
+            # mtime changed but content did not (e.g. `touch`): keep the model
+            return None
+        return self._load_legacy(content_hash)
+
+    def get(self) -> LoadedModel:
+        """
+        Returns the current LoadedModel, loading or reloading it if the
+        published version (or the legacy artifacts) changed since the last call.
+        """
+        signature = self._stat_signature()
+        current = self._current
+        if current is not None and signature == self._signature:
+            self.hits += 1
+            return current
+
+        with self._lock:
+            # Another thread may have reloaded while we were waiting
+            current = self._current
+            if current is not None and signature == self._signature:
+                self.hits += 1
+                return current
+
+            loaded = self._reload(current, signature)
+            if loaded is None:
+                self._signature = signature
+                self.hits += 1
+                return current
+
+            self.misses += 1
+            self.total_load_seconds += loaded.load_seconds
+            if current is not None:
+                self.reloads += 1
+
+            # Single reference swap: readers see either the old or new snapshot
+            self._current = loaded
+            self._signature = signature
+
+        logger.info(
+            f"Model registry loaded version {loaded.version} "
+            f"(sha256={loaded.content_hash[:12]}) in {loaded.load_seconds * 1000:.1f} ms"
+        )
+        return loaded
+
+    def stats(self) -> dict:
+        current = self._current
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "reloads": self.reloads,
+            "total_load_seconds": self.total_load_seconds,
+            "version": current.version if current else None,
+            "last_load_seconds": current.load_seconds if current else None,
+            "content_hash": current.content_hash if current else None,
+            "loaded_at": current.loaded_at if current else None,
+        }
+
+
+# -----------------------------
+# Process-wide instance
+# -----------------------------
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """
+    Returns the registry shared by every request in this worker process.
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                from Red_Wine_Prediction.config.configuration import ConfigurationManager
+
+                config = ConfigurationManager().get_prediction_config()
+                _registry = ModelRegistry(config=config)
+    return _registry
@@ -1,14 +1,36 @@
-import joblib
-import numpy as np 
-import pandas as pd
+import numpy as np
 from pathlib  import Path
 
+from Red_Wine_Prediction.pipeline.micro_batcher import get_micro_batcher
+from Red_Wine_Prediction.pipeline.drift_monitor import get_drift_monitor
+from Red_Wine_Prediction.pipeline.model_registry import get_model_registry
+from Red_Wine_Prediction.pipeline.serving_metrics import get_serving_metrics, predict_timed
+
+
 class PredictionPipeline:
     def __init__(self):
-        self.model=joblib.load(Path("artifacts\model_trainer\model.joblib"))
-        
-        
+        # Shared, already-loaded artifacts; no disk read unless they changed
+        self.artifacts = get_model_registry().get()
+        self.predictor = self.artifacts.predictor
+        # Optional request coalescer (params.yaml -> micro_batching)
+        self.batcher = get_micro_batcher()
+        # Optional input drift monitor (params.yaml -> drift_monitoring)
+        self.monitor = get_drift_monitor()
+        # Optional phase / batch size metrics (params.yaml -> metrics)
+        self.metrics = get_serving_metrics()
+
+
     def predict(self,data):
-        prediction=self.model.predict(data) 
-        
-        return prediction.clip(3,8)
\ No newline at end of file
+        # Raw (N, 11) inputs; feature engineering, scaling and clipping to the
+        # 3-8 quality range all happen inside the served predictor
+        data = np.asarray(data, dtype=np.float64)
+        if self.monitor is not None:
+            self.monitor.observe(data)   # enqueue only; never blocks
+        if self.batcher is not None:
+            # Batch size and phases are recorded per coalesced batch
+            return self.batcher.predict(data)
+        if self.metrics is None:
+            return self.predictor.predict(data)
+
+        self.metrics.batch_rows.observe(data.shape[0])
+        return predict_timed(self.predictor, data, self.metrics)
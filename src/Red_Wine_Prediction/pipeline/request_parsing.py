@@ -0,0 +1,192 @@
+'''Parsing of machine-client prediction payloads into the raw (N, 11)
+float64 matrix expected by the served predictor.
+
+Supported payloads:
+- a JSON object                      {"fixed acidity": 7.4, ...}
+- a JSON array of objects            [{"fixed acidity": 7.4, ...}, ...]
+- a columnar JSON object             {"fixed acidity": [7.4, 7.8], ...}
+- NDJSON, one object per line
+
+Every payload is written straight into one preallocated buffer and
+validated against the feature columns declared in schema.yaml.'''
+
+import json
+from typing import Optional
+
+import numpy as np
+
+from Red_Wine_Prediction.components.feature_engineering import RAW_FEATURE_COLUMNS
+from Red_Wine_Prediction.constants import SCHEMA_FILE_PATH
+from Red_Wine_Prediction.utils.common import read_yaml
+
+
+_N_FEATURES = len(RAW_FEATURE_COLUMNS)
+_COLUMN_INDEX = {column: j for j, column in enumerate(RAW_FEATURE_COLUMNS)}
+_schema_checked = False
+
+
+def _field_key(name: str) -> str:
+    # Accepts both the schema names ("fixed acidity") and the HTML form names
+    # ("fixed_acidity")
+    return name.replace("_", " ")
+
+
+def check_schema(schema_filepath=SCHEMA_FILE_PATH) -> None:
+    """
+    Verifies once per process that schema.yaml declares exactly the feature
+    columns the predictor consumes.
+
+    Raises:
+        ValueError: If schema.yaml and the predictor's columns disagree
+    """
+    global _schema_checked
+    if _schema_checked:
+        return
+
+    schema = read_yaml(schema_filepath)
+    target = schema.TARGET_COLUMN.name
+    declared = [c for c in schema.COLUMNS.keys() if c != target]
+    if set(declared) != set(RAW_FEATURE_COLUMNS):
+        raise ValueError(
+            f"schema.yaml feature columns {declared} do not match "
+            f"the served feature columns {RAW_FEATURE_COLUMNS}"
+        )
+    _schema_checked = True
+
+
+def _check_finite(out: np.ndarray) -> np.ndarray:
+    # NaN / inf would be scored and break the JSON response
+    finite = np.isfinite(out)
+    if not finite.all():
+        i, j = np.argwhere(~finite)[0]
+        raise ValueError(f"Record {i}: '{RAW_FEATURE_COLUMNS[j]}' is not a finite number")
+    return out
+
+
+def _fill_row(out: np.ndarray, i: int, record) -> None:
+    if not isinstance(record, dict):
+        raise ValueError(f"Record {i} is not a JSON object")
+
+    seen = 0
+    for key, value in record.items():
+        j = _COLUMN_INDEX.get(_field_key(key))
+        if j is None:
+            raise ValueError(f"Record {i}: unknown column '{key}'")
+        try:
+            if isinstance(value, bool):
+                raise TypeError
+            out[i, j] = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Record {i}: '{key}' is not a number: {value!r}")
+        seen += 1
+
+    if seen != _N_FEATURES:
+        present = {_field_key(k) for k in record}
+        missing = [c for c in RAW_FEATURE_COLUMNS if c not in present]
+        raise ValueError(f"Record {i} is missing {missing}")
+
+
+def records_to_array(records: list, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Converts a list of {column: value} records into an (N, 11) float64 array.
+
+    Args:
+        records (list): One dict per wine, keyed by feature name
+        out (np.ndarray): Optional preallocated (N, 11) float64 buffer
+
+    Raises:
+        ValueError: If the payload is not a list of objects, a feature is
+            missing or unknown, or a value is not a finite number
+
+    Returns:
+        np.ndarray: Raw features in RAW_FEATURE_COLUMNS order
+    """
+    if not isinstance(records, list):
+        raise ValueError("Expected a JSON array of records")
+
+    if out is None:
+        out = np.empty((len(records), _N_FEATURES), dtype=np.float64)
+    for i, record in enumerate(records):
+        _fill_row(out, i, record)
+    return _check_finite(out)
+
+
+def columns_to_array(columns: dict) -> np.ndarray:
+    """
+    Converts a columnar payload {column: [values...]} into an (N, 11)
+    float64 array, one vectorized copy per column.
+    """
+    keys = {_field_key(k): k for k in columns}
+    unknown = [k for k in keys if k not in _COLUMN_INDEX]
+    if unknown:
+        raise ValueError(f"Unknown columns: {unknown}")
+    missing = [c for c in RAW_FEATURE_COLUMNS if c not in keys]
+    if missing:
+        raise ValueError(f"Missing columns: {missing}")
+
+    n_rows = len(columns[keys[RAW_FEATURE_COLUMNS[0]]])
+    out = np.empty((n_rows, _N_FEATURES), dtype=np.float64)
+    for column, j in _COLUMN_INDEX.items():
+        values = columns[keys[column]]
+        if len(values) != n_rows:
+            raise ValueError(f"Column '{column}' has {len(values)} values, expected {n_rows}")
+        if any(isinstance(v, bool) for v in values):
+            raise ValueError(f"Column '{column}' contains non-numeric values")
+        try:
+            out[:, j] = values
+        except (TypeError, ValueError):
+            raise ValueError(f"Column '{column}' contains non-numeric values")
+    return _check_finite(out)
+
+
+def ndjson_to_array(body: bytes) -> np.ndarray:
+    """
+    Converts NDJSON (one record object per line) into an (N, 11) float64 array.
+    """
+    lines = [line for line in body.splitlines() if line.strip()]
+    out = np.empty((len(lines), _N_FEATURES), dtype=np.float64)
+    for i, line in enumerate(lines):
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Line {i + 1} is not valid JSON: {e}")
+        _fill_row(out, i, record)
+    return _check_finite(out)
+
+
+def parse_records(records: list) -> np.ndarray:
+    """
+    Validates a list of records against schema.yaml and parses it into an
+    (N, 11) float64 array; the /predict/batch entry point.
+
+    Raises:
+        ValueError: If the records are malformed or do not match schema.yaml
+    """
+    check_schema()
+    return records_to_array(records)
+
+
+def parse_payload(body: bytes, content_type: str = "") -> np.ndarray:
+    """
+    Detects the payload shape and parses it into an (N, 11) float64 array.
+
+    Raises:
+        ValueError: If the body is malformed or does not match schema.yaml
+    """
+    check_schema()
+
+    if "ndjson" in (content_type or ""):
+        return ndjson_to_array(body)
+
+    try:
+        payload = json.loads(body)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Body is not valid JSON: {e}")
+
+    if isinstance(payload, list):
+        return records_to_array(payload)
+    if isinstance(payload, dict):
+        if payload and all(isinstance(v, list) for v in payload.values()):
+            return columns_to_array(payload)
+        return records_to_array([payload])
+    raise ValueError("Expected a JSON object, an array of objects or a columnar object")
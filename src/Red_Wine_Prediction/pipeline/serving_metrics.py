@@ -0,0 +1,143 @@
+'''Prometheus metrics of the prediction server, exposed at /metrics.
+
+- redwine_http_requests_total{endpoint, method, status}
+- redwine_http_request_duration_seconds{endpoint}      end-to-end latency
+- redwine_predict_phase_duration_seconds{phase}        parse / feature /
+  predict / render; with micro-batching, feature and predict are timed
+  once per coalesced batch on the batcher's thread
+- redwine_predict_batch_rows                           rows per predictor
+  call (the coalesced batch with micro-batching)
+- redwine_model_*                                      model registry load
+  time, loads and cache hits (read from the registry at scrape time)
+- redwine_feature_drift_psi{feature}                   when drift
+  monitoring is enabled
+
+get_serving_metrics() returns None when metrics are disabled in
+params.yaml; callers skip all instrumentation then.'''
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.utils.metrics import DEFAULT_SIZE_BUCKETS, MetricsRegistry
+
+
+PHASES = ("parse", "feature", "predict", "render")
+
+
+class ServingMetrics:
+    """
+    ServingMetrics handles:
+    - The metric families of the prediction server
+    - Pre-bound phase histograms for the hot path
+    - Scrape-time collection of model registry / drift state
+    """
+
+    def __init__(self):
+        self.registry = MetricsRegistry()
+        self.requests = self.registry.counter(
+            "redwine_http_requests", "HTTP requests served", ("endpoint", "method", "status")
+        )
+        self.request_latency = self.registry.histogram(
+            "redwine_http_request_duration_seconds", "End-to-end request latency", ("endpoint",)
+        )
+        phase_latency = self.registry.histogram(
+            "redwine_predict_phase_duration_seconds", "Latency of one prediction request phase", ("phase",)
+        )
+        self.phase = {name: phase_latency.labels(phase=name) for name in PHASES}
+        self.batch_rows = self.registry.histogram(
+            "redwine_predict_batch_rows", "Rows per predictor call", buckets=DEFAULT_SIZE_BUCKETS
+        )
+
+        self.model_info = self.registry.gauge(
+            "redwine_model_info", "Served model version (value is always 1)", ("version",)
+        )
+        self.model_load_seconds = self.registry.gauge(
+            "redwine_model_load_seconds", "Time to load the served model version"
+        )
+        self.model_total_load_seconds = self.registry.gauge(
+            "redwine_model_total_load_seconds", "Total time spent loading model versions"
+        )
+        self.model_loads = self.registry.gauge("redwine_model_loads", "Model versions loaded")
+        self.model_reloads = self.registry.gauge("redwine_model_reloads", "Model hot swaps")
+        self.model_cache_hits = self.registry.gauge("redwine_model_cache_hits", "Registry lookups served from memory")
+        self.drift_psi = self.registry.gauge(
+            "redwine_feature_drift_psi", "PSI of served inputs against the training reference", ("feature",)
+        )
+        self.registry.add_collector(self._collect)
+
+    def _collect(self) -> None:
+        from Red_Wine_Prediction.pipeline.drift_monitor import get_drift_monitor
+        from Red_Wine_Prediction.pipeline.model_registry import get_model_registry
+
+        stats = get_model_registry().stats()
+        self.model_info.clear()   # only the served version is reported
+        if stats["version"] is not None:
+            self.model_info.labels(version=stats["version"]).set(1)
+            self.model_load_seconds.set(stats["last_load_seconds"])
+        self.model_total_load_seconds.set(stats["total_load_seconds"])
+        self.model_loads.set(stats["misses"])
+        self.model_reloads.set(stats["reloads"])
+        self.model_cache_hits.set(stats["hits"])
+
+        monitor = get_drift_monitor()
+        if monitor is not None:
+            for feature, scores in monitor.scores().get("features", {}).items():
+                self.drift_psi.labels(feature=feature).set(scores["psi"])
+
+    def render(self) -> str:
+        return self.registry.render()
+
+
+# -----------------------------
+# Process-wide instance
+# -----------------------------
+_metrics: Optional[ServingMetrics] = None
+_metrics_config = None
+_metrics_lock = threading.Lock()
+
+
+def get_serving_metrics() -> Optional[ServingMetrics]:
+    """
+    Returns the shared ServingMetrics, or None if metrics are disabled in
+    params.yaml.
+    """
+    global _metrics, _metrics_config
+    if _metrics_config is None:
+        with _metrics_lock:
+            if _metrics_config is None:
+                from Red_Wine_Prediction.config.configuration import ConfigurationManager
+
+                config = ConfigurationManager().get_metrics_config()
+                if config.enabled:
+                    _metrics = ServingMetrics()
+                    logger.info("Serving metrics enabled at /metrics")
+                _metrics_config = config
+    return _metrics
+
+
+@contextmanager
+def phase_timer(phase: str):
+    """Times the enclosed block as one request phase (no-op when disabled)."""
+    metrics = get_serving_metrics()
+    if metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.phase[phase].observe(time.perf_counter() - start)
+
+
+def predict_timed(predictor, X, metrics: ServingMetrics):
+    """predictor.predict(X) with the feature and predict phases timed."""
+    start = time.perf_counter()
+    features = predictor.transform(X)
+    featured = time.perf_counter()
+    prediction = predictor.score(features)
+    metrics.phase["feature"].observe(featured - start)
+    metrics.phase["predict"].observe(time.perf_counter() - featured)
+    return prediction
@@ -2,6 +2,9 @@
 from Red_Wine_Prediction import logger
 from Red_Wine_Prediction.config.configuration import ConfigurationManager
 from Red_Wine_Prediction.components.data_ingestion import DataIngestion
+from Red_Wine_Prediction.components.ingestion_engine import dataset_file
+from Red_Wine_Prediction.components.sharded_ingestion import ShardedIngestion, expand_sources
+from Red_Wine_Prediction.pipeline.stage_cache import StageIO
 
 
 
@@ -11,16 +14,39 @@ class DataIngestionTrainingPipeline:
         pass
 
 
-    def main(self):
+    def stage_io(self, config: ConfigurationManager) -> StageIO:
+        data_ingestion_config = config.get_data_ingestion_config()
+        if data_ingestion_config.shard_sources:
+            # Expanded here so a new file matching a glob reruns the stage
+            sources = expand_sources(data_ingestion_config.shard_sources)
+            return StageIO(
+                input_files=[s for s in sources if "://" not in s],
+                params={"shard_sources": sources},
+                output_files=[
+                    data_ingestion_config.combined_data_file,
+                    data_ingestion_config.shard_manifest,
+                ],
+            )
+        return StageIO(
+            params={"source_URL": data_ingestion_config.source_URL,
+                    "source_sha256": data_ingestion_config.source_sha256,
+                    "extract": data_ingestion_config.extract,
+                    "extract_members": data_ingestion_config.extract_members},
+            output_files=[
+                data_ingestion_config.local_data_file,
+                # The archive itself when the data is read in place
+                dataset_file(config.get_data_validation_config().unzip_data_dir),
+            ],
+        )
+
+
+    def main(self, config: ConfigurationManager = None):
         
-        config = ConfigurationManager()
+        config = config or ConfigurationManager()
         data_ingestion_config = config.get_data_ingestion_config()
+        if data_ingestion_config.shard_sources:
+            ShardedIngestion(config=data_ingestion_config).run()
+            return
         data_ingestion = DataIngestion(config=data_ingestion_config)
         data_ingestion.download_file()
-        data_ingestion.extract_zip_file()   
-
-
-
-
-
-
+        data_ingestion.extract_zip_file()
@@ -2,6 +2,8 @@
 from Red_Wine_Prediction import logger
 from Red_Wine_Prediction.config.configuration import ConfigurationManager
 from Red_Wine_Prediction.components.data_validation import DataValidation
+from Red_Wine_Prediction.components.ingestion_engine import dataset_file
+from Red_Wine_Prediction.pipeline.stage_cache import StageIO
 
 
 STAGE_NAME="Data Validation stage"
@@ -11,9 +13,18 @@ class DataValidationTrainingPipeline:
         pass
 
 
-    def main(self):
+    def stage_io(self, config: ConfigurationManager) -> StageIO:
+        data_validation_config = config.get_data_validation_config()
+        return StageIO(
+            input_files=[dataset_file(data_validation_config.unzip_data_dir)],
+            params={"schema": config.schema.to_dict()},
+            output_files=[data_validation_config.STATUS_FILE, data_validation_config.REPORT_FILE],
+        )
+
+
+    def main(self, config: ConfigurationManager = None):
         
-        config = ConfigurationManager()
+        config = config or ConfigurationManager()
         data_validation_config = config.get_data_validation_config()
         data_validation = DataValidation(config=data_validation_config)
         data_validation.validate_all_columns()
@@ -1,6 +1,9 @@
 from Red_Wine_Prediction import logger
 from Red_Wine_Prediction.config.configuration import ConfigurationManager
 from Red_Wine_Prediction.components.data_transformation import DataTransformation
+from Red_Wine_Prediction.components.ingestion_engine import dataset_file
+from Red_Wine_Prediction.pipeline.stage_cache import StageIO
+from Red_Wine_Prediction.utils.artifact_io import artifact_files
 from pathlib import Path
 
 
@@ -11,15 +14,44 @@ class DataTransformationTrainingPipeline:
     
     def __init__(self):
         pass 
+
+
+    def stage_io(self, config: ConfigurationManager) -> StageIO:
+        data_transformation_config = config.get_data_transformation_config()
+        root_dir = Path(data_transformation_config.root_dir)
+        fmt = data_transformation_config.artifact_format
+        output_files = artifact_files(root_dir / "train", fmt) + artifact_files(root_dir / "test", fmt)
+        return StageIO(
+            input_files=[
+                dataset_file(data_transformation_config.data_path),
+                config.get_data_validation_config().STATUS_FILE,
+            ],
+            params={
+                "schema": config.schema.to_dict(),
+                "artifact_format": fmt,
+                "feature_spec": data_transformation_config.feature_spec,
+                "mode": data_transformation_config.mode,
+                "test_size": data_transformation_config.test_size,
+                "split_strategy": data_transformation_config.split_strategy,
+                "split_key": data_transformation_config.split_key,
+                "split_seed": data_transformation_config.split_seed,
+                "drift_bins": data_transformation_config.drift_bins,
+                "reference_sample_size": data_transformation_config.reference_sample_size,
+            },
+            output_files=output_files + [
+                root_dir / "scaler.joblib",
+                data_transformation_config.reference_stats_path,
+            ],
+        )
     
     
-    def main(self):
+    def main(self, config: ConfigurationManager = None):
         try:
-            with open(Path("artifacts\data_validation\status.txt"), 'r') as f :
+            config = config or ConfigurationManager()
+            with open(Path(config.get_data_validation_config().STATUS_FILE), 'r') as f :
                 status = f.read().split(" ")[-1]
                 
             if status =="True":
-                config=ConfigurationManager()
                 data_transformation_config=config.get_data_transformation_config()
                 data_transformation=DataTransformation(
                     config=data_transformation_config
@@ -31,7 +63,8 @@ class DataTransformationTrainingPipeline:
                 raise Exception("Your data schema is not valid")
             
         except Exception as e:
-            print(e)
+            logger.exception(f"{STAGE_NAME} failed: {e}")
+            raise e
             
             
             
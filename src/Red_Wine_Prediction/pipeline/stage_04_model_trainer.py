@@ -2,6 +2,9 @@
 from Red_Wine_Prediction import logger
 from Red_Wine_Prediction.config.configuration import ConfigurationManager
 from Red_Wine_Prediction.components.model_trainer import ModelTrainer
+from Red_Wine_Prediction.pipeline.stage_cache import StageIO
+from Red_Wine_Prediction.utils.artifact_io import artifact_files
+from pathlib import Path
 
 
 STAGE_NAME="Model Trainer stage"
@@ -11,9 +14,32 @@ class ModelTrainingPipeline:
         pass
 
 
-    def main(self):
+    def stage_io(self, config: ConfigurationManager) -> StageIO:
+        model_trainer_config = config.get_model_trainer_config()
+        root_dir = Path(model_trainer_config.root_dir)
+        input_files = [
+            *artifact_files(model_trainer_config.train_data_path, model_trainer_config.artifact_format),
+            model_trainer_config.scaler_path,
+        ]
+        if model_trainer_config.use_tuned_params:
+            input_files.append(model_trainer_config.tuned_params_path)
+        return StageIO(
+            input_files=input_files,
+            params={"ElasticNet": config.params.ElasticNet.to_dict(),
+                    "target_column": model_trainer_config.target_column,
+                    "feature_spec": model_trainer_config.feature_spec,
+                    "use_tuned_params": model_trainer_config.use_tuned_params,
+                    "out_of_core": model_trainer_config.out_of_core},
+            output_files=[
+                root_dir / model_trainer_config.model_name,
+                root_dir / model_trainer_config.current_pointer_name,
+            ],
+        )
+
+
+    def main(self, config: ConfigurationManager = None):
         
-        config = ConfigurationManager()
+        config = config or ConfigurationManager()
         model_trainer_config = config.get_model_trainer_config()
         model_trainer_config = ModelTrainer(config=model_trainer_config)
         model_trainer_config.train()
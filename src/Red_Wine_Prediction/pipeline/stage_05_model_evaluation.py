@@ -2,6 +2,8 @@
 from Red_Wine_Prediction import logger
 from Red_Wine_Prediction.config.configuration import ConfigurationManager
 from Red_Wine_Prediction.components.model_evaluation import ModelEvaluation
+from Red_Wine_Prediction.pipeline.stage_cache import StageIO
+from Red_Wine_Prediction.utils.artifact_io import artifact_files
 
 
 STAGE_NAME="Model evaluation stage"
@@ -12,12 +14,34 @@ class ModelEvaluationPipeline:
         pass
 
 
-    def main(self):
+    def stage_io(self, config: ConfigurationManager) -> StageIO:
+        model_evaluation_config = config.get_model_evaluation_config()
+        input_files = [
+            *artifact_files(model_evaluation_config.test_data_path, model_evaluation_config.artifact_format),
+            model_evaluation_config.model_path,
+        ]
+        if model_evaluation_config.cv_enabled:
+            input_files += artifact_files(model_evaluation_config.train_data_path, model_evaluation_config.artifact_format)
+        output_files = [model_evaluation_config.metric_file_name]
+        if model_evaluation_config.zoo_enabled:
+            input_files.append(model_evaluation_config.zoo_manifest_path)
+            output_files.append(model_evaluation_config.benchmark_file_name)
+        return StageIO(
+            input_files=input_files,
+            params={"target_column": model_evaluation_config.target_column,
+                    "zoo_enabled": model_evaluation_config.zoo_enabled,
+                    "evaluation": config.params.evaluation.to_dict()},
+            output_files=output_files,
+        )
+
+
+    def main(self, config: ConfigurationManager = None):
         
-        config = ConfigurationManager()
+        config = config or ConfigurationManager()
         model_evaluation_config = config.get_model_evaluation_config()
         model_evaluation_config = ModelEvaluation(config=model_evaluation_config)
         model_evaluation_config.save_results()
+        model_evaluation_config.benchmark_model_zoo()
 
 
 
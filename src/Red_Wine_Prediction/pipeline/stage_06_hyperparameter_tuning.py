@@ -0,0 +1,33 @@
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.config.configuration import ConfigurationManager
+from Red_Wine_Prediction.components.hyperparameter_tuning import HyperparameterTuner
+from Red_Wine_Prediction.pipeline.stage_cache import StageIO
+from Red_Wine_Prediction.utils.artifact_io import artifact_files
+
+
+STAGE_NAME="Hyperparameter Tuning stage"
+
+class HyperparameterTuningPipeline:
+    def __init__(self):
+        pass
+
+
+    def stage_io(self, config: ConfigurationManager) -> StageIO:
+        tuning_config = config.get_hyperparameter_tuning_config()
+        if not tuning_config.enabled:
+            return StageIO(params={"enabled": False})
+        return StageIO(
+            input_files=artifact_files(tuning_config.train_data_path, tuning_config.artifact_format),
+            params={"hyperparameter_tuning": config.params.hyperparameter_tuning.to_dict()},
+            output_files=[tuning_config.tuned_params_path],
+        )
+
+
+    def main(self, config: ConfigurationManager = None):
+        
+        config = config or ConfigurationManager()
+        tuning_config = config.get_hyperparameter_tuning_config()
+        if not tuning_config.enabled:
+            logger.info("Hyperparameter tuning disabled in params.yaml; using the pinned ElasticNet params")
+            return
+        HyperparameterTuner(config=tuning_config).tune()
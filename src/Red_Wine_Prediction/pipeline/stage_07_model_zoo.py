@@ -0,0 +1,38 @@
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.config.configuration import ConfigurationManager
+from Red_Wine_Prediction.components.model_zoo import ModelZooTrainer
+from Red_Wine_Prediction.pipeline.stage_cache import StageIO
+from Red_Wine_Prediction.utils.artifact_io import artifact_files
+from pathlib import Path
+
+
+STAGE_NAME="Model Zoo stage"
+
+class ModelZooPipeline:
+    def __init__(self):
+        pass
+
+
+    def stage_io(self, config: ConfigurationManager) -> StageIO:
+        model_zoo_config = config.get_model_zoo_config()
+        if not model_zoo_config.enabled:
+            return StageIO(params={"enabled": False})
+        root_dir = Path(model_zoo_config.root_dir)
+        return StageIO(
+            input_files=artifact_files(model_zoo_config.train_data_path, model_zoo_config.artifact_format),
+            params={"model_zoo": config.params.model_zoo.to_dict()},
+            output_files=[
+                model_zoo_config.manifest_path,
+                *(root_dir / f"{name}.joblib" for name in model_zoo_config.models),
+            ],
+        )
+
+
+    def main(self, config: ConfigurationManager = None):
+        
+        config = config or ConfigurationManager()
+        model_zoo_config = config.get_model_zoo_config()
+        if not model_zoo_config.enabled:
+            logger.info("Model zoo disabled in params.yaml")
+            return
+        ModelZooTrainer(config=model_zoo_config).train()
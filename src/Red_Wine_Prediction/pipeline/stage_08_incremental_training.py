@@ -0,0 +1,28 @@
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.config.configuration import ConfigurationManager
+from Red_Wine_Prediction.components.incremental_trainer import IncrementalTrainer
+from Red_Wine_Prediction.pipeline.training_pipeline import training_lock
+
+
+STAGE_NAME="Incremental Training stage"
+
+class IncrementalTrainingPipeline:
+    """
+    Online update from newly appended rows. Run on its own (main.py
+    --incremental) rather than as part of the batch training DAG: it
+    tracks its own progress through the watermark instead of the stage
+    cache.
+    """
+    def __init__(self):
+        pass
+
+
+    def main(self, config: ConfigurationManager = None):
+        
+        config = config or ConfigurationManager()
+        incremental_training_config = config.get_incremental_training_config()
+        incremental_trainer = IncrementalTrainer(config=incremental_training_config)
+        # Publishes into the same model store as the DAG: never concurrently
+        with training_lock(config):
+            incremental_trainer.run()
+
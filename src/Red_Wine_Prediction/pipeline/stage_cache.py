@@ -0,0 +1,122 @@
+'''Content-addressed caching of training stages.
+
+Every stage declares its inputs (files from config.yaml plus the
+params.yaml / schema.yaml values it depends on) and its output files.
+After a successful run the stage's manifest records the sha256 of every
+input and output. On the next run the stage is skipped if all input hashes
+match the manifest and every output still exists with its recorded hash.
+
+Hashes are reused from the manifest while a file's (mtime, size) is
+unchanged, so an up-to-date check does not re-read large files.'''
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.utils.common import atomic_write
+
+
+@dataclass
+class StageIO:
+    """
+    Declared inputs and outputs of one training stage.
+    """
+    input_files: list = field(default_factory=list)   # Files read by the stage
+    params: dict = field(default_factory=dict)        # params.yaml / schema.yaml / config values it depends on
+    output_files: list = field(default_factory=list)  # Files the stage (re)writes
+
+
+def _file_record(path: Path, previous: Optional[dict]) -> Optional[dict]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    if previous and previous.get("mtime_ns") == st.st_mtime_ns and previous.get("size") == st.st_size:
+        return previous
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return {"sha256": digest.hexdigest(), "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def _params_hash(params: dict) -> str:
+    canonical = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class StageCache:
+    """
+    StageCache handles:
+    - Hashing a stage's declared inputs and outputs
+    - Deciding whether a stage is up to date
+    - Recording a manifest after a successful run
+    """
+
+    def __init__(self, root_dir: Path):
+        self.root_dir = Path(root_dir)
+
+    def _manifest_path(self, stage_key: str) -> Path:
+        return self.root_dir / f"{stage_key}.json"
+
+    def _load_manifest(self, stage_key: str) -> Optional[dict]:
+        try:
+            with open(self._manifest_path(stage_key)) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    @staticmethod
+    def _hash_files(paths, previous: dict) -> dict:
+        return {str(p): _file_record(Path(p), previous.get(str(p))) for p in paths}
+
+    def is_up_to_date(self, stage_key: str, io: StageIO) -> bool:
+        manifest = self._load_manifest(stage_key)
+        if manifest is None:
+            return False
+
+        if manifest.get("params_sha256") != _params_hash(io.params):
+            return False
+
+        inputs = self._hash_files(io.input_files, manifest.get("inputs", {}))
+        if any(r is None for r in inputs.values()):
+            return False
+        if {p: r["sha256"] for p, r in inputs.items()} != {
+            p: r["sha256"] for p, r in manifest.get("inputs", {}).items()
+        }:
+            return False
+
+        outputs = self._hash_files(io.output_files, manifest.get("outputs", {}))
+        recorded_outputs = manifest.get("outputs", {})
+        for path, record in outputs.items():
+            if record is None or path not in recorded_outputs:
+                return False
+            if record["sha256"] != recorded_outputs[path]["sha256"]:
+                return False
+        return True
+
+    def record(self, stage_key: str, io: StageIO) -> None:
+        previous = self._load_manifest(stage_key) or {}
+        manifest = {
+            "stage": stage_key,
+            "completed_at": time.time(),
+            "params_sha256": _params_hash(io.params),
+            "inputs": self._hash_files(io.input_files, previous.get("inputs", {})),
+            "outputs": self._hash_files(io.output_files, {}),
+        }
+        with atomic_write(self._manifest_path(stage_key)) as f:
+            json.dump(manifest, f, indent=4)
+        logger.info(f"Stage manifest saved at: {self._manifest_path(stage_key)}")
+
+    def invalidate(self, stage_key: str) -> None:
+        try:
+            os.remove(self._manifest_path(stage_key))
+        except FileNotFoundError:
+            pass
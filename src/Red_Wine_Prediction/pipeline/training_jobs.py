@@ -0,0 +1,180 @@
+'''In-process background runner for /train.
+
+Training jobs are queued on a bounded queue and executed by a single
+worker thread that calls run_training_pipeline() directly: no new
+interpreter, no re-importing pandas/sklearn, and no web worker blocked for
+the length of the run. Only one job can be queued or running at a time,
+across processes too: a job holds the training lock file from submission
+until it finishes, so other gunicorn workers and `python main.py` cannot
+train over the same artifacts meanwhile.'''
+
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional
+
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.pipeline.training_pipeline import STAGES, run_training_pipeline, training_lock
+from Red_Wine_Prediction.utils.common import FileLockHeld
+
+
+class TrainingJobConflict(Exception):
+    """Raised when a training job is submitted while another is active."""
+
+
+class TrainingJobRunner:
+    """
+    TrainingJobRunner handles:
+    - Accepting training jobs and returning a job id immediately
+    - Running the stage pipeline on a background thread
+    - Per-stage progress and timings for /train/status/<id>
+    - Refusing overlapping jobs
+    """
+
+    def __init__(self, max_queue_size: int = 1, max_history: int = 50):
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._active_job_id: Optional[str] = None
+        self._active_lock = None
+        self._max_history = max_history
+        self._worker: Optional[threading.Thread] = None
+
+    # -----------------------------
+    # Submission
+    # -----------------------------
+    def submit(self, force: bool = False) -> str:
+        """
+        Queues a training run and returns its job id.
+
+        Args:
+            force (bool): Run every stage even if it is up to date
+
+        Raises:
+            TrainingJobConflict: If a job is already queued or running, in
+                this or another process
+        """
+        with self._lock:
+            if self._active_job_id is not None:
+                raise TrainingJobConflict(
+                    f"Training job {self._active_job_id} is already "
+                    f"{self._jobs[self._active_job_id]['status']}"
+                )
+
+            lock = training_lock()
+            try:
+                lock.acquire()
+            except FileLockHeld:
+                raise TrainingJobConflict("Another process is already training")
+
+            job_id = uuid.uuid4().hex
+            job = {
+                "id": job_id,
+                "status": "queued",
+                "submitted_at": time.time(),
+                "started_at": None,
+                "finished_at": None,
+                "error": None,
+                "force": force,
+                "stages": [
+                    {"name": stage.name, "status": "pending", "seconds": None}
+                    for stage in STAGES
+                ],
+            }
+            try:
+                self._queue.put_nowait(job_id)
+            except queue.Full:
+                lock.release()
+                raise TrainingJobConflict("Training queue is full")
+
+            self._jobs[job_id] = job
+            self._active_job_id = job_id
+            self._active_lock = lock
+            while len(self._jobs) > self._max_history:
+                self._jobs.popitem(last=False)
+
+            self._ensure_worker()
+        return job_id
+
+    def status(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            return {**job, "stages": [dict(stage) for stage in job["stages"]]}
+
+    # -----------------------------
+    # Worker
+    # -----------------------------
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run_forever, name="training-worker", daemon=True)
+            self._worker.start()
+
+    def _stage(self, job: dict, name: str) -> dict:
+        return next(stage for stage in job["stages"] if stage["name"] == name)
+
+    def _run_forever(self) -> None:
+        while True:
+            job_id = self._queue.get()
+            try:
+                self._run(job_id)
+            finally:
+                self._queue.task_done()
+
+    def _run(self, job_id: str) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            job["status"] = "running"
+            job["started_at"] = time.time()
+
+        def on_stage_start(name):
+            with self._lock:
+                self._stage(job, name)["status"] = "running"
+
+        def on_stage_end(name, seconds, status):
+            with self._lock:
+                stage = self._stage(job, name)
+                stage["status"] = status
+                stage["seconds"] = seconds
+
+        try:
+            # The lock taken in submit() is held for the whole run
+            run_training_pipeline(
+                force=job["force"], on_stage_start=on_stage_start, on_stage_end=on_stage_end, lock=False
+            )
+            final_status, error = "completed", None
+        except Exception as e:
+            logger.exception(f"Training job {job_id} failed")
+            final_status, error = "failed", str(e)
+
+        with self._lock:
+            for stage in job["stages"]:
+                if stage["status"] == "running":
+                    stage["status"] = "failed"
+            job["status"] = final_status
+            job["error"] = error
+            job["finished_at"] = time.time()
+            self._active_job_id = None
+            self._active_lock.release()
+            self._active_lock = None
+
+        logger.info(f"Training job {job_id} {final_status}")
+
+
+# -----------------------------
+# Process-wide instance
+# -----------------------------
+_runner: Optional[TrainingJobRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_training_job_runner() -> TrainingJobRunner:
+    global _runner
+    if _runner is None:
+        with _runner_lock:
+            if _runner is None:
+                _runner = TrainingJobRunner()
+    return _runner
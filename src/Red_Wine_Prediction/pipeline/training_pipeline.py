@@ -0,0 +1,142 @@
+'''The training stage DAG and a runner that executes it in-process.
+Used by main.py and by the Flask app's background /train jobs.
+
+Stages run on a thread pool as soon as their dependencies have finished,
+share one ConfigurationManager, and are skipped when their declared inputs
+and outputs match their last successful run (see pipeline/stage_cache.py)
+unless forced.'''
+
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.config.configuration import ConfigurationManager
+from Red_Wine_Prediction.pipeline.dag_runner import DagRunner, DagStage
+from Red_Wine_Prediction.pipeline.stage_cache import StageCache
+from Red_Wine_Prediction.utils.stage_metrics import StageMetricsRecorder
+from Red_Wine_Prediction.utils.common import FileLock
+
+from Red_Wine_Prediction.pipeline.stage_01_data_ingestion import DataIngestionTrainingPipeline
+from Red_Wine_Prediction.pipeline.stage_02_data_validation import DataValidationTrainingPipeline
+from Red_Wine_Prediction.pipeline.stage_03_data_transformation import DataTransformationTrainingPipeline
+from Red_Wine_Prediction.pipeline.stage_04_model_trainer import ModelTrainingPipeline
+from Red_Wine_Prediction.pipeline.stage_05_model_evaluation import ModelEvaluationPipeline
+from Red_Wine_Prediction.pipeline.stage_06_hyperparameter_tuning import HyperparameterTuningPipeline
+from Red_Wine_Prediction.pipeline.stage_07_model_zoo import ModelZooPipeline
+
+
+STAGES = [
+    DagStage("data_ingestion", "Data Ingestion Stage", DataIngestionTrainingPipeline),
+    DagStage("data_validation", "Data Validation Stage", DataValidationTrainingPipeline,
+             depends_on=("data_ingestion",)),
+    DagStage("data_transformation", "Data Transformation stage", DataTransformationTrainingPipeline,
+             depends_on=("data_validation",)),
+    DagStage("model_trainer", "Model  Trainer stage", ModelTrainingPipeline,
+             depends_on=("data_transformation", "hyperparameter_tuning")),
+    DagStage("model_evaluation", "Model  Evaluation stage", ModelEvaluationPipeline,
+             depends_on=("model_trainer", "model_zoo")),
+    # Numbered last so --from-stage numbers of the earlier stages stay stable
+    DagStage("hyperparameter_tuning", "Hyperparameter Tuning stage", HyperparameterTuningPipeline,
+             depends_on=("data_transformation",)),
+    # Runs concurrently with tuning / training; benchmarked by evaluation
+    DagStage("model_zoo", "Model Zoo stage", ModelZooPipeline,
+             depends_on=("data_transformation",)),
+]
+
+
+def resolve_stage_key(stage: Union[int, str]) -> str:
+    """
+    Maps a stage key ("model_trainer") or 1-based number ("4") to its key.
+
+    Raises:
+        ValueError: If no stage matches
+    """
+    keys = [s.key for s in STAGES]
+    if str(stage).isdigit() and 1 <= int(stage) <= len(STAGES):
+        return keys[int(stage) - 1]
+    if stage in keys:
+        return stage
+    raise ValueError(f"Unknown stage {stage!r}; expected 1-{len(STAGES)} or one of {keys}")
+
+
+def training_lock(config: Optional[ConfigurationManager] = None) -> FileLock:
+    """
+    The cross-process lock serializing every run that writes training
+    artifacts (DAG runs from main.py or /train, incremental runs).
+    """
+    config = config or ConfigurationManager()
+    return FileLock(Path(config.config.artifacts_root) / "training.lock")
+
+
+def run_training_pipeline(
+    force: bool = False,
+    from_stage: Optional[Union[int, str]] = None,
+    on_stage_start: Optional[Callable[[str], None]] = None,
+    on_stage_end: Optional[Callable[[str, float, str], None]] = None,
+    lock: bool = True,
+) -> None:
+    """
+    Runs the stage DAG in the current process.
+
+    Args:
+        force: Run every stage even if it is up to date
+        from_stage: Run this stage and everything depending on it even if
+            up to date
+        on_stage_start: Called with the stage name before it runs
+        on_stage_end: Called with the stage name, its wall time (seconds)
+            and "completed" or "skipped"
+        lock: Hold the training lock for the run; False when the caller
+            already holds it
+
+    Raises:
+        FileLockHeld: If another training run holds the training lock
+        Exception: Re-raises the first stage failure after logging it
+    """
+    config = ConfigurationManager()
+    cache = StageCache(root_dir=config.get_stage_cache_config().root_dir)
+    runner = DagRunner(STAGES, max_workers=config.get_dag_runner_config().max_workers)
+    metrics_config = config.get_metrics_config()
+    forced = runner.descendants(resolve_stage_key(from_stage)) if from_stage is not None else set()
+
+    def run_stage(dag_stage: DagStage) -> str:
+        STAGE_NAME = dag_stage.name
+        try:
+            stage = dag_stage.stage_cls()
+            stage_io = stage.stage_io(config)
+
+            if not force and dag_stage.key not in forced and cache.is_up_to_date(dag_stage.key, stage_io):
+                logger.info(f">>>>>> Stage {STAGE_NAME} skipped (inputs unchanged) <<<<<<")
+                if on_stage_end:
+                    on_stage_end(STAGE_NAME, 0.0, "skipped")
+                return "skipped"
+
+            logger.info(f">>>>>> Stage {STAGE_NAME} started <<<<<<")
+            if on_stage_start:
+                on_stage_start(STAGE_NAME)
+
+            start = time.perf_counter()
+            if metrics_config.enabled:
+                metrics_path = Path(config.config[dag_stage.key].root_dir) / metrics_config.stage_metrics_file_name
+                with StageMetricsRecorder(dag_stage.key, metrics_path):
+                    stage.main(config)
+            else:
+                stage.main(config)
+            seconds = time.perf_counter() - start
+
+            cache.record(dag_stage.key, stage_io)
+            if on_stage_end:
+                on_stage_end(STAGE_NAME, seconds, "completed")
+            logger.info(f">>>>>> Stage {STAGE_NAME} completed <<<<<<\n\nx")
+            return "completed"
+        except Exception as e:
+            cache.invalidate(dag_stage.key)
+            logger.exception(f"Error occurred in stage {STAGE_NAME}.\n{e}")
+            raise e
+
+    with training_lock(config) if lock else nullcontext():
+        try:
+            runner.run(run_stage)
+        finally:
+            logger.info(f"Training pipeline stage timings:\n{runner.timing_table()}")
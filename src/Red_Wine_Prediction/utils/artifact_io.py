@@ -0,0 +1,188 @@
+# 📌 PURPOSE OF THIS FILE (utils/artifact_io.py)
+
+# Reading and writing the intermediate train/test matrices passed between
+# the data transformation, model trainer and model evaluation stages.
+
+# The on-disk format is selected in config.yaml (data_transformation.artifact_format):
+# - npy     → memory-mapped feature store (components/feature_store.py):
+#             contiguous float64 X / y .npy files + JSON index; zero-copy loads
+# - feather → Arrow IPC file (needs pyarrow); loaded memory-mapped
+# - parquet → compressed columnar file (needs pyarrow)
+# - csv     → legacy text format
+
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from Red_Wine_Prediction import logger
+from Red_Wine_Prediction.components.feature_store import FeatureStore
+
+
+ARTIFACT_FORMATS = {
+    "npy": "",           # split name inside the feature store, no single file
+    "feather": ".feather",
+    "parquet": ".parquet",
+    "csv": ".csv",
+}
+
+
+def _check_format(fmt: str) -> None:
+    if fmt not in ARTIFACT_FORMATS:
+        raise ValueError(f"Unknown artifact format {fmt!r}; expected one of {list(ARTIFACT_FORMATS)}")
+
+
+def _require_pyarrow(fmt: str) -> None:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError(f"artifact_format '{fmt}' requires pyarrow: pip install pyarrow")
+
+
+# --------------------------------------------------
+# artifact_path / artifact_files
+# --------------------------------------------------
+# PURPOSE:
+# - Maps a suffix-less artifact path from config.yaml
+#   (artifacts/data_transformation/train) to its on-disk location
+# - artifact_files lists every file backing it (for stage caching)
+# --------------------------------------------------
+def artifact_path(path: Path, fmt: str) -> Path:
+    _check_format(fmt)
+    return Path(path).with_suffix(ARTIFACT_FORMATS[fmt])
+
+
+def artifact_files(path: Path, fmt: str) -> List[Path]:
+    path = artifact_path(path, fmt)
+    if fmt == "npy":
+        return FeatureStore(path.parent).paths(path.name)
+    return [path]
+
+
+# --------------------------------------------------
+# save_xy
+# --------------------------------------------------
+def save_xy(
+    X: np.ndarray,
+    y: np.ndarray,
+    feature_columns: List[str],
+    target_column: str,
+    path: Path,
+    fmt: str,
+    scaler_fingerprint: Optional[str] = None,
+) -> Path:
+    """
+    Saves a feature matrix and its target in the configured artifact format.
+
+    Args:
+        X (np.ndarray): (N, F) features
+        y (np.ndarray): (N,) target
+        feature_columns (list): F column names
+        target_column (str): Target column name
+        path (Path): Artifact path, with or without suffix
+        fmt (str): One of ARTIFACT_FORMATS
+        scaler_fingerprint (str): Recorded in the feature store index (npy)
+
+    Returns:
+        Path: The artifact location
+    """
+    path = artifact_path(path, fmt)
+    os.makedirs(path.parent, exist_ok=True)
+
+    if fmt == "npy":
+        FeatureStore(path.parent).write(
+            path.name, X, y, feature_columns, target_column, scaler_fingerprint
+        )
+        return path
+
+    import pandas as pd
+
+    df = pd.DataFrame(np.asarray(X), columns=feature_columns)
+    df[target_column] = np.asarray(y)
+
+    if fmt == "feather":
+        _require_pyarrow(fmt)
+        df.to_feather(path, compression="uncompressed")
+    elif fmt == "parquet":
+        _require_pyarrow(fmt)
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+    logger.info(f"Saved {df.shape} table as {fmt} at: {path}")
+    return path
+
+
+# --------------------------------------------------
+# load_xy
+# --------------------------------------------------
+def load_xy(path: Path, fmt: str, target_column: str) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    Loads an artifact and splits it into features and target.
+
+    For npy, X and y are read-only memory maps (no parsing, no copy).
+
+    Returns:
+        Tuple: (X, y, feature_columns)
+    """
+    path = artifact_path(path, fmt)
+
+    if fmt == "npy":
+        feature_set = FeatureStore(path.parent).open(path.name)
+        if feature_set.target_column != target_column:
+            raise ValueError(f"{path} has target '{feature_set.target_column}', expected '{target_column}'")
+        return feature_set.X, feature_set.y, feature_set.feature_columns
+
+    # pandas is imported lazily so that importing this module (via
+    # ConfigurationManager) stays cheap on the serving path
+    import pandas as pd
+
+    if fmt == "feather":
+        _require_pyarrow(fmt)
+        import pyarrow.feather as feather
+
+        df = feather.read_table(path, memory_map=True).to_pandas()
+    elif fmt == "parquet":
+        _require_pyarrow(fmt)
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path)
+
+    if target_column not in df.columns:
+        raise ValueError(f"{path} has no target column '{target_column}'")
+    feature_columns = [str(c) for c in df.columns if c != target_column]
+    X = df[feature_columns].to_numpy(dtype=np.float64)
+    y = df[target_column].to_numpy(dtype=np.float64)
+    return X, y, feature_columns
+
+
+# --------------------------------------------------
+# matrix_source / open_matrix_source
+# --------------------------------------------------
+# PURPOSE:
+# - Lets worker processes get a train/test matrix without the parent
+#   pickling it per task: npy splits are memory-mapped by every worker from
+#   the same file (shared page cache), other formats are loaded once by the
+#   parent and shipped once per worker (pool initializer)
+# --------------------------------------------------
+def matrix_source(path: Path, fmt: str, target_column: str) -> Tuple[tuple, int]:
+    """
+    Returns:
+        Tuple: (picklable source for open_matrix_source, number of rows)
+    """
+    path = artifact_path(path, fmt)
+    if fmt == "npy":
+        feature_set = FeatureStore(path.parent).open(path.name)
+        return ("store", str(path.parent), path.name), feature_set.X.shape[0]
+
+    X, y, _ = load_xy(path, fmt, target_column)
+    return ("arrays", X, y), X.shape[0]
+
+
+def open_matrix_source(source: tuple) -> Tuple[np.ndarray, np.ndarray]:
+    """Resolves a matrix_source() tuple to (X, y)."""
+    if source[0] == "store":
+        feature_set = FeatureStore(source[1]).open(source[2])
+        return feature_set.X, feature_set.y
+    return source[1], source[2]
@@ -18,7 +18,9 @@ import os
 import json
 import yaml
 import joblib
+import tempfile
 
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
@@ -195,6 +197,138 @@ def load_bin(path: Path) -> Any:
     return data
 
 
+# --------------------------------------------------
+# atomic_write
+# --------------------------------------------------
+# PURPOSE:
+# - Writes a file so readers never see a half-written version
+# - Data goes to a temp file in the same directory, which is then
+#   renamed over the target (os.replace is atomic on POSIX and Windows)
+# - mkstemp creates the temp file owner-only (0600); it gets the existing
+#   target's mode, or the umask default of a plain open(), before the
+#   rename so other users (e.g. the serving process) can still read it
+# --------------------------------------------------
+# Read once at import: os.umask() can only be queried by setting it, which
+# would race with files being created on other threads
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextmanager
+def atomic_write(path: Path, mode: str = "w"):
+    """
+    Context manager yielding a file handle whose content replaces `path`
+    atomically on successful exit. On error the target is left untouched.
+
+    Args:
+        path (Path): Final file path
+        mode (str): "w" for text, "wb" for binary
+    """
+    path = Path(path)
+    os.makedirs(path.parent, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            file_mode = os.stat(path).st_mode & 0o7777
+        except FileNotFoundError:
+            file_mode = 0o666 & ~_UMASK
+        os.chmod(tmp_path, file_mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# --------------------------------------------------
+# process_pool_context
+# --------------------------------------------------
+# PURPOSE:
+# - Start method for the training-side process pools (tuning, model zoo,
+#   cross-validation). Stages run on the DAG runner's threads, and fork()ing
+#   a multi-threaded process can deadlock on locks held by other threads;
+#   forkserver (or spawn) children start from a clean single-threaded parent
+# --------------------------------------------------
+def process_pool_context():
+    import multiprocessing
+
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+# --------------------------------------------------
+# FileLock
+# --------------------------------------------------
+# PURPOSE:
+# - Cross-process mutual exclusion (e.g. one training run at a time across
+#   gunicorn workers and `python main.py`)
+# - Advisory OS lock on a lock file: released by the OS when the holder
+#   exits or crashes, so a stale lock file never blocks anyone
+# --------------------------------------------------
+class FileLockHeld(RuntimeError):
+    """Raised when another process (or handle) holds the lock."""
+
+
+class FileLock:
+    """
+    Non-blocking exclusive lock on `path`. Usable as a context manager, or
+    acquired and released explicitly (possibly from different threads).
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._fd = None
+
+    def acquire(self) -> "FileLock":
+        """
+        Raises:
+            FileLockHeld: If the lock is already held
+        """
+        os.makedirs(self.path.parent, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            if os.name == "nt":
+                import msvcrt
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            raise FileLockHeld(f"{self.path} is held by another process")
+
+        # Holder's pid, for diagnostics only
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        return self
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        try:
+            if os.name == "nt":
+                import msvcrt
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def __enter__(self) -> "FileLock":
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+
 # --------------------------------------------------
 # get_size
 # --------------------------------------------------
@@ -0,0 +1,110 @@
+# 📌 PURPOSE OF THIS FILE (utils/stage_metrics.py)
+
+# Resource metrics of training stage runs. The training pipeline wraps
+# each stage it runs in a StageMetricsRecorder, which writes
+# <stage root_dir>/stage_metrics.json:
+
+# - wall_seconds          perf_counter time of the stage
+# - cpu_seconds           CPU time of the thread running the stage
+# - children_cpu_seconds  CPU time of worker processes that finished during
+#                         the stage (tuning / model zoo / CV pools)
+# - peak_rss_mb           process peak RSS when the stage ended, and its
+#                         growth during the stage
+# - rows                  rows processed, as reported by the components
+#                         through add_rows()
+
+# Stages run concurrently on the DAG runner's threads, so the process-wide
+# figures (peak RSS, children CPU) are shared by overlapping stages.
+
+# add_rows() is a no-op outside a recorded stage, so components call it
+# unconditionally.
+
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+from Red_Wine_Prediction.utils.common import atomic_write
+
+try:
+    import resource
+except ImportError:   # Windows
+    resource = None
+
+
+_local = threading.local()
+
+
+def add_rows(n: int) -> None:
+    """Adds `n` processed rows to the stage running on this thread."""
+    recorder = getattr(_local, "recorder", None)
+    if recorder is not None:
+        recorder.rows = (recorder.rows or 0) + int(n)
+
+
+def _rusage_mb(who) -> float:
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def _children_cpu() -> float:
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+class StageMetricsRecorder:
+    """
+    Context manager measuring one stage run on the current thread and
+    saving stage_metrics.json on exit (also for failed runs).
+    """
+
+    def __init__(self, stage_key: str, path: Path):
+        self.stage_key = stage_key
+        self.path = Path(path)
+        self.rows = None
+
+    def __enter__(self) -> "StageMetricsRecorder":
+        self._previous = getattr(_local, "recorder", None)
+        _local.recorder = self
+        self._started_at = time.time()
+        self._wall = time.perf_counter()
+        self._cpu = time.thread_time()
+        self._children_cpu = _children_cpu()
+        self._rss = _rusage_mb(resource.RUSAGE_SELF) if resource else None
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        _local.recorder = self._previous
+        peak_rss = _rusage_mb(resource.RUSAGE_SELF) if resource else None
+        children_cpu = _children_cpu()
+        metrics = {
+            "stage": self.stage_key,
+            "status": "failed" if exc_type else "completed",
+            "started_at": self._started_at,
+            "wall_seconds": round(time.perf_counter() - self._wall, 6),
+            "cpu_seconds": round(time.thread_time() - self._cpu, 6),
+            "children_cpu_seconds": (
+                round(children_cpu - self._children_cpu, 6) if children_cpu is not None else None
+            ),
+            "peak_rss_mb": round(peak_rss, 3) if peak_rss is not None else None,
+            "peak_rss_growth_mb": round(peak_rss - self._rss, 3) if peak_rss is not None else None,
+            "children_peak_rss_mb": (
+                round(_rusage_mb(resource.RUSAGE_CHILDREN), 3) if resource else None
+            ),
+            "rows": self.rows,
+            "pid": os.getpid(),
+        }
+        try:
+            with atomic_write(self.path) as f:
+                json.dump(metrics, f, indent=4)
+        except OSError:
+            pass   # metrics must never fail a stage
+        self.metrics = metrics
+        return False
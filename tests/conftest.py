@@ -0,0 +1,18 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# The package lives under src/ (setup.py package_dir); make it importable
+# without an editable install
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+
+@pytest.fixture
+def raw_wines():
+    """Synthetic (N, 11) raw inputs in the ranges of the red wine dataset."""
+    rng = np.random.default_rng(0)
+    low = np.array([4.6, 0.12, 0.0, 0.9, 0.012, 1.0, 6.0, 0.990, 2.7, 0.33, 8.4])
+    high = np.array([15.9, 1.58, 1.0, 15.5, 0.611, 72.0, 289.0, 1.004, 4.0, 2.0, 14.9])
+    return low + (high - low) * rng.random((500, 11))
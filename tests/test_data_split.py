@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from Red_Wine_Prediction.components.data_split import hash_test_mask, hash_unit_interval, row_keys
+from Red_Wine_Prediction.components.feature_engineering import RAW_FEATURE_COLUMNS
+
+
+@pytest.fixture
+def wines(raw_wines):
+    frame = pd.DataFrame(np.round(raw_wines, 4), columns=RAW_FEATURE_COLUMNS)
+    frame["quality"] = np.arange(len(frame)) % 6 + 3
+    return frame
+
+
+def _mask(frame, key="content", start=0, test_size=0.25, seed=42):
+    return hash_test_mask(row_keys(frame, key, start), test_size, seed)
+
+
+@pytest.mark.parametrize("key", ["content", "row_number", ["fixed acidity", "pH"]])
+def test_same_row_always_lands_on_the_same_side(wines, key):
+    np.testing.assert_array_equal(_mask(wines, key), _mask(wines.copy(), key))
+
+
+@pytest.mark.parametrize("key", ["content", "row_number"])
+def test_chunked_assignment_equals_whole_file(wines, key):
+    chunks = [
+        _mask(wines.iloc[start:start + 37].reset_index(drop=True), key, start=start)
+        for start in range(0, len(wines), 37)
+    ]
+    np.testing.assert_array_equal(np.concatenate(chunks), _mask(wines, key))
+
+
+def test_appending_rows_keeps_existing_assignment(wines):
+    before = _mask(wines.iloc[:300])
+    after = _mask(wines)
+    np.testing.assert_array_equal(after[:300], before)
+
+
+def test_content_key_survives_reordering_and_keeps_duplicates_together(wines):
+    shuffled = wines.sample(frac=1.0, random_state=0)
+    np.testing.assert_array_equal(_mask(shuffled), _mask(wines)[shuffled.index.to_numpy()])
+
+    duplicated = pd.concat([wines, wines.iloc[:50]], ignore_index=True)
+    mask = _mask(duplicated)
+    np.testing.assert_array_equal(mask[-50:], mask[:50])
+
+
+def test_int_and_float_parsed_columns_hash_alike(wines):
+    as_float = wines.astype({"quality": np.float64})
+    np.testing.assert_array_equal(row_keys(as_float), row_keys(wines))
+
+
+def test_test_fraction_and_seed(wines):
+    keys = np.arange(200_000, dtype=np.uint64)
+    assert hash_test_mask(keys, 0.25, seed=1).mean() == pytest.approx(0.25, abs=0.005)
+
+    values = hash_unit_interval(keys, seed=1)
+    assert values.min() >= 0.0 and values.max() < 1.0
+    # Another seed is another assignment, not a shifted copy
+    assert np.mean(hash_test_mask(keys, 0.25, seed=1) == hash_test_mask(keys, 0.25, seed=2)) < 0.7
+
+
+def test_unknown_key_is_rejected(wines):
+    with pytest.raises(ValueError):
+        row_keys(wines, "row_hash")
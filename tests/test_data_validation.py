@@ -0,0 +1,94 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Red_Wine_Prediction.components.data_validation import DataValidation
+from Red_Wine_Prediction.components.feature_engineering import RAW_FEATURE_COLUMNS
+from Red_Wine_Prediction.entity.config_entity import DataValidationConfig
+from Red_Wine_Prediction.utils.common import read_yaml
+
+
+SCHEMA_PATH = Path(__file__).resolve().parents[1] / "schema.yaml"
+
+
+def _write_csv(path, raw_wines, mutate=None):
+    frame = pd.DataFrame(raw_wines, columns=RAW_FEATURE_COLUMNS)
+    frame["quality"] = np.arange(len(frame)) % 6 + 3
+    frame = frame.astype(object)
+    if mutate is not None:
+        mutate(frame)
+    frame.to_csv(path, index=False)
+    return path
+
+
+def _validate(tmp_path, data_path, chunk_size):
+    schema = read_yaml(SCHEMA_PATH)
+    out_dir = tmp_path / f"validation_{chunk_size}"
+    config = DataValidationConfig(
+        root_dir=out_dir,
+        STATUS_FILE=str(out_dir / "status.txt"),
+        unzip_data_dir=data_path,
+        all_schema=schema.COLUMNS,
+        column_ranges=schema.RANGES,
+        REPORT_FILE=out_dir / "report.json",
+        chunk_size=chunk_size,
+    )
+    status = DataValidation(config).validate_all_columns()
+    with open(config.REPORT_FILE) as f:
+        report = json.load(f)
+    report.pop("seconds")
+    return status, report
+
+
+def _corrupt(frame):
+    frame.loc[3, "alcohol"] = None            # null
+    frame.loc[10, "density"] = 1.5            # out of range
+    frame.loc[11, "pH"] = "acidic"            # not a number
+    frame.loc[20, "quality"] = 5.5            # not an integer
+
+
+@pytest.mark.parametrize("mutate", [None, _corrupt], ids=["valid", "corrupt"])
+def test_report_is_independent_of_chunk_size(tmp_path, raw_wines, mutate):
+    data_path = _write_csv(tmp_path / "wine.csv", raw_wines, mutate)
+
+    results = [_validate(tmp_path, data_path, chunk_size) for chunk_size in (1, 7, 64, 100_000)]
+
+    for result in results[1:]:
+        assert result == results[0]
+
+
+def test_valid_file_passes(tmp_path, raw_wines):
+    status, report = _validate(tmp_path, _write_csv(tmp_path / "wine.csv", raw_wines), chunk_size=50)
+
+    assert status is True
+    assert report["rows"] == len(raw_wines)
+    assert report["columns"]["alcohol"]["min"] == pytest.approx(raw_wines[:, 10].min())
+    assert report["columns"]["alcohol"]["max"] == pytest.approx(raw_wines[:, 10].max())
+
+
+def test_corrupt_values_are_counted(tmp_path, raw_wines):
+    data_path = _write_csv(tmp_path / "wine.csv", raw_wines, _corrupt)
+
+    status, report = _validate(tmp_path, data_path, chunk_size=8)
+    columns = report["columns"]
+
+    assert status is False
+    assert columns["alcohol"]["null_count"] == 1
+    assert columns["density"]["out_of_range"] == 1
+    assert columns["pH"]["type_errors"] == 1
+    assert columns["quality"]["type_errors"] == 1
+    assert [c for c, stats in columns.items() if not stats["ok"]] == ["density", "pH", "alcohol", "quality"]
+
+
+def test_missing_and_unexpected_columns_fail(tmp_path, raw_wines):
+    def rename(frame):
+        frame.rename(columns={"pH": "ph"}, inplace=True)
+
+    status, report = _validate(tmp_path, _write_csv(tmp_path / "wine.csv", raw_wines, rename), chunk_size=50)
+
+    assert status is False
+    assert report["missing_columns"] == ["pH"]
+    assert report["unexpected_columns"] == ["ph"]
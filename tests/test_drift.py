@@ -0,0 +1,127 @@
+import time
+
+import numpy as np
+import pytest
+
+from Red_Wine_Prediction.components.drift import (
+    FeatureSketch,
+    ReferenceStatsBuilder,
+    bin_counts,
+    ks_statistic,
+    load_reference,
+    psi,
+)
+from Red_Wine_Prediction.components.feature_engineering import FeatureSpec
+from Red_Wine_Prediction.entity.config_entity import DriftMonitoringConfig
+from Red_Wine_Prediction.pipeline.drift_monitor import DriftMonitor
+
+
+ALCOHOL, CHLORIDES = 10, 4
+
+
+@pytest.fixture
+def spec():
+    return FeatureSpec()
+
+
+@pytest.fixture
+def reference(raw_wines, spec):
+    builder = ReferenceStatsBuilder(spec.feature_columns, bins=10, sample_size=200)
+    features = spec.transform(raw_wines)
+    for start in range(0, len(features), 64):
+        builder.update(features[start:start + 64])
+    return builder.build(spec)
+
+
+def test_bin_counts():
+    edges = np.array([[1.0, 2.0], [0.0, 10.0]])
+    values = np.array([[0.5, -1.0], [1.0, 5.0], [1.5, 5.0], [3.0, 11.0]])
+    np.testing.assert_array_equal(bin_counts(values, edges), [[1, 2, 1], [1, 2, 1]])
+
+
+def test_psi_and_ks_known_values():
+    reference = np.array([[0.25, 0.25, 0.25, 0.25]])
+    np.testing.assert_allclose(psi(reference, reference), [0.0])
+    np.testing.assert_allclose(ks_statistic(reference, reference), [0.0])
+
+    shifted = np.array([[0.1, 0.2, 0.3, 0.4]])
+    expected_psi = sum((c - 0.25) * np.log(c / 0.25) for c in shifted[0])
+    np.testing.assert_allclose(psi(reference, shifted), [expected_psi])
+    # CDFs 0.25/0.5/0.75/1 vs 0.1/0.3/0.6/1
+    np.testing.assert_allclose(ks_statistic(reference, shifted), [0.2])
+
+
+def test_reference_moments_match_numpy(reference, raw_wines, spec):
+    features = spec.transform(raw_wines)
+    stats = reference["features"]["alcohol"]
+    assert reference["rows"] == len(features)
+    assert stats["mean"] == pytest.approx(features[:, ALCOHOL].mean())
+    assert stats["variance"] == pytest.approx(features[:, ALCOHOL].var())
+    assert stats["min"] == features[:, ALCOHOL].min()
+    assert sum(stats["proportions"]) == pytest.approx(1.0)
+    # Quantile edges: bins hold similar shares of the sampled rows
+    assert max(stats["proportions"]) < 0.2
+
+
+def test_same_distribution_is_not_flagged(reference, raw_wines):
+    sketch = FeatureSketch(reference)
+    for start in range(0, len(raw_wines), 50):
+        sketch.update(raw_wines[start:start + 50])
+
+    scores = sketch.scores(psi_alert=0.2)
+
+    assert scores["rows"] == len(raw_wines)
+    assert scores["drifted_features"] == []
+    assert scores["features"]["alcohol"]["mean"] == pytest.approx(reference["features"]["alcohol"]["mean"])
+
+
+def test_shifted_features_are_flagged(reference, raw_wines):
+    shifted = raw_wines.copy()
+    shifted[:, ALCOHOL] += 2.0
+    shifted[:, CHLORIDES] *= 1.8
+
+    sketch = FeatureSketch(reference)
+    sketch.update(shifted)
+    scores = sketch.scores(psi_alert=0.2)
+
+    for feature in ("alcohol", "chlorides", "log_chlorides"):
+        assert feature in scores["drifted_features"]
+        assert scores["features"][feature]["ks"] > 0.2
+    assert "pH" not in scores["drifted_features"]
+    assert scores["max_psi"] > 0.2
+
+
+def test_non_finite_rows_are_skipped(reference, raw_wines):
+    X = raw_wines[:10].copy()
+    X[0, ALCOHOL] = np.nan
+    sketch = FeatureSketch(reference)
+    sketch.update(X)
+    assert sketch.count == 9
+
+
+def test_monitor_scores_observed_batches(reference, raw_wines, spec, tmp_path):
+    path = tmp_path / "reference_stats.json"
+    builder = ReferenceStatsBuilder(spec.feature_columns, bins=10)
+    builder.update(spec.transform(raw_wines))
+    builder.save(path, spec)
+    assert load_reference(path)["rows"] == len(raw_wines)
+
+    monitor = DriftMonitor(DriftMonitoringConfig(
+        enabled=True,
+        reference_stats_path=path,
+        queue_size=64,
+        max_merge_batches=8,
+        psi_alert=0.2,
+        reference_check_seconds=0.0,
+    ))
+    for start in range(0, len(raw_wines), 25):
+        monitor.observe(raw_wines[start:start + 25])
+
+    deadline = time.monotonic() + 5.0
+    while monitor.scores()["rows"] < len(raw_wines) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    scores = monitor.scores()
+    assert scores["rows"] == len(raw_wines)
+    assert scores["dropped_batches"] == 0
+    assert scores["drifted_features"] == []
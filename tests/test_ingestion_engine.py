@@ -0,0 +1,31 @@
+import os
+import zipfile
+
+from Red_Wine_Prediction.components.ingestion_engine import fetch, zip_intact
+
+
+def _archive(path):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("winequality-red.csv", os.urandom(20_000))
+    return path
+
+
+def test_truncated_zip_is_fetched_again(tmp_path):
+    source = _archive(tmp_path / "source.zip")
+    destination = tmp_path / "out" / "data.zip"
+    destination.parent.mkdir()
+    destination.write_bytes(source.read_bytes()[:5_000])
+    assert not zip_intact(destination)
+
+    record = fetch(str(source), destination)
+
+    assert not record["cached"]
+    assert destination.read_bytes() == source.read_bytes()
+
+
+def test_intact_zip_is_reused(tmp_path):
+    source = _archive(tmp_path / "source.zip")
+    destination = tmp_path / "data.zip"
+    destination.write_bytes(source.read_bytes())
+
+    assert fetch(str(source), destination)["cached"]
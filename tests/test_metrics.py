@@ -0,0 +1,54 @@
+from Red_Wine_Prediction.utils.metrics import MetricsRegistry
+
+
+def _lines(registry):
+    return registry.render().splitlines()
+
+
+def test_counter_uses_total_name_on_every_line():
+    registry = MetricsRegistry()
+    requests = registry.counter("app_requests", "Requests served", ("status",))
+    requests.labels(status=200).inc()
+    requests.labels(status=200).inc(2)
+
+    assert _lines(registry) == [
+        "# HELP app_requests_total Requests served",
+        "# TYPE app_requests_total counter",
+        'app_requests_total{status="200"} 3',
+    ]
+
+
+def test_gauge_and_histogram_names():
+    registry = MetricsRegistry()
+    registry.gauge("app_loads", "Models loaded").set(2)
+    latency = registry.histogram("app_latency_seconds", "Latency", buckets=(0.1, 1.0))
+    latency.observe(0.05)
+    latency.observe(0.5)
+
+    assert _lines(registry) == [
+        "# HELP app_loads Models loaded",
+        "# TYPE app_loads gauge",
+        "app_loads 2",
+        "# HELP app_latency_seconds Latency",
+        "# TYPE app_latency_seconds histogram",
+        'app_latency_seconds_bucket{le="0.1"} 1',
+        'app_latency_seconds_bucket{le="1"} 2',
+        'app_latency_seconds_bucket{le="+Inf"} 2',
+        "app_latency_seconds_sum 0.55",
+        "app_latency_seconds_count 2",
+    ]
+
+
+def test_every_sample_belongs_to_its_type_line():
+    registry = MetricsRegistry()
+    registry.counter("a_events", "Events").inc()
+    registry.gauge("a_level", "Level").set(1.5)
+    registry.histogram("a_size", "Size", buckets=(1,)).observe(1)
+
+    typed = None
+    for line in _lines(registry):
+        if line.startswith("# TYPE "):
+            typed = line.split()[2]
+        elif not line.startswith("#"):
+            name = line.split("{")[0].split()[0]
+            assert name == typed or name in {typed + s for s in ("_bucket", "_sum", "_count")}
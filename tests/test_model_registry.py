@@ -0,0 +1,108 @@
+import itertools
+import os
+import time
+
+import numpy as np
+import pytest
+from sklearn.linear_model import ElasticNet
+from sklearn.preprocessing import StandardScaler
+
+from Red_Wine_Prediction.components.feature_engineering import FeatureSpec
+from Red_Wine_Prediction.components.inference_pipeline import InferencePipeline
+from Red_Wine_Prediction.components.model_store import ModelStore
+from Red_Wine_Prediction.components.model_trainer import publish_model_version
+from Red_Wine_Prediction.entity.config_entity import PredictionConfig
+from Red_Wine_Prediction.pipeline.model_registry import ModelRegistry
+
+
+# File timestamps are coarse (a few ms): every pointer write gets a distinct
+# mtime so os.stat-based change detection sees it
+_mtimes = itertools.count(time.time_ns(), 10**9)
+
+
+def _touch_pointer(store):
+    mtime = next(_mtimes)
+    os.utime(store.pointer_path, ns=(mtime, mtime))
+
+
+def _publish(store, raw_wines, alpha):
+    features = FeatureSpec().transform(raw_wines)
+    y = 5.0 + features[:, 10] / 10.0 - features[:, 1]
+    scaler = StandardScaler().fit(features)
+    model = ElasticNet(alpha=alpha, l1_ratio=0.5).fit(scaler.transform(features), y)
+    version = publish_model_version(
+        store,
+        model,
+        InferencePipeline.from_fitted(scaler=scaler, model=model),
+        model_name="model.joblib",
+        inference_pipeline_name="inference_pipeline.joblib",
+        compiled_model_name="linear_model.json",
+    )
+    _touch_pointer(store)
+    return version
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ModelStore(tmp_path / "model_trainer", keep_versions=5)
+
+
+@pytest.fixture
+def registry(store, tmp_path):
+    return ModelRegistry(
+        PredictionConfig(
+            model_pointer_path=store.pointer_path,
+            compiled_model_name="linear_model.json",
+            inference_pipeline_name="inference_pipeline.joblib",
+            model_path=tmp_path / "missing_model.joblib",
+            scaler_path=tmp_path / "missing_scaler.joblib",
+        )
+    )
+
+
+def test_loads_once_and_counts_hits(store, registry, raw_wines):
+    version = _publish(store, raw_wines, alpha=0.01)
+
+    first = registry.get()
+    second = registry.get()
+
+    assert first is second
+    assert first.version == version
+    assert (registry.misses, registry.hits, registry.reloads) == (1, 1, 0)
+
+
+def test_reloads_after_pointer_moves(store, registry, raw_wines):
+    _publish(store, raw_wines, alpha=0.01)
+    old = registry.get()
+
+    new_version = _publish(store, raw_wines, alpha=0.5)
+    new = registry.get()
+
+    assert new is not old
+    assert new.version == new_version
+    assert (registry.misses, registry.reloads) == (2, 1)
+    # The swapped-in model is the newly published one
+    assert not np.allclose(old.predictor.predict(raw_wines), new.predictor.predict(raw_wines))
+    # A request still holding the old snapshot keeps a working model
+    assert old.predictor.predict(raw_wines).shape == (raw_wines.shape[0],)
+
+
+def test_republishing_same_version_does_not_reload(store, registry, raw_wines):
+    version = _publish(store, raw_wines, alpha=0.01)
+    loaded = registry.get()
+
+    store.publish(version)
+    _touch_pointer(store)
+
+    assert registry.get() is loaded
+    assert (registry.misses, registry.reloads) == (1, 0)
+
+
+def test_predictions_match_inference_pipeline(store, registry, raw_wines):
+    _publish(store, raw_wines, alpha=0.01)
+    loaded = registry.get()
+
+    import joblib
+    pipeline = joblib.load(store.versions_dir / loaded.version / "inference_pipeline.joblib")
+
+    np.testing.assert_allclose(loaded.predictor.predict(raw_wines), pipeline.predict(raw_wines), rtol=1e-10)
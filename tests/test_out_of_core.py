@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from sklearn.linear_model import ElasticNet
+from sklearn.preprocessing import StandardScaler
+
+from Red_Wine_Prediction.components.feature_engineering import FeatureSpec
+from Red_Wine_Prediction.components.out_of_core import chunk_slices, fit_elasticnet_out_of_core, gram_statistics
+
+
+@pytest.fixture
+def training_split(raw_wines, tmp_path):
+    """Standardized engineered features and a noisy linear target, memory-mapped like the feature store."""
+    X = StandardScaler().fit_transform(FeatureSpec().transform(raw_wines))
+    rng = np.random.default_rng(1)
+    y = 5.6 + X[:, :6] @ np.array([0.3, -0.2, 0.1, 0.0, -0.05, 0.25]) + rng.normal(0, 0.3, X.shape[0])
+    np.save(tmp_path / "X.npy", X)
+    np.save(tmp_path / "y.npy", y)
+    return np.load(tmp_path / "X.npy", mmap_mode="r"), np.load(tmp_path / "y.npy", mmap_mode="r")
+
+
+def test_chunk_slices_cover_every_row_once():
+    covered = np.concatenate([np.arange(10)[rows] for rows in chunk_slices(10, 3)])
+    np.testing.assert_array_equal(covered, np.arange(10))
+
+
+def test_gram_statistics_match_direct_computation(training_split):
+    X, y = np.asarray(training_split[0]), np.asarray(training_split[1])
+    Xc, yc = X - X.mean(axis=0), y - y.mean()
+
+    stats = gram_statistics(*training_split, chunk_size=37)
+
+    assert stats["n"] == X.shape[0]
+    np.testing.assert_allclose(stats["gram"], Xc.T @ Xc, atol=1e-8)
+    np.testing.assert_allclose(stats["xy"], Xc.T @ yc, atol=1e-8)
+
+
+@pytest.mark.parametrize("alpha, l1_ratio", [(0.1, 0.6), (0.01, 0.5), (0.5, 1.0), (0.05, 0.0)])
+@pytest.mark.parametrize("chunk_size", [1, 64, 10_000])
+def test_matches_in_memory_elasticnet(training_split, alpha, l1_ratio, chunk_size):
+    X, y = training_split
+    params = {"max_iter": 100_000, "tol": 1e-10}
+
+    expected = ElasticNet(alpha=alpha, l1_ratio=l1_ratio, random_state=42, **params).fit(X, y)
+    model = fit_elasticnet_out_of_core(X, y, alpha, l1_ratio, chunk_size=chunk_size, **params)
+
+    np.testing.assert_allclose(model.coef_, expected.coef_, atol=1e-5)
+    assert model.intercept_ == pytest.approx(expected.intercept_, abs=1e-5)
+    np.testing.assert_allclose(model.predict(X), expected.predict(X), atol=1e-5)
+
+
+def test_empty_split_is_rejected():
+    with pytest.raises(ValueError):
+        gram_statistics(np.empty((0, 3)), np.empty(0), chunk_size=10)